@@ -2,10 +2,27 @@
 Aviator Bot - Enhanced with Hot Run Mode & Real Multiplier Cashout
 """
 
+import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 import re
 
+import mss
+import numpy as np
+import pyautogui
+
+try:
+    import pyperclip
+    PYPERCLIP_AVAILABLE = True
+except ImportError:
+    PYPERCLIP_AVAILABLE = False
+
 # Import configuration
 from config import ConfigManager
 
@@ -25,16 +42,185 @@ from utils.betting_helpers import (
     reset_stake
 )
 
-# Import multiplier reader
-from readregion import MultiplierReader
+from utils.bot_stats import BotStats
+from utils.clipboard_utils import clipboard_sequence_number, wait_for_clipboard_change
 
 # Import multiplier reader
 from readregion import MultiplierReader
 
+# Import pattern prediction, notifications and seasonal analysis
+from pattern_predictor import PatternPredictor
+from mobile_notifier import MobileNotifier, RateLimitedNotifier
+from seasonal_analyzer import SeasonalAnalyzer
+
+# Round result -> (icon, label) shown by _log_round_result
+_RESULT_STYLES = {
+    "WIN": ("[OK]", "SUCCESS"),
+    "CRASH": ("[CRASH]", "CRASHED"),
+    "CANCEL": ("[CANCEL]", "CANCELLED"),
+    "NOSTART": ("[WARNING]", "NO START"),
+    "SKIP": ("[SKIP]", "SKIPPED"),
+}
+
+class _NullPredictor:
+    """Stand-in for PatternPredictor before history tracking is set up."""
+
+    def __init__(self):
+        self.validation_results = []
+
+    def predict_high_sequence(self):
+        return {'prediction': False, 'confidence': 0}
+
+    def validate_predictions(self, current_multiplier):
+        pass
+
+@dataclass(frozen=True)
+class RoundPolicy:
+    """How a run mode handles the round steps shared by all modes."""
+    use_multiplier_reader: bool  # Detect AWAITING via multiplier reader instead of clipboard/OCR
+    places_bets: bool            # Real bets are placed, so check for orphaned bets
+    log_previous_round: bool     # Save the clipboard-read previous round to history
+
+_HOT_RUN_POLICY = RoundPolicy(use_multiplier_reader=True, places_bets=True, log_previous_round=False)
+_ML_POLICY = RoundPolicy(use_multiplier_reader=False, places_bets=True, log_previous_round=False)
+_DRY_RUN_POLICY = RoundPolicy(use_multiplier_reader=False, places_bets=False, log_previous_round=False)
+_OBSERVATION_POLICY = RoundPolicy(use_multiplier_reader=False, places_bets=False, log_previous_round=True)
+
+# Per-round hot run bet summary: stake, target, prediction, confidence
+_HOT_BET_TEMPLATE = (
+    "\n  [FIRE] HOT RUN: PLACING BET (no filtering)\n"
+    "  [MONEY] Stake: {}\n"
+    "  [TARGET] Target Multiplier: {:.2f}x\n"
+    "  [STATS] ML Prediction: {:.2f}x (Confidence: {:.1f}%)\n"
+)
+
+_MODEL_DISPLAY_NAMES = {
+    'RandomForest': 'Random Forest',
+    'GradientBoosting': 'Gradient Boosting',
+    'LightGBM': 'LightGBM',
+    'LSTM': 'LSTM Neural Net'
+}
+
+@lru_cache(maxsize=512)
+def _format_regression_table(model_rows, ensemble_pred, ensemble_conf):
+    """
+    Format the regression ensemble table shown by _show_detailed_model_analysis.
+
+    Args:
+        model_rows: Tuple of (model_id, prediction, confidence) tuples
+        ensemble_pred: Ensemble prediction
+        ensemble_conf: Ensemble confidence
+
+    Returns:
+        str: Formatted table block
+    """
+    lines = [
+        "\n  [LAB] REGRESSION ENSEMBLE: Individual Model Predictions",
+        "\n  +--------------------------+----------+------------+",
+        "  | MODEL                    |   PRED   | CONFIDENCE |",
+        "  +--------------------------+----------+------------+"
+    ]
+
+    for model_id, pred_val, conf in model_rows:
+        display_name = _MODEL_DISPLAY_NAMES.get(model_id, model_id)
+        lines.append(f"  | {display_name:<24} | {pred_val:6.2f}x |  {conf:6.1f}%   |")
+
+    lines += [
+        "  +--------------------------+----------+------------+",
+        f"  | ENSEMBLE                 | {ensemble_pred:6.2f}x |  {ensemble_conf:6.1f}%   |",
+        "  +--------------------------+----------+------------+"
+    ]
+    return "\n".join(lines)
+
+# (epoch second, ISO string) of the last formatted second
+_ts_cache = (0, "")
+
+def _iso_timestamp():
+    """
+    Return the current time as an ISO string with milliseconds.
+
+    The date/time part is formatted at most once per second; only the
+    millisecond suffix is computed on every call.
+    """
+    global _ts_cache
+    now = time.time()
+    sec = int(now)
+    if _ts_cache[0] != sec:
+        _ts_cache = (sec, datetime.fromtimestamp(sec).isoformat())
+    return f"{_ts_cache[1]}.{int((now - sec) * 1000):03d}"
+
+def _poll_until(predicate, timeout, min_interval=0.02, max_interval=0.3):
+    """
+    Poll predicate until it returns True or timeout expires.
+
+    The interval starts at min_interval and grows by half each miss up to
+    max_interval, and never sleeps past the deadline.
+
+    Args:
+        predicate: Zero-argument callable
+        timeout: Maximum time to wait in seconds
+        min_interval: First sleep between checks
+        max_interval: Longest sleep between checks
+
+    Returns:
+        bool: True if the predicate succeeded before the deadline
+    """
+    deadline = time.perf_counter() + timeout
+    interval = min_interval
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(max_interval, interval * 1.5)
+
+def _to_cents(amount):
+    """Convert a currency amount to integer cents."""
+    return int(round(amount * 100))
+
+def _print_banner(title, lines=()):
+    """Write a run mode banner (title and info lines between rules) in one call."""
+    rule = "=" * 100
+    body = [f"\n{rule}", title, rule]
+    if lines:
+        body.extend(lines)
+        body.append(rule)
+    sys.stdout.write("\n".join(body) + "\n")
+    sys.stdout.flush()
+
 def flush_print(text):
     """Prints text immediately without buffering."""
     print(text, flush=True)
 
+def _start_stdout_coalescing(interval=0.1):
+    """
+    Stop flushing stdout on every newline and flush it on a timer instead.
+
+    A round prints a few dozen lines; on a Windows console each line flush
+    is a separate write. Output now reaches the console at most `interval`
+    seconds late, and flush_print() still flushes immediately before waits.
+
+    Returns:
+        bool: True if stdout supports reconfiguring and coalescing started
+    """
+    try:
+        sys.stdout.reconfigure(line_buffering=False)
+    except (AttributeError, ValueError):
+        return False
+
+    def flush_loop():
+        while True:
+            time.sleep(interval)
+            try:
+                sys.stdout.flush()
+            except Exception:
+                pass
+
+    threading.Thread(target=flush_loop, name="stdout-flush", daemon=True).start()
+    return True
+
 class AviatorBotML:
     """Main Aviator Bot with Hot Run mode and real multiplier cashout."""
 
@@ -50,40 +236,52 @@ class AviatorBotML:
         self.active_bet_round = None
         self.last_balance = None
         self.last_logged_mult = None
+        self._sct = None  # MSS context for small button-state grabs, created on first use
         self.fixed_cashout_multiplier = 2.0  # User-defined cashout target
 
         # Components (initialized after config load)
         self.detector = None
         self.history_tracker = None
         self.ml_generator = None
+        self.pattern_predictor = _NullPredictor()
+        self._last_sent_idx = 0  # validation_results already sent as notifications
         self.dashboard = None
         self.multiplier_reader = None  # NEW: Real-time multiplier reader
 
         # Balance coordinates
         self.balance_coords = (626, 149, 694, 152)
 
-        # Statistics
-        self.stats = {
-            "rounds_played": 0,
-            "rounds_observed": 0,
-            "ml_bets_placed": 0,
-            "successful_cashouts": 0,
-            "failed_cashouts": 0,
-            "ml_skipped": 0,
-            "cancelled_bets": 0,
-            "total_bet": 0,
-            "total_return": 0,
-            "current_streak": 0,
-            "max_stake_reached": 25
-        }
+        # Statistics (slot attributes; hot paths update them directly)
+        self.stats = BotStats(max_stake_reached=25)
 
         # Prediction history (track last N predictions)
-        from collections import deque
         self.prediction_history = deque(maxlen=5)
         
+        # Multiplier expected at cashout_delay; refreshed when a time-based mode starts
+        self._estimated_mult = estimate_multiplier(self.config_manager.cashout_delay)
+
         # Hot Run mode
         self.hot_run_mode = False
         self.target_cashout_multiplier = 2.0  # Default target for hot run
+
+        # Single worker for post-round prediction/notification work
+        self._bg_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="post-round")
+
+        # Next-round ML signal and seasonal context, computed while waiting for AWAITING
+        self._infer_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="infer")
+        self._pending_signal = None
+        self._pending_season = None
+        self._pending_rounds = 0  # History length the pending signal was computed from
+
+        # Dashboard updates are queued and flushed in batches every 100 ms; the
+        # queue is bounded so a stalled dashboard drops its oldest rounds
+        # instead of growing without limit
+        self._emit_queue = deque(maxlen=256)
+        self._stats_dirty = False
+        self._emit_thread = threading.Thread(
+            target=self._dashboard_emit_loop, name="dashboard-emit", daemon=True
+        )
+        self._emit_thread.start()
     
     def initialize_components(self):
         """Initialize all bot components after config is loaded."""
@@ -100,7 +298,6 @@ class AviatorBotML:
             
             # Validate region is within screen bounds
             try:
-                import mss
                 with mss.mss() as sct:
                     monitors = sct.monitors
                     primary = monitors[1]  # Primary monitor
@@ -137,7 +334,11 @@ class AviatorBotML:
                     print("[STOP] Exiting...")
                     exit(1)
             else:
+                # Warm up OCR now so the first cashout poll doesn't pay for it
+                self.multiplier_reader.fast_extract_multiplier_or_status(test_frame)
                 print("[OK] Multiplier reader working correctly")
+                # Grab frames in the background from here on
+                self.multiplier_reader.start_prefetch()
         
         if self.config_manager.history_region:
             self.history_tracker = RoundHistoryTracker(self.config_manager.history_region)
@@ -148,20 +349,32 @@ class AviatorBotML:
             self.ml_generator.bot_instance = self
             
             # Initialize pattern predictor and notifier
-            from pattern_predictor import PatternPredictor
-            from mobile_notifier import MobileNotifier
             self.pattern_predictor = PatternPredictor(self.history_tracker)
-            self.mobile_notifier = MobileNotifier()
+            self.mobile_notifier = RateLimitedNotifier(MobileNotifier())
             # Setup Discord webhook
             self.mobile_notifier.setup_discord("https://discord.com/api/webhooks/1439324526881144852/mcT-Za8lqaZuqooFjY-ppz3ixyRnYFt010iExTm-4E6aWajHWiuHEQ9tJSe1XZO39OEI")
             
             # Initialize seasonal analyzer
-            from seasonal_analyzer import SeasonalAnalyzer
             self.seasonal_analyzer = SeasonalAnalyzer(self.history_tracker)
         
         self.current_stake = self.config_manager.initial_stake
     
-    def _reset_bet_state(self):
+    def _update_stake(self, won: bool) -> None:
+        """
+        Apply the end-of-round stake rule: increase after a win, reset after a loss.
+
+        Args:
+            won: Whether the round was a win
+        """
+        cfg = self.config_manager
+        if won:
+            self.current_stake = increase_stake(
+                self.current_stake, cfg.stake_increase_percent, cfg.max_stake, self.stats
+            )
+        else:
+            self.current_stake = reset_stake(cfg.initial_stake, self.stats)
+
+    def _reset_bet_state(self) -> None:
         """Reset betting state completely."""
         self.is_betting = False
         self.bet_state = "IDLE"
@@ -169,17 +382,18 @@ class AviatorBotML:
     
     def _read_balance(self):
         """Read current balance from balance region."""
+        if not PYPERCLIP_AVAILABLE:
+            return None
+
         try:
-            import pyautogui
-            import pyperclip
-            
             x1, y1, x2, y2 = self.balance_coords
             
             pyautogui.click((x1 + x2) // 2, (y1 + y2) // 2, clicks=3)
             time.sleep(0.1)
             
+            before = clipboard_sequence_number()
             pyautogui.hotkey('ctrl', 'c')
-            time.sleep(0.1)
+            wait_for_clipboard_change(before, timeout=0.1)
             
             balance_text = pyperclip.paste().strip()
             
@@ -200,20 +414,57 @@ class AviatorBotML:
             return None
         except Exception as e:
             return None
+
+    def _read_balance_after_cashout(self, stake_used, retries=2, retry_delay=0.25):
+        """
+        Read the balance after a cashout, re-reading while the win is not yet credited.
+
+        The stake was taken when the bet was placed, so until the payout lands
+        the balance shows last_balance - stake_used (or last_balance, if the
+        deduction hasn't rendered yet). Each read clicks and copies in the game
+        UI, so only a couple of spaced retries are made.
+
+        Args:
+            stake_used: Stake placed this round
+            retries: Extra reads while the balance still looks unsettled
+            retry_delay: Seconds to wait before each extra read
+
+        Returns:
+            float or None: Latest balance read
+        """
+        new_balance = self._read_balance()
+        if self.last_balance is None:
+            return new_balance
+
+        unsettled = (self.last_balance, self.last_balance - stake_used)
+        for _ in range(retries):
+            if new_balance is None or all(abs(new_balance - b) > 0.005 for b in unsettled):
+                break
+            time.sleep(retry_delay)
+            new_balance = self._read_balance()
+        return new_balance
     
+    def _grab_bgra(self, left, top, width, height):
+        """
+        Grab a screen region with a persistent MSS context.
+
+        Returns:
+            np.ndarray: (height, width, 4) BGRA pixels
+        """
+        if self._sct is None:
+            self._sct = mss.mss()
+        return np.asarray(self._sct.grab(
+            {'left': left, 'top': top, 'width': width, 'height': height}
+        ))
+
     def _verify_bet_placed(self, timeout=3):
         """Verify if bet is already placed by checking button state."""
         try:
-            import pyautogui
-            from PIL import Image
-            import numpy as np
-            
             x, y = self.config_manager.bet_button_coords
-            screenshot = pyautogui.screenshot(region=(x-50, y-25, 100, 50))
-            img_array = np.array(screenshot)
+            img_array = self._grab_bgra(x-50, y-25, 100, 50)
             
-            red_channel = img_array[:, :, 0]
-            avg_red = np.mean(red_channel)
+            red_channel = img_array[:, :, 2]  # BGRA
+            avg_red = red_channel.mean()
             
             if avg_red > 150:
                 return True
@@ -222,7 +473,7 @@ class AviatorBotML:
         except Exception as e:
             return False
     
-    def _check_existing_bet(self):
+    def _check_existing_bet(self) -> bool:
         """Check if there's an existing bet from previous round."""
         if self._verify_bet_placed():
             return True
@@ -251,6 +502,238 @@ class AviatorBotML:
         
         return False
     
+    def _begin_round(self, round_number, policy, history_read_for_round, cumulative_profit):
+        """
+        Run the start of a round shared by all modes: header, AWAITING wait,
+        orphaned bet check and previous round read.
+
+        Args:
+            round_number: Current round number
+            policy: RoundPolicy of the calling mode
+            history_read_for_round: Whether the previous round was already read
+            cumulative_profit: Cumulative P/L before this round
+
+        Returns:
+            tuple: (ready, loss, history_read_for_round) - ready is False when
+                the caller should start over; loss is any orphaned bet loss
+        """
+        self._log_round_header(round_number)
+
+        if policy.use_multiplier_reader:
+            flush_print("  [WAIT] Waiting for AWAITING state...")
+            awaiting = self._wait_for_awaiting_state(timeout=60)
+        else:
+            flush_print("  [WAIT] Waiting for AWAITING state (via clipboard/OCR)...")
+            awaiting = self.detector.wait_for_clean_awaiting_state(timeout=60)
+
+        if not awaiting:
+            flush_print("  [WARNING]  Timeout - retrying...")
+            return False, 0, history_read_for_round
+
+        if policy.use_multiplier_reader:
+            flush_print("  [OK] AWAITING confirmed (via multiplier reader)")
+            self._wait_for_reader_event(0.3)
+        else:
+            flush_print("  [OK] AWAITING confirmed")
+            self.detector.wait_for_state_change(0.3)
+
+        if policy.places_bets and self._check_existing_bet():
+            flush_print("  [CANCEL] Orphaned bet detected!")
+            self.stats.cancelled_bets += 1
+            self.stats.failed_cashouts += 1
+
+            loss = -self.current_stake
+            self._log_round_result(round_number, "BET", self.current_stake, "CANCEL",
+                                  loss, 0, None, self.last_balance, cumulative_profit + loss)
+
+            self.current_stake = reset_stake(self.config_manager.initial_stake, self.stats)
+            self._reset_bet_state()
+            return False, loss, False
+
+        if not history_read_for_round:
+            if policy.use_multiplier_reader:
+                flush_print("  [LOG] Checking for previous round...")
+            else:
+                flush_print("  [LOG] Checking for previous round (via clipboard/OCR)...")
+
+            success, logged_mult = self.history_tracker.auto_log_from_clipboard(
+                self.detector,
+                force=False
+            )
+
+            if success and logged_mult and logged_mult != self.last_logged_mult:
+                self.last_logged_mult = logged_mult
+                if policy.log_previous_round:
+                    self.history_tracker.log_round(
+                        multiplier=logged_mult,
+                        bet_placed=False,
+                        stake=0,
+                        cashout_time=0,
+                        profit_loss=0
+                    )
+                    flush_print(f"  [OK] Round observed: {logged_mult:.2f}x (saved to history)")
+                    self.stats.rounds_observed += 1
+                else:
+                    flush_print(f"  [OK] Previous round: {logged_mult:.2f}x (added to history)")
+            else:
+                flush_print("  [INFO]  No new round data")
+
+        if policy.use_multiplier_reader:
+            self._wait_for_reader_event(0.2)
+        else:
+            self.detector.wait_for_state_change(0.2)
+
+        return True, 0, True
+
+    def _handle_no_start(self, round_number, stake_used, signal, cumulative_profit):
+        """
+        Record a placed bet whose round never started.
+
+        Args:
+            round_number: Current round number
+            stake_used: Stake of the cancelled bet
+            signal: ML signal used for the bet
+            cumulative_profit: Cumulative P/L before this round
+
+        Returns:
+            float: Loss to add to cumulative profit
+        """
+        print("  [WARNING]  Game didn't start - bet cancelled")
+        self.stats.cancelled_bets += 1
+        self.stats.failed_cashouts += 1
+
+        loss = -stake_used
+        self._log_round_result(round_number, "BET", stake_used, "NOSTART",
+                              loss, 0, signal, self.last_balance, cumulative_profit + loss)
+
+        self.history_tracker.log_round(
+            multiplier=0,
+            bet_placed=True,
+            stake=stake_used,
+            cashout_time=0,
+            profit_loss=loss,
+            prediction=signal['prediction'],
+            confidence=signal['confidence'],
+            pred_range=(0, 0)
+        )
+
+        self.current_stake = reset_stake(self.config_manager.initial_stake, self.stats)
+        self._reset_bet_state()
+        self.stats.rounds_observed += 1
+        return loss
+
+    def _record_observed_round(self, observed_mult, signal, cumulative_profit, balance):
+        """
+        Save a round the bot watched without betting and send it to the dashboard.
+
+        Args:
+            observed_mult: Final multiplier of the round
+            signal: ML signal generated for the round
+            cumulative_profit: Cumulative P/L so far
+            balance: Balance shown on the dashboard
+        """
+        self.history_tracker.log_round(
+            multiplier=observed_mult,
+            bet_placed=False,
+            stake=0,
+            cashout_time=0,
+            profit_loss=0,
+            prediction=signal['prediction'],
+            confidence=signal['confidence'],
+            pred_range=(0, 0)
+        )
+        self._emit_dashboard_update(self._create_round_data(observed_mult, False, 0, 0, 0, signal, cumulative_profit, balance))
+
+    def _prefetch_signal(self):
+        """Start computing the next round's signal and seasonal context in the background."""
+        self._pending_rounds = len(self.history_tracker.mults_view())
+        self._pending_signal = self._infer_pool.submit(self.ml_generator.generate_ensemble_signal)
+        self._pending_season = self._infer_pool.submit(self.seasonal_analyzer.get_seasonal_recommendation)
+
+    def _take_signal(self):
+        """
+        Return the prefetched signal and seasonal context, computing them now if
+        no prefetch is pending or rounds were logged since it was started (e.g.
+        _begin_round logging the previous multiplier after a failed crash read).
+
+        Returns:
+            tuple: (signal, seasonal_data)
+        """
+        pending_signal, pending_season = self._pending_signal, self._pending_season
+        self._pending_signal = self._pending_season = None
+
+        if pending_signal is not None and len(self.history_tracker.mults_view()) != self._pending_rounds:
+            pending_signal.cancel()
+            pending_season.cancel()
+            pending_signal = None
+
+        if pending_signal is None:
+            signal = self.ml_generator.generate_ensemble_signal()
+            seasonal_data = self.seasonal_analyzer.get_seasonal_recommendation()
+        else:
+            signal = pending_signal.result()
+            seasonal_data = pending_season.result()
+        return signal, seasonal_data
+
+    def _handle_failed_round(self, reason):
+        """
+        Count an aborted bet attempt as an observed, skipped round.
+
+        Args:
+            reason: Message explaining why the round was abandoned
+
+        Returns:
+            bool: False, the new value for history_read_for_round
+        """
+        print(reason)
+        stats = self.stats
+        stats.rounds_observed += 1
+        stats.ml_skipped += 1
+        self._reset_bet_state()
+        return False
+
+    def _run_post_round_tasks(self, final_mult, rounds_observed):
+        """Run pattern prediction, validation and notifications for a finished round."""
+        # Check for high multiplier sequence prediction
+        if rounds_observed % 5 == 0:  # Check every 5 rounds
+            prediction = self.pattern_predictor.predict_high_sequence()
+            if prediction['prediction'] and prediction['confidence'] >= 70:
+                current_time = time.time()
+                if current_time - self.pattern_predictor.last_notification > self.pattern_predictor.notification_cooldown:
+                    self.mobile_notifier.notify_high_sequence_prediction(prediction)
+                    # Start tracking this prediction for validation
+                    self.pattern_predictor.start_prediction_tracking(prediction)
+                    self.pattern_predictor.last_notification = current_time
+                    print(f"📱 HIGH SEQUENCE ALERT: {prediction['confidence']}% confidence")
+
+        # Validate active predictions with current multiplier
+        self.pattern_predictor.validate_predictions(final_mult)
+
+        # Send validation results completed since the last round
+        new_results = self.pattern_predictor.validation_results[self._last_sent_idx:]
+        for result in new_results:
+            self.mobile_notifier.send_validation_result(result)
+        self._last_sent_idx += len(new_results)
+
+    @staticmethod
+    def _log_post_round_error(future):
+        """Report exceptions raised by background post-round tasks."""
+        error = future.exception()
+        if error is not None:
+            print(f"[WARNING] Post-round task failed: {error}")
+
+    def _wait_for_reader_event(self, timeout):
+        """
+        Wait up to timeout seconds, waking early on a multiplier reader state change.
+
+        The event is only set by read_current_multiplier on this thread, so
+        the reader has to keep polling during the wait for it to fire.
+        """
+        if self.multiplier_reader:
+            self.multiplier_reader.wait_for_state_change(timeout)
+        else:
+            time.sleep(timeout)
+
     def _wait_for_game_start_strict(self, timeout=15):
         """Wait for game to start with strict verification using multiplier reader."""
         start_time = time.time()
@@ -272,7 +755,7 @@ class AviatorBotML:
                 time.sleep(0.2)
                 continue
             
-            time.sleep(0.1)
+            self._wait_for_reader_event(0.1)
         
         return False
     
@@ -290,10 +773,10 @@ class AviatorBotML:
                         # Need 2 consecutive confirmations to be sure
                         if consecutive_awaiting >= 2:
                             return True
-                        time.sleep(0.2)
+                        self._wait_for_reader_event(0.2)
                     elif crashed is False:
                         consecutive_awaiting = 0
-                        time.sleep(0.2)
+                        self._wait_for_reader_event(0.2)
                     else:
                         # Cannot determine, fallback to detector
                         if self.detector:
@@ -321,34 +804,30 @@ class AviatorBotML:
     
     def _wait_for_crash_and_read_multiplier(self, timeout=60):
         """Wait for round to crash and read the final multiplier."""
-        start_time = time.time()
+        # has_game_crashed() already covers AWAITING, so one OCR read per poll
+        if not _poll_until(self.detector.has_game_crashed, timeout):
+            return False, None
 
-        while time.time() - start_time < timeout:
-            if self.detector.has_game_crashed() or self.detector.is_awaiting_next_flight():
-                time.sleep(0.3)
+        time.sleep(0.3)
 
-                success, mult = self.history_tracker.auto_log_from_clipboard(
-                    self.detector,
-                    force=True
-                )
+        success, mult = self.history_tracker.auto_log_from_clipboard(
+            self.detector,
+            force=True
+        )
 
-                if success and mult:
-                    self.last_logged_mult = mult
-                    return True, mult
-                else:
-                    state = self.detector.read_text_in_region()
-                    if state and 'x' in str(state).lower():
-                        try:
-                            mult_str = state.replace('x', '').strip()
-                            mult = float(mult_str)
-                            self.last_logged_mult = mult
-                            return True, mult
-                        except:
-                            pass
-
-                    return False, None
+        if success and mult:
+            self.last_logged_mult = mult
+            return True, mult
 
-            time.sleep(0.3)
+        state = self.detector.read_text_in_region()
+        if state and 'x' in str(state).lower():
+            try:
+                mult_str = state.replace('x', '').strip()
+                mult = float(mult_str)
+                self.last_logged_mult = mult
+                return True, mult
+            except:
+                pass
 
         return False, None
     
@@ -371,15 +850,19 @@ class AviatorBotML:
         round_start = time.time()
         cashout_triggered = False
         last_displayed_mult = None
+
+        # Bind per-tick calls once; the loop runs every 30ms for the whole flight
+        read_current_multiplier = self.multiplier_reader.read_current_multiplier
+        has_crashed = self.multiplier_reader.has_crashed
+        sleep = time.sleep
         
         while True:
             try:
                 # Read current multiplier
-                current_mult = self.multiplier_reader.read_current_multiplier()
+                current_mult = read_current_multiplier()
                 
                 # Display progress
                 if current_mult and current_mult != last_displayed_mult:
-                    elapsed = time.time() - round_start
                     remaining = target_multiplier - current_mult
                     
                     if remaining > 0.5:
@@ -400,7 +883,7 @@ class AviatorBotML:
                     last_displayed_mult = current_mult
                 
                 # Check for crash
-                crashed = self.multiplier_reader.has_crashed()
+                crashed = has_crashed()
                 if crashed is True:
                     print("\n")
                     elapsed = time.time() - round_start
@@ -408,8 +891,8 @@ class AviatorBotML:
                     
                     print(f"  [CRASH] CRASHED at {final_mult:.2f}x (target: {target_multiplier:.2f}x)")
                     
-                    self.stats["failed_cashouts"] += 1
-                    self.stats["current_streak"] = 0
+                    self.stats.failed_cashouts += 1
+                    self.stats.current_streak = 0
                     
                     loss = -stake_used
                     
@@ -436,8 +919,8 @@ class AviatorBotML:
                     if crashed is True:
                         print(f"  [CRASH] Crashed during cashout attempt!")
                         
-                        self.stats["failed_cashouts"] += 1
-                        self.stats["current_streak"] = 0
+                        self.stats.failed_cashouts += 1
+                        self.stats.current_streak = 0
                         
                         loss = -stake_used
                         final_mult = self.multiplier_reader.last_valid_multiplier or 0
@@ -455,8 +938,7 @@ class AviatorBotML:
                         
                         # Wait for balance to update
                         print("  [WAIT] Validating balance change...")
-                        time.sleep(0.5)
-                        new_balance = self._read_balance()
+                        new_balance = self._read_balance_after_cashout(stake_used)
                         
                         # Validate win by checking balance
                         if self.last_balance is not None and new_balance is not None:
@@ -465,20 +947,20 @@ class AviatorBotML:
                             if balance_change > 0:
                                 print(f"  [OK] Balance validation: WIN confirmed (+{balance_change:.2f})")
                                 
-                                self.stats["successful_cashouts"] += 1
-                                self.stats["current_streak"] += 1
+                                self.stats.successful_cashouts += 1
+                                self.stats.current_streak += 1
                                 
                                 profit = balance_change
                                 returns = stake_used + profit
-                                self.stats["total_return"] += returns
+                                self.stats.total_return += returns
                                 self.last_balance = new_balance
                                 
                                 return True, profit, current_mult, "WIN"
                             else:
                                 print(f"  [X] Balance validation: LOST (balance change: {balance_change:.2f})")
                                 
-                                self.stats["failed_cashouts"] += 1
-                                self.stats["current_streak"] = 0
+                                self.stats.failed_cashouts += 1
+                                self.stats.current_streak = 0
                                 
                                 loss = -stake_used
                                 final_mult = self.multiplier_reader.last_valid_multiplier or current_mult
@@ -489,12 +971,12 @@ class AviatorBotML:
                             # Could not validate balance - assume win based on multiplier
                             print("  [WARNING]  Could not validate balance - using estimated profit")
                             
-                            self.stats["successful_cashouts"] += 1
-                            self.stats["current_streak"] += 1
+                            self.stats.successful_cashouts += 1
+                            self.stats.current_streak += 1
                             
                             returns = stake_used * current_mult
                             profit = returns - stake_used
-                            self.stats["total_return"] += returns
+                            self.stats.total_return += returns
                             
                             if new_balance:
                                 self.last_balance = new_balance
@@ -506,15 +988,15 @@ class AviatorBotML:
                         time.sleep(0.2)
                         crashed = self.multiplier_reader.has_crashed()
                         if crashed is True or cashout_reason == "NO_ACTIVE_BET":
-                            self.stats["failed_cashouts"] += 1
-                            self.stats["current_streak"] = 0
+                            self.stats.failed_cashouts += 1
+                            self.stats.current_streak = 0
                             
                             loss = -stake_used
                             final_mult = self.multiplier_reader.last_valid_multiplier or 0
                             
                             return False, loss, final_mult, "CRASH"
                 
-                time.sleep(0.03)  # Check every 30ms for responsiveness
+                sleep(0.03)  # Check every 30ms for responsiveness
                 
             except Exception as e:
                 # On error, check if crashed using detector as fallback
@@ -522,8 +1004,8 @@ class AviatorBotML:
                     print("\n")
                     print(f"  [CRASH] Detected crash (via fallback detector)")
                     
-                    self.stats["failed_cashouts"] += 1
-                    self.stats["current_streak"] = 0
+                    self.stats.failed_cashouts += 1
+                    self.stats.current_streak = 0
                     
                     loss = -stake_used
                     final_mult = self.multiplier_reader.last_valid_multiplier or 0
@@ -537,37 +1019,40 @@ class AviatorBotML:
     def _show_detailed_model_analysis(self, signal):
         """Display detailed model analysis."""
         strategy = signal.get('strategy', 'unknown')
-        print(f"\n  [STATS] STRATEGY: {strategy.upper()}")
-        print("  " + "-"*90)
+        lines = [
+            f"\n  [STATS] STRATEGY: {strategy.upper()}",
+            "  " + "-"*90
+        ]
 
         if 'position1' in strategy or 'position2' in strategy:
             if 'position1' in strategy:
-                print("\n  [TARGET] POSITION 1: ML Green Classifier")
                 target = signal.get('target_multiplier', 0)
                 green_prob = signal.get('green_probability', 0)
                 accuracy = signal.get('classifier_accuracy', 0)
                 confidence = signal.get('confidence', 0)
 
-                print("\n  +--------------------------+------------+")
-                print("  | METRIC                   | VALUE      |")
-                print("  +--------------------------+------------+")
-                print(f"  | Target Multiplier        | {target:6.2f}x    |")
-                print(f"  | Green Probability        | {green_prob:6.1f}%    |")
-                print(f"  | Model Confidence         | {confidence:6.1f}%    |")
-                print(f"  | Historical Accuracy      | {accuracy:6.1f}%    |")
-                print("  +--------------------------+------------+")
-
                 bar_length = 30
                 filled = int((green_prob / 100) * bar_length)
                 bar = "#" * filled + "-" * (bar_length - filled)
-                print(f"\n  Success Probability: [{bar}] {green_prob:.1f}%")
 
-                print(f"\n  [IDEA] REASONING:")
-                print(f"     ML classifier detected {green_prob:.1f}% probability of hitting {target:.2f}x")
-                print(f"     based on recent pattern analysis.")
+                lines += [
+                    "\n  [TARGET] POSITION 1: ML Green Classifier",
+                    "\n  +--------------------------+------------+",
+                    "  | METRIC                   | VALUE      |",
+                    "  +--------------------------+------------+",
+                    f"  | Target Multiplier        | {target:6.2f}x    |",
+                    f"  | Green Probability        | {green_prob:6.1f}%    |",
+                    f"  | Model Confidence         | {confidence:6.1f}%    |",
+                    f"  | Historical Accuracy      | {accuracy:6.1f}%    |",
+                    "  +--------------------------+------------+",
+                    f"\n  Success Probability: [{bar}] {green_prob:.1f}%",
+                    f"\n  [IDEA] REASONING:",
+                    f"     ML classifier detected {green_prob:.1f}% probability of hitting {target:.2f}x",
+                    f"     based on recent pattern analysis."
+                ]
 
             elif 'position2' in strategy:
-                print("\n  [DICE] POSITION 2: Rule-Based Pattern Detection")
+                lines.append("\n  [DICE] POSITION 2: Rule-Based Pattern Detection")
 
                 if 'cold_streak' in strategy:
                     cold_streak_len = signal.get('cold_streak_length', 0)
@@ -580,74 +1065,59 @@ class AviatorBotML:
                         low_count = sum(1 for m in recent_mults if m < 2.0)
                         high_count = sum(1 for m in recent_mults if m >= 3.0)
 
-                        print("\n  +--------------------------+------------+")
-                        print("  | METRIC                   | VALUE      |")
-                        print("  +--------------------------+------------+")
-                        print(f"  | Pattern Detected         | COLD STREAK|")
-                        print(f"  | Low Rounds (<2x)         | {low_count:2d}/10      |")
-                        print(f"  | High Rounds (≥3x)        | {high_count:2d}/10      |")
-                        print(f"  | Target Multiplier        | {target:6.2f}x    |")
-                        print(f"  | Confidence Level         | {confidence:6.1f}%    |")
-                        print("  +--------------------------+------------+")
-
-                        print("\n  [STATS] LAST 10 ROUNDS:")
-                        pattern_str = "  "
-                        for i, mult in enumerate(recent_mults, 1):
-                            if mult < 2.0:
-                                icon = "[RED]"
-                            elif mult < 3.0:
-                                icon = "[YELLOW]"
-                            else:
-                                icon = "[GREEN]"
-                            pattern_str += f"{icon}{mult:.2f}x "
-                        print(pattern_str)
-
-                        print(f"\n  [IDEA] REASONING:")
-                        print(f"     Extended cold streak detected - {cold_streak_len}/10 rounds below 2x.")
-                        print(f"     Statistical analysis suggests higher multiplier is likely.")
-                        print(f"     Targeting {target:.2f}x for better returns.")
+                        pattern_str = "  " + "".join([
+                            f"{'[RED]' if mult < 2.0 else '[YELLOW]' if mult < 3.0 else '[GREEN]'}{mult:.2f}x "
+                            for mult in recent_mults
+                        ])
+
+                        lines += [
+                            "\n  +--------------------------+------------+",
+                            "  | METRIC                   | VALUE      |",
+                            "  +--------------------------+------------+",
+                            f"  | Pattern Detected         | COLD STREAK|",
+                            f"  | Low Rounds (<2x)         | {low_count:2d}/10      |",
+                            f"  | High Rounds (≥3x)        | {high_count:2d}/10      |",
+                            f"  | Target Multiplier        | {target:6.2f}x    |",
+                            f"  | Confidence Level         | {confidence:6.1f}%    |",
+                            "  +--------------------------+------------+",
+                            "\n  [STATS] LAST 10 ROUNDS:",
+                            pattern_str,
+                            f"\n  [IDEA] REASONING:",
+                            f"     Extended cold streak detected - {cold_streak_len}/10 rounds below 2x.",
+                            f"     Statistical analysis suggests higher multiplier is likely.",
+                            f"     Targeting {target:.2f}x for better returns."
+                        ]
 
         elif 'regression' in strategy and signal.get('models'):
-            print("\n  [LAB] REGRESSION ENSEMBLE: Individual Model Predictions")
-            predictions = signal['models']
-
-            print("\n  +--------------------------+----------+------------+")
-            print("  | MODEL                    |   PRED   | CONFIDENCE |")
-            print("  +--------------------------+----------+------------+")
-
-            model_names = {
-                'RandomForest': 'Random Forest',
-                'GradientBoosting': 'Gradient Boosting',
-                'LightGBM': 'LightGBM',
-                'LSTM': 'LSTM Neural Net'
-            }
-
-            for pred in predictions:
-                model_id = pred.get('model_id', 'Unknown')
-                display_name = model_names.get(model_id, model_id)
-                pred_val = pred.get('prediction', 0)
-                conf = pred.get('confidence', 0)
-                print(f"  | {display_name:<24} | {pred_val:6.2f}x |  {conf:6.1f}%   |")
-
-            print("  +--------------------------+----------+------------+")
-
-            ensemble_pred = signal.get('prediction', 0)
-            ensemble_conf = signal.get('confidence', 0)
-            print(f"  | ENSEMBLE                 | {ensemble_pred:6.2f}x |  {ensemble_conf:6.1f}%   |")
-            print("  +--------------------------+----------+------------+")
+            # Rounded to display precision so the cached table is identical
+            model_rows = tuple(
+                (pred.get('model_id', 'Unknown'),
+                 round(pred.get('prediction', 0), 2),
+                 round(pred.get('confidence', 0), 1))
+                for pred in signal['models']
+            )
+            lines.append(_format_regression_table(
+                model_rows,
+                round(signal.get('prediction', 0), 2),
+                round(signal.get('confidence', 0), 1)
+            ))
 
         elif 'skip' in strategy:
-            print("\n  [SKIP]  DECISION: SKIP ROUND")
             reason = signal.get('reason', 'No reason provided')
 
-            print("\n  +--------------------------+------------+")
-            print("  | METRIC                   | VALUE      |")
-            print("  +--------------------------+------------+")
-            print(f"  | Decision                 | SKIP       |")
-            print(f"  | Confidence               | {signal.get('confidence', 0):6.1f}%    |")
-            print("  +--------------------------+------------+")
-
-            print(f"\n  [IDEA] REASONING: {reason}")
+            lines += [
+                "\n  [SKIP]  DECISION: SKIP ROUND",
+                "\n  +--------------------------+------------+",
+                "  | METRIC                   | VALUE      |",
+                "  +--------------------------+------------+",
+                f"  | Decision                 | SKIP       |",
+                f"  | Confidence               | {signal.get('confidence', 0):6.1f}%    |",
+                "  +--------------------------+------------+",
+                f"\n  [IDEA] REASONING: {reason}"
+            ]
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def _log_round_header(self, round_num):
         """Print round header."""
@@ -664,7 +1134,7 @@ class AviatorBotML:
             if self.hot_run_mode:
                 print(f"  [TARGET] Target Multiplier: {self.target_cashout_multiplier:.2f}x")
             else:
-                print(f"  [TARGET] Target: {self.config_manager.cashout_delay}s (~{estimate_multiplier(self.config_manager.cashout_delay):.2f}x)")
+                print(f"  [TARGET] Target: {self.config_manager.cashout_delay}s (~{self._estimated_mult:.2f}x)")
             
             print(f"  [STATS] Ensemble Confidence: {signal['confidence']:.1f}%")
             self._show_detailed_model_analysis(signal)
@@ -674,155 +1144,142 @@ class AviatorBotML:
             print(f"  [STATS] Ensemble Confidence: {signal['confidence']:.1f}% (Threshold: {self.ml_generator.confidence_threshold}%)")
             self._show_detailed_model_analysis(signal)
     
-    def _log_round_result(self, round_num, action, stake, result, profit, mult, signal, balance, cumulative):
+    def _log_round_result(self, round_num: int, action: str, stake: float, result: str, profit: float,
+                          mult: float, signal: Optional[dict], balance: Optional[float],
+                          cumulative: float) -> None:
         """Log round result."""
-        if result == "WIN":
-            icon = "[OK]"
-            result_color = "SUCCESS"
-        elif result == "CRASH":
-            icon = "[CRASH]"
-            result_color = "CRASHED"
-        elif result == "CANCEL":
-            icon = "[CANCEL]"
-            result_color = "CANCELLED"
-        elif result == "NOSTART":
-            icon = "[WARNING]"
-            result_color = "NO START"
-        elif result == "SKIP":
-            icon = "[SKIP]"
-            result_color = "SKIPPED"
-        else:
-            icon = "[?]"
-            result_color = result
-        
-        print(f"\n  {icon} RESULT: {result_color}")
-        
+        icon, result_color = _RESULT_STYLES.get(result, ("[?]", result))
+
+        lines = [f"\n  {icon} RESULT: {result_color}"]
+
         if stake > 0:
-            print(f"  [CASH] Stake: {stake:.0f}")
-        
+            lines.append(f"  [CASH] Stake: {stake:.0f}")
+
         if mult > 0:
-            print(f"  [MULT] Multiplier: {mult:.2f}x")
-        
+            lines.append(f"  [MULT] Multiplier: {mult:.2f}x")
+
         if profit != 0:
             profit_sign = "+" if profit > 0 else ""
-            print(f"  [MONEY] P/L: {profit_sign}{profit:.2f}")
-        
+            lines.append(f"  [MONEY] P/L: {profit_sign}{profit:.2f}")
+
         if balance:
-            print(f"  [BAL] Balance: {balance:.2f}")
-        
-        print(f"  [STATS] Cumulative P/L: {cumulative:+.2f}")
-        
+            lines.append(f"  [BAL] Balance: {balance:.2f}")
+
+        lines.append(f"  [STATS] Cumulative P/L: {cumulative:+.2f}")
+
         if result == "WIN":
-            print(f"  [STREAK] Win Streak: {self.stats['current_streak']}")
-        
-        print(f"{'-'*100}")
-    
-    def _create_round_data(self, multiplier, bet_placed, stake, cashout_time,
-                          profit_loss, signal, cumulative_profit, balance=None):
-        """Create round data dictionary for dashboard."""
-        models_data = {'rf': 0, 'gb': 0, 'lgb': 0}
-        if signal and 'models' in signal:
-            for model in signal['models']:
-                model_id = model.get('model_id', '')
-                prediction = model.get('prediction', 0)
-                if 'Random' in model_id:
-                    models_data['rf'] = prediction
-                elif 'Gradient' in model_id:
-                    models_data['gb'] = prediction
-                elif 'LightGBM' in model_id:
-                    models_data['lgb'] = prediction
+            lines.append(f"  [STREAK] Win Streak: {self.stats.current_streak}")
+
+        lines.append('-' * 100)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
+    def _create_round_data(self, multiplier: float, bet_placed: bool, stake: float, cashout_time: float,
+                          profit_loss: float, signal: Optional[dict], cumulative_profit: float,
+                          balance: Optional[float] = None) -> Optional[dict]:
+        """Create round data dictionary for dashboard (None if no dashboard attached)."""
+        if self.dashboard is None:
+            return None
+
+        models_data = {'rf': 0, 'gb': 0, 'lgb': 0}
+        pred = conf = 0
+        if signal:
+            pred = signal.get('prediction', 0)
+            conf = signal.get('confidence', 0)
+            for model in signal.get('models', ()):
+                key = model.get('key')
+                if key in models_data:
+                    models_data[key] = model.get('prediction', 0)
+
+        stats = self.stats
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _iso_timestamp(),
             'multiplier': multiplier,
             'bet_placed': bet_placed,
             'stake': stake,
             'cashout_time': cashout_time,
             'profit_loss': profit_loss,
-            'prediction': signal.get('prediction', 0) if signal else 0,
-            'confidence': signal.get('confidence', 0) if signal else 0,
+            'prediction': pred,
+            'confidence': conf,
             'models': models_data,
             'cumulative_profit': cumulative_profit,
             'balance': balance,
-            'stats': self.stats.copy(),
+            'stats': asdict(stats),
             'current_stake': self.current_stake
         }
     
-    def _emit_dashboard_update(self, round_data):
-        """Emit update to dashboard if available."""
-        if self.dashboard:
-            self.dashboard.emit_round_update(round_data)
+    def _emit_dashboard_update(self, round_data: Optional[dict]) -> None:
+        """Queue a round update for the dashboard if available (never blocks)."""
+        if self.dashboard is None or round_data is None:
+            return
+        self._emit_queue.append(round_data)
+
+    def _request_stats_update(self) -> None:
+        """Mark stats as changed so the next dashboard flush sends them."""
+        if self.dashboard is not None:
+            self._stats_dirty = True
+
+    def _dashboard_emit_loop(self, interval=0.1, max_batch=50, stats_interval=0.25):
+        """
+        Flush queued dashboard updates as one emit per interval.
+
+        Round batches carry the stats with them; stats-only updates are sent
+        at most once per `stats_interval` however often they are requested.
+        """
+        queue = self._emit_queue
+        last_stats_emit = 0.0
+        while True:
+            time.sleep(interval)
+            dashboard = self.dashboard
+            if dashboard is None:
+                continue
+            try:
+                if queue:
+                    batch = [queue.popleft() for _ in range(min(len(queue), max_batch))]
+                    self._stats_dirty = False
+                    dashboard.emit_round_updates(batch)
+                    last_stats_emit = time.monotonic()
+                elif self._stats_dirty and time.monotonic() - last_stats_emit >= stats_interval:
+                    self._stats_dirty = False
+                    dashboard.emit_stats_update()
+                    last_stats_emit = time.monotonic()
+            except Exception as e:
+                print(f"[WARNING] Dashboard update failed: {e}")
 
     def run_hot_run_mode(self):
         """
         HOT RUN MODE - Quick start with existing config, uses real multiplier for cashout.
         ALL BETS ARE PLACED - No ML filtering, pure aggressive betting.
         """
-        print("\n" + "="*100)
-        print("[ROCKET] AVIATOR BOT - HOT RUN MODE (AGGRESSIVE - ALL BETS)")
-        print("="*100)
-        print("[FIRE] Using existing configuration and stake values")
-        print("[TARGET] Cashout based on REAL multiplier values")
-        print("[WARNING] ALL rounds will be bet on (no ML filtering)")
-        print("="*100)
+        _print_banner("[ROCKET] AVIATOR BOT - HOT RUN MODE (AGGRESSIVE - ALL BETS)", [
+            "[FIRE] Using existing configuration and stake values",
+            "[TARGET] Cashout based on REAL multiplier values",
+            "[WARNING] ALL rounds will be bet on (no ML filtering)",
+        ])
 
         # Set hot run flag
         self.hot_run_mode = True
 
-        cumulative_profit = 0
+        cumulative_cents = 0  # Cumulative P/L in integer cents (no float drift)
         round_number = 0
         history_read_for_round = False
 
         try:
+            # Bind hot attributes once for the betting loop
+            stats = self.stats
+            cfg = self.config_manager
+            mr = self.multiplier_reader
+            reset_bet_state = self._reset_bet_state
+
             while True:
                 round_number += 1
-                self._log_round_header(round_number)
-
-                # STEP 1: Wait for AWAITING state using multiplier reader
-                flush_print("  [WAIT] Waiting for AWAITING state...")
-                if not self._wait_for_awaiting_state(timeout=60):
-                    flush_print("  [WARNING]  Timeout - retrying...")
-                    continue
-
-                flush_print("  [OK] AWAITING confirmed (via multiplier reader)")
-                time.sleep(0.3)
-
-                # STEP 2: Check for existing bet
-                if self._check_existing_bet():
-                    flush_print("  [CANCEL] Orphaned bet detected!")
-                    self.stats["cancelled_bets"] += 1
-                    self.stats["failed_cashouts"] += 1
-
-                    loss = -self.current_stake
-                    cumulative_profit += loss
-
-                    self._log_round_result(round_number, "BET", self.current_stake, "CANCEL",
-                                          loss, 0, None, self.last_balance, cumulative_profit)
-
-                    self.current_stake = reset_stake(self.config_manager.initial_stake, self.stats)
-                    self._reset_bet_state()
-                    history_read_for_round = False
+                ready, loss, history_read_for_round = self._begin_round(
+                    round_number, _HOT_RUN_POLICY, history_read_for_round, cumulative_cents / 100
+                )
+                cumulative_cents += _to_cents(loss)
+                if not ready:
                     continue
 
-                # STEP 3: Read previous round multiplier
-                if not history_read_for_round:
-                    flush_print("  [LOG] Checking for previous round...")
-
-                    success, logged_mult = self.history_tracker.auto_log_from_clipboard(
-                        self.detector,
-                        force=False
-                    )
-
-                    if success and logged_mult and logged_mult != self.last_logged_mult:
-                        self.last_logged_mult = logged_mult
-                        flush_print(f"  [OK] Previous round: {logged_mult:.2f}x (added to history)")
-                    else:
-                        flush_print("  [INFO]  No new round data")
-
-                    history_read_for_round = True
-
-                time.sleep(0.2)
-
                 # STEP 4: Generate ML signal (for target multiplier only, not for filtering)
                 print("\n  [ML] Getting target multiplier from ML models...")
                 signal = self.ml_generator.generate_ensemble_signal()
@@ -836,51 +1293,40 @@ class AviatorBotML:
                 # ALWAYS BET IN HOT RUN MODE
                 stake_used = self.current_stake
 
-                print(f"\n  [FIRE] HOT RUN: PLACING BET (no filtering)")
-                print(f"  [MONEY] Stake: {stake_used}")
-                print(f"  [TARGET] Target Multiplier: {self.target_cashout_multiplier:.2f}x")
-                print(f"  [STATS] ML Prediction: {signal.get('prediction', 0):.2f}x (Confidence: {signal.get('confidence', 0):.1f}%)")
+                sys.stdout.write(_HOT_BET_TEMPLATE.format(
+                    stake_used, self.target_cashout_multiplier,
+                    signal.get('prediction', 0), signal.get('confidence', 0)
+                ))
+                sys.stdout.flush()
 
                 # Show model analysis (informational only)
                 self._show_detailed_model_analysis(signal)
 
                 # Pre-bet checks using multiplier reader
                 if self._verify_game_running_strict():
-                    print("  [WARNING]  Game already running - aborting")
-                    self.stats["rounds_observed"] += 1
-                    self.stats["ml_skipped"] += 1
-                    self._reset_bet_state()
-                    history_read_for_round = False
+                    history_read_for_round = self._handle_failed_round("  [WARNING]  Game already running - aborting")
                     continue
 
                 # Set stake
                 print(f"\n  [MONEY] Setting stake: {stake_used}...")
-                if not set_stake_verified(self.config_manager.stake_coords, stake_used):
-                    print("  [X] Stake setting failed")
-                    self.stats["rounds_observed"] += 1
-                    self.stats["ml_skipped"] += 1
-                    self._reset_bet_state()
-                    history_read_for_round = False
+                if not set_stake_verified(cfg.stake_coords, stake_used):
+                    history_read_for_round = self._handle_failed_round("  [X] Stake setting failed")
                     continue
 
                 print("  [OK] Stake set")
-                time.sleep(0.15)
+                self._wait_for_reader_event(0.15)
 
                 # Place bet
                 print(f"  [CASH] Placing bet...")
                 bet_success, bet_reason = place_bet_with_verification(
-                    self.config_manager.bet_button_coords,
+                    cfg.bet_button_coords,
                     self.detector,
-                    self.stats,
+                    stats,
                     self.current_stake
                 )
 
                 if not bet_success:
-                    print(f"  [X] Bet failed: {bet_reason}")
-                    self.stats["rounds_observed"] += 1
-                    self.stats["ml_skipped"] += 1
-                    self._reset_bet_state()
-                    history_read_for_round = False
+                    history_read_for_round = self._handle_failed_round(f"  [X] Bet failed: {bet_reason}")
                     continue
 
                 print("  [OK] Bet placed!")
@@ -888,44 +1334,25 @@ class AviatorBotML:
                 self.bet_state = "PLACED"
                 self.active_bet_round = round_number
 
-                time.sleep(0.5)
+                # Returns as soon as the reader sees the flight start
+                self._wait_for_reader_event(0.5)
 
                 # Wait for game start using multiplier reader
                 print("\n  [WAIT] Waiting for game start (monitoring multiplier)...")
                 game_started = self._wait_for_game_start_strict(timeout=15)
 
                 if not game_started:
-                    print("  [WARNING]  Game didn't start - bet cancelled")
-                    self.stats["cancelled_bets"] += 1
-                    self.stats["failed_cashouts"] += 1
-
-                    loss = -stake_used
-                    cumulative_profit += loss
-
-                    self._log_round_result(round_number, "BET", stake_used, "NOSTART",
-                                          loss, 0, signal, self.last_balance, cumulative_profit)
-
-                    self.history_tracker.log_round(
-                        multiplier=0,
-                        bet_placed=True,
-                        stake=stake_used,
-                        cashout_time=0,
-                        profit_loss=loss,
-                        prediction=signal['prediction'],
-                        confidence=signal['confidence'],
-                        pred_range=(0, 0)
+                    cumulative_cents += _to_cents(
+                        self._handle_no_start(round_number, stake_used, signal, cumulative_cents / 100)
                     )
-
-                    self.current_stake = reset_stake(self.config_manager.initial_stake, self.stats)
-                    self._reset_bet_state()
-                    self.stats["rounds_observed"] += 1
                     history_read_for_round = False
                     continue
 
                 print("  [ROCKET] Game started! (multiplier detected)")
 
                 # Reset multiplier reader for new flight
-                self.multiplier_reader.reset()
+                if mr:
+                    mr.reset()
 
                 # WAIT FOR TARGET MULTIPLIER AND CASHOUT
                 success, profit, final_mult, result_type = self._wait_for_multiplier_and_cashout(
@@ -935,7 +1362,8 @@ class AviatorBotML:
                     stake_used
                 )
 
-                cumulative_profit += profit
+                cumulative_cents += _to_cents(profit)
+                cumulative_profit = cumulative_cents / 100
 
                 # Update balance if we won
                 if success and self.last_balance:
@@ -962,49 +1390,24 @@ class AviatorBotML:
                 self._emit_dashboard_update(round_data)
 
                 # Update stake based on result
-                if success:
-                    self.current_stake = increase_stake(
-                        self.current_stake,
-                        self.config_manager.stake_increase_percent,
-                        self.config_manager.max_stake,
-                        self.stats
-                    )
-                else:
-                    self.current_stake = reset_stake(self.config_manager.initial_stake, self.stats)
+                self._update_stake(success)
 
-                self._reset_bet_state()
+                reset_bet_state()
                 history_read_for_round = False
 
                 self.ml_generator.log_highest_multipliers()
                 
-                # Check for high multiplier sequence prediction
-                if self.stats["rounds_observed"] % 5 == 0:  # Check every 5 rounds
-                    prediction = self.pattern_predictor.predict_high_sequence()
-                    if prediction['prediction'] and prediction['confidence'] >= 70:
-                        current_time = time.time()
-                        if current_time - self.pattern_predictor.last_notification > self.pattern_predictor.notification_cooldown:
-                            self.mobile_notifier.notify_high_sequence_prediction(prediction)
-                            # Start tracking this prediction for validation
-                            self.pattern_predictor.start_prediction_tracking(prediction)
-                            self.pattern_predictor.last_notification = current_time
-                            print(f"📱 HIGH SEQUENCE ALERT: {prediction['confidence']}% confidence")
-                
-                # Validate active predictions with current multiplier
-                if hasattr(self, 'pattern_predictor'):
-                    self.pattern_predictor.validate_predictions(final_mult)
-                    
-                    # Send validation results if any completed
-                    for result in self.pattern_predictor.validation_results[-5:]:  # Check last 5 results
-                        if not hasattr(result, 'sent'):
-                            self.mobile_notifier.send_validation_result(result)
-                            result['sent'] = True  # Mark as sent
-                
-                self.stats["rounds_observed"] += 1
+                # Pattern prediction and notifications run off the betting loop
+                future = self._bg_exec.submit(
+                    self._run_post_round_tasks, final_mult, stats.rounds_observed
+                )
+                future.add_done_callback(self._log_post_round_error)
+
+                stats.rounds_observed += 1
 
-                if self.dashboard:
-                    self.dashboard.emit_stats_update()
+                self._request_stats_update()
 
-                time.sleep(0.3)
+                self._wait_for_reader_event(0.3)
 
         except KeyboardInterrupt:
             print("\n\n[STOP]  Bot stopped by user")
@@ -1017,58 +1420,26 @@ class AviatorBotML:
 
     def run_observation_mode(self):
         """Observation mode - collect data without placing bets (clipboard/OCR)."""
-        print("\n" + "="*100)
-        print("[STATS] AVIATOR BOT - OBSERVATION MODE (DATA COLLECTION)")
-        print("="*100)
-        print("[SCAN] Bot will observe rounds and collect data without placing bets.")
-        print("[SAVE] Data will be saved to aviator_rounds_history.csv for model training.")
-        print("[SCAN] Round detection and history logging use clipboard/OCR.")
-        print("="*100)
+        _print_banner("[STATS] AVIATOR BOT - OBSERVATION MODE (DATA COLLECTION)", [
+            "[SCAN] Bot will observe rounds and collect data without placing bets.",
+            "[SAVE] Data will be saved to aviator_rounds_history.csv for model training.",
+            "[SCAN] Round detection and history logging use clipboard/OCR.",
+        ])
 
+        cumulative_profit = 0  # Observation never bets; kept for the dashboard payload
         round_number = 0
         history_read_for_round = False
 
         try:
             while True:
                 round_number += 1
-                self._log_round_header(round_number)
-
-                flush_print("  [WAIT] Waiting for AWAITING state (via clipboard/OCR)...")
-                if not self.detector.wait_for_clean_awaiting_state(timeout=60):
-                    flush_print("  [WARNING]  Timeout - retrying...")
+                ready, loss, history_read_for_round = self._begin_round(
+                    round_number, _OBSERVATION_POLICY, history_read_for_round, cumulative_profit
+                )
+                cumulative_profit += loss
+                if not ready:
                     continue
 
-                flush_print("  [OK] AWAITING confirmed")
-                time.sleep(0.3)
-
-                if not history_read_for_round:
-                    flush_print("  [LOG] Checking for previous round (via clipboard/OCR)...")
-
-                    success, logged_mult = self.history_tracker.auto_log_from_clipboard(
-                        self.detector,
-                        force=False
-                    )
-
-                    if success and logged_mult and logged_mult != self.last_logged_mult:
-                        self.last_logged_mult = logged_mult
-
-                        self.history_tracker.log_round(
-                            multiplier=logged_mult,
-                            bet_placed=False,
-                            stake=0,
-                            cashout_time=0,
-                            profit_loss=0
-                        )
-
-                        flush_print(f"  [OK] Round observed: {logged_mult:.2f}x (saved to history)")
-                        self.stats["rounds_observed"] += 1
-                    else:
-                        flush_print("  [INFO]  No new round data")
-
-                    history_read_for_round = True
-
-                time.sleep(0.2)
-
                 print("\n  [ML] Generating predictions (no bet will be placed)...")
                 signal = self.ml_generator.generate_ensemble_signal()
 
@@ -1082,37 +1453,26 @@ class AviatorBotML:
 
                 if success and observed_mult:
                     print(f"  [OK] Round complete: {observed_mult:.2f}x")
-                    self.stats["rounds_observed"] += 1
+                    self.stats.rounds_observed += 1
                     # Log to history
-                    self.history_tracker.log_round(
-                        multiplier=observed_mult,
-                        bet_placed=False,
-                        stake=0,
-                        cashout_time=0,
-                        profit_loss=0,
-                        prediction=signal['prediction'],
-                        confidence=signal['confidence'],
-                        pred_range=(0, 0)
-                    )
-                    round_data = self._create_round_data(observed_mult, False, 0, 0, 0,
-                                                         signal, cumulative_profit, self.last_balance)
-                    self._emit_dashboard_update(round_data)
+                    self._record_observed_round(observed_mult, signal, cumulative_profit, self.last_balance)
                 else:
                     print("  [WARNING]  Could not read round result via clipboard/OCR.")
-                    self.stats["rounds_observed"] += 1 # Still count as observed
+                    self.stats.rounds_observed += 1 # Still count as observed
 
                 self.ml_generator.log_highest_multipliers()
-                history_read_for_round = False
+                # A successful crash read already logged this round; skip re-reading it next round
+                history_read_for_round = bool(success and observed_mult)
 
                 if round_number % 10 == 0:
-                    print(f"\n  [CHART] Progress: {self.stats['rounds_observed']} rounds collected")
+                    print(f"\n  [CHART] Progress: {self.stats.rounds_observed} rounds collected")
                     print(f"  [SAVE] Data saved to: aviator_rounds_history.csv")
 
-                time.sleep(0.5)
+                # No pause here: the next round's AWAITING wait already paces the loop
 
         except KeyboardInterrupt:
             print("\n\n[STOP]  Observation stopped by user")
-            print(f"\n[STATS] Total rounds observed: {self.stats['rounds_observed']}")
+            print(f"\n[STATS] Total rounds observed: {self.stats.rounds_observed}")
             print(f"[SAVE] Data saved to: aviator_rounds_history.csv")
         except Exception as e:
             print(f"\n\n[X] Error: {e}")
@@ -1122,15 +1482,14 @@ class AviatorBotML:
 
     def run_dry_run_mode(self):
         """DRY RUN MODE - Simulates betting without placing real bets (clipboard/OCR)."""
-        print("\n" + "="*100)
-        print("[LOG] AVIATOR BOT - DRY RUN MODE (SIMULATION)")
-        print("="*100)
-        print("[SCAN] Bot will simulate all betting decisions WITHOUT placing real bets.")
-        print("[IDEA] All ML predictions, stake management, and outcomes will be logged.")
-        print("[STATS] Hypothetical profit/loss will be tracked based on actual multipliers.")
-        print("[SCAN] Round detection and history logging use clipboard/OCR.")
-        print("="*100)
-
+        _print_banner("[LOG] AVIATOR BOT - DRY RUN MODE (SIMULATION)", [
+            "[SCAN] Bot will simulate all betting decisions WITHOUT placing real bets.",
+            "[IDEA] All ML predictions, stake management, and outcomes will be logged.",
+            "[STATS] Hypothetical profit/loss will be tracked based on actual multipliers.",
+            "[SCAN] Round detection and history logging use clipboard/OCR.",
+        ])
+
+        self._estimated_mult = estimate_multiplier(self.config_manager.cashout_delay)
         cumulative_profit = 0
         hypothetical_balance = 1000.0
         round_number = 0
@@ -1139,34 +1498,13 @@ class AviatorBotML:
         try:
             while True:
                 round_number += 1
-                self._log_round_header(round_number)
-
-                flush_print("  [WAIT] Waiting for AWAITING state (via clipboard/OCR)...")
-                if not self.detector.wait_for_clean_awaiting_state(timeout=60):
-                    flush_print("  [WARNING]  Timeout - retrying...")
+                ready, loss, history_read_for_round = self._begin_round(
+                    round_number, _DRY_RUN_POLICY, history_read_for_round, cumulative_profit
+                )
+                cumulative_profit += loss
+                if not ready:
                     continue
 
-                flush_print("  [OK] AWAITING confirmed")
-                time.sleep(0.3)
-
-                if not history_read_for_round:
-                    flush_print("  [LOG] Checking for previous round (via clipboard/OCR)...")
-
-                    success, logged_mult = self.history_tracker.auto_log_from_clipboard(
-                        self.detector,
-                        force=False
-                    )
-
-                    if success and logged_mult and logged_mult != self.last_logged_mult:
-                        self.last_logged_mult = logged_mult
-                        flush_print(f"  [OK] Previous round: {logged_mult:.2f}x (added to history)")
-                    else:
-                        flush_print("  [INFO]  No new round data")
-
-                    history_read_for_round = True
-
-                time.sleep(0.2)
-
                 print("\n  [ML] Analyzing patterns (DRY RUN - no bet will be placed)...")
                 signal = self.ml_generator.generate_ensemble_signal()
 
@@ -1180,7 +1518,7 @@ class AviatorBotML:
                         target_mult = signal['target_multiplier']
                         print(f"  [TARGET] Target Multiplier: {target_mult:.2f}x")
                     else:
-                        target_mult = estimate_multiplier(self.config_manager.cashout_delay)
+                        target_mult = self._estimated_mult
                         print(f"  [TARGET] Target: {self.config_manager.cashout_delay}s (~{target_mult:.2f}x)")
                     
                     print(f"  [STATS] Ensemble Confidence: {signal['confidence']:.1f}%")
@@ -1199,11 +1537,11 @@ class AviatorBotML:
                         cumulative_profit += hypothetical_profit
                         hypothetical_balance += hypothetical_profit
 
-                        self.stats["successful_cashouts"] += 1
-                        self.stats["ml_bets_placed"] += 1
-                        self.stats["total_bet"] += stake_used
-                        self.stats["total_return"] += hypothetical_return
-                        self.stats["current_streak"] += 1
+                        self.stats.successful_cashouts += 1
+                        self.stats.ml_bets_placed += 1
+                        self.stats.total_bet += stake_used
+                        self.stats.total_return += hypothetical_return
+                        self.stats.current_streak += 1
 
                         print(f"\n  [OK] SIMULATED RESULT: WIN")
                         print(f"  [MULT] Actual: {observed_mult:.2f}x | Target: {target_mult:.2f}x")
@@ -1212,21 +1550,17 @@ class AviatorBotML:
                         print(f"  [STATS] Cumulative P/L: {cumulative_profit:+.2f}")
                         print(f"{'-'*100}")
 
-                        self.current_stake = increase_stake(
-                            self.current_stake,
-                            self.config_manager.stake_increase_percent,
-                            self.config_manager.max_stake,
-                            self.stats
-                        )
+                        self._update_stake(True)
                     else:
                         hypothetical_loss = -stake_used
+                        hypothetical_profit = hypothetical_loss
                         cumulative_profit += hypothetical_loss
                         hypothetical_balance += hypothetical_loss
 
-                        self.stats["failed_cashouts"] += 1
-                        self.stats["ml_bets_placed"] += 1
-                        self.stats["total_bet"] += stake_used
-                        self.stats["current_streak"] = 0
+                        self.stats.failed_cashouts += 1
+                        self.stats.ml_bets_placed += 1
+                        self.stats.total_bet += stake_used
+                        self.stats.current_streak = 0
 
                         print(f"\n  [CRASH] SIMULATED RESULT: LOSS")
                         print(f"  [MULT] Actual: {observed_mult:.2f}x | Target: {target_mult:.2f}x")
@@ -1235,7 +1569,7 @@ class AviatorBotML:
                         print(f"  [STATS] Cumulative P/L: {cumulative_profit:+.2f}")
                         print(f"{'-'*100}")
 
-                        self.current_stake = reset_stake(self.config_manager.initial_stake, self.stats)
+                        self._update_stake(False)
 
                     # Log to history for dry run
                     self.history_tracker.log_round(
@@ -1258,7 +1592,7 @@ class AviatorBotML:
 
                     self._show_detailed_model_analysis(signal)
 
-                    self.stats["ml_skipped"] += 1
+                    self.stats.ml_skipped += 1
 
                     print("\n  [WAIT] Waiting for round to complete (via clipboard/OCR)...")
                     success, observed_mult = self._wait_for_crash_and_read_multiplier(timeout=60)
@@ -1272,32 +1606,19 @@ class AviatorBotML:
                     print(f"{'-'*100}")
                     
                     # Log to history for dry run
-                    self.history_tracker.log_round(
-                        multiplier=observed_mult,
-                        bet_placed=False,
-                        stake=0,
-                        cashout_time=0,
-                        profit_loss=0,
-                        prediction=signal['prediction'],
-                        confidence=signal['confidence'],
-                        pred_range=(0, 0)
-                    )
-                    round_data = self._create_round_data(observed_mult, False, 0, 0, 0,
-                                                         signal, cumulative_profit, hypothetical_balance)
-                    self._emit_dashboard_update(round_data)
+                    self._record_observed_round(observed_mult, signal, cumulative_profit, hypothetical_balance)
 
 
                 self.ml_generator.log_highest_multipliers()
-                history_read_for_round = False
-                self.stats["rounds_observed"] += 1
+                # A successful crash read already logged this round; skip re-reading it next round
+                history_read_for_round = bool(success)
+                self.stats.rounds_observed += 1
 
                 if round_number % 10 == 0:
                     print(f"\n  [CHART] DRY RUN SUMMARY:")
                     print(f"  [MONEY] Hypothetical Balance: {hypothetical_balance:.2f}")
                     print(f"  [STATS] Cumulative P/L: {cumulative_profit:+.2f}")
 
-                time.sleep(0.3)
-
         except KeyboardInterrupt:
             print("\n\n[STOP]  Dry run stopped by user")
             self.print_dry_run_stats(cumulative_profit, hypothetical_balance)
@@ -1309,32 +1630,31 @@ class AviatorBotML:
 
     def print_dry_run_stats(self, cumulative_profit, hypothetical_balance):
         """Print dry run statistics."""
-        print("\n" + "="*100)
-        print("[STATS] DRY RUN FINAL STATISTICS")
-        print("="*100)
-        print(f"Rounds observed:       {self.stats['rounds_observed']}")
-        print(f"Simulated bets:        {self.stats['ml_bets_placed']}")
-        print(f"Simulated wins:        {self.stats['successful_cashouts']}")
-        print(f"Simulated losses:      {self.stats['failed_cashouts']}")
-
-        if self.stats['ml_bets_placed'] > 0:
-            success_rate = (self.stats['successful_cashouts'] / self.stats['ml_bets_placed']) * 100
-            print(f"Win rate:              {success_rate:.1f}%")
-
-        print(f"\n[MONEY] Hypothetical Financial:")
-        print(f"  Profit/Loss:         {cumulative_profit:+.2f}")
-        print(f"  Final balance:       {hypothetical_balance:.2f}")
-        print("="*100 + "\n")
+        stats = self.stats
+        bets = stats.ml_bets_placed
+        lines = [
+            f"Rounds observed:       {stats.rounds_observed}",
+            f"Simulated bets:        {bets}",
+            f"Simulated wins:        {stats.successful_cashouts}",
+            f"Simulated losses:      {stats.failed_cashouts}",
+        ]
+        if bets > 0:
+            lines.append(f"Win rate:              {stats.successful_cashouts / bets * 100:.1f}%")
+        lines += [
+            "\n[MONEY] Hypothetical Financial:",
+            f"  Profit/Loss:         {cumulative_profit:+.2f}",
+            f"  Final balance:       {hypothetical_balance:.2f}",
+        ]
+        _print_banner("[STATS] DRY RUN FINAL STATISTICS", lines)
 
     def run_ml_mode(self):
         """Main betting loop - STANDARD MODE with time-based cashout (clipboard/OCR)."""
-        print("\n" + "="*100)
-        print("[PLANE]  AVIATOR BOT - STANDARD ML MODE")
-        print("="*100)
-        print(f"[TIMER]  Cashout based on TIME delay: {self.config_manager.cashout_delay}s")
-        print("[SCAN] Round detection and history logging use clipboard/OCR.")
-        print("="*100)
+        _print_banner("[PLANE]  AVIATOR BOT - STANDARD ML MODE", [
+            f"[TIMER]  Cashout based on TIME delay: {self.config_manager.cashout_delay}s",
+            "[SCAN] Round detection and history logging use clipboard/OCR.",
+        ])
         
+        self._estimated_mult = estimate_multiplier(self.config_manager.cashout_delay)
         cumulative_profit = 0
         round_number = 0
         history_read_for_round = False
@@ -1342,55 +1662,17 @@ class AviatorBotML:
         try:
             while True:
                 round_number += 1
-                self._log_round_header(round_number)
-                
-                flush_print("  [WAIT] Waiting for AWAITING state (via clipboard/OCR)...")
-                if not self.detector.wait_for_clean_awaiting_state(timeout=60):
-                    flush_print("  [WARNING]  Timeout - retrying...")
-                    continue
-                
-                flush_print("  [OK] AWAITING confirmed")
-                time.sleep(0.3)
-                
-                if self._check_existing_bet():
-                    flush_print("  [CANCEL] Orphaned bet detected!")
-                    self.stats["cancelled_bets"] += 1
-                    self.stats["failed_cashouts"] += 1
-                    
-                    loss = -self.current_stake
-                    cumulative_profit += loss
-                    
-                    self._log_round_result(round_number, "BET", self.current_stake, "CANCEL", 
-                                          loss, 0, None, self.last_balance, cumulative_profit)
-                    
-                    self.current_stake = reset_stake(self.config_manager.initial_stake, self.stats)
-                    self._reset_bet_state()
-                    history_read_for_round = False
+                ready, loss, history_read_for_round = self._begin_round(
+                    round_number, _ML_POLICY, history_read_for_round, cumulative_profit
+                )
+                cumulative_profit += loss
+                if not ready:
                     continue
-                
-                if not history_read_for_round:
-                    flush_print("  [LOG] Checking for previous round (via clipboard/OCR)...")
-
-                    success, logged_mult = self.history_tracker.auto_log_from_clipboard(
-                        self.detector,
-                        force=False
-                    )
-
-                    if success and logged_mult and logged_mult != self.last_logged_mult:
-                        self.last_logged_mult = logged_mult
-                        flush_print(f"  [OK] Previous round: {logged_mult:.2f}x (added to history)")
-                    else:
-                        flush_print("  [INFO]  No new round data")
-
-                    history_read_for_round = True
-
-                time.sleep(0.2)
 
                 print("\n  [ML] Analyzing patterns...")
-                signal = self.ml_generator.generate_ensemble_signal()
+                signal, seasonal_data = self._take_signal()
                 
-                # Get seasonal context and boost confidence if favorable
-                seasonal_data = self.seasonal_analyzer.get_seasonal_recommendation()
+                # Boost confidence if seasonal context is favorable
                 if seasonal_data['confidence_boost'] > 0:
                     signal['confidence'] = min(95, signal['confidence'] + seasonal_data['confidence_boost'])
                     print(f"  [SEASON] Seasonal boost: +{seasonal_data['confidence_boost']}% confidence")
@@ -1403,25 +1685,17 @@ class AviatorBotML:
                     
                     # Pre-bet checks using detector (clipboard/OCR)
                     if self.detector.is_game_flying():
-                        print("  [WARNING]  Game already running - aborting")
-                        self.stats["rounds_observed"] += 1
-                        self.stats["ml_skipped"] += 1
-                        self._reset_bet_state()
-                        history_read_for_round = False
+                        history_read_for_round = self._handle_failed_round("  [WARNING]  Game already running - aborting")
                         continue
 
                     # Set stake
                     print(f"\n  [MONEY] Setting stake: {stake_used}...")
                     if not set_stake_verified(self.config_manager.stake_coords, stake_used):
-                        print("  [X] Stake setting failed")
-                        self.stats["rounds_observed"] += 1
-                        self.stats["ml_skipped"] += 1
-                        self._reset_bet_state()
-                        history_read_for_round = False
+                        history_read_for_round = self._handle_failed_round("  [X] Stake setting failed")
                         continue
 
                     print("  [OK] Stake set")
-                    time.sleep(0.15)
+                    self.detector.wait_for_state_change(0.15)
 
                     # Place bet
                     print(f"  [CASH] Placing bet...")
@@ -1433,11 +1707,7 @@ class AviatorBotML:
                     )
 
                     if not bet_success:
-                        print(f"  [X] Bet failed: {bet_reason}")
-                        self.stats["rounds_observed"] += 1
-                        self.stats["ml_skipped"] += 1
-                        self._reset_bet_state()
-                        history_read_for_round = False
+                        history_read_for_round = self._handle_failed_round(f"  [X] Bet failed: {bet_reason}")
                         continue
 
                     print("  [OK] Bet placed!")
@@ -1445,37 +1715,14 @@ class AviatorBotML:
                     self.bet_state = "PLACED"
                     self.active_bet_round = round_number
 
-                    time.sleep(0.5)
+                    self.detector.wait_for_state_change(0.5)
 
                     # Wait for game start (using detector)
                     print("\n  [WAIT] Waiting for game start (monitoring detector)...")
                     game_started = self.detector.wait_for_game_start(timeout=15)
 
                     if not game_started:
-                        print("  [WARNING]  Game didn't start - bet cancelled")
-                        self.stats["cancelled_bets"] += 1
-                        self.stats["failed_cashouts"] += 1
-
-                        loss = -stake_used
-                        cumulative_profit += loss
-
-                        self._log_round_result(round_number, "BET", stake_used, "NOSTART",
-                                              loss, 0, signal, self.last_balance, cumulative_profit)
-
-                        self.history_tracker.log_round(
-                            multiplier=0,
-                            bet_placed=True,
-                            stake=stake_used,
-                            cashout_time=0,
-                            profit_loss=loss,
-                            prediction=signal['prediction'],
-                            confidence=signal['confidence'],
-                            pred_range=(0, 0)
-                        )
-
-                        self.current_stake = reset_stake(self.config_manager.initial_stake, self.stats)
-                        self._reset_bet_state()
-                        self.stats["rounds_observed"] += 1
+                        cumulative_profit += self._handle_no_start(round_number, stake_used, signal, cumulative_profit)
                         history_read_for_round = False
                         continue
 
@@ -1499,37 +1746,36 @@ class AviatorBotML:
                         print("  [OK] Cashout command sent!")
                         # Wait for balance to update
                         print("  [WAIT] Validating balance change...")
-                        time.sleep(0.5)
-                        new_balance = self._read_balance()
+                        new_balance = self._read_balance_after_cashout(stake_used)
                         
                         if self.last_balance is not None and new_balance is not None:
                             balance_change = new_balance - self.last_balance
                             if balance_change > 0:
                                 print(f"  [OK] Balance validation: WIN confirmed (+{balance_change:.2f})")
-                                self.stats["successful_cashouts"] += 1
-                                self.stats["current_streak"] += 1
+                                self.stats.successful_cashouts += 1
+                                self.stats.current_streak += 1
                                 profit = balance_change
                                 result_type = "WIN"
                                 self.last_balance = new_balance
                             else:
                                 print(f"  [X] Balance validation: LOST (balance change: {balance_change:.2f})")
-                                self.stats["failed_cashouts"] += 1
-                                self.stats["current_streak"] = 0
+                                self.stats.failed_cashouts += 1
+                                self.stats.current_streak = 0
                                 profit = -stake_used
                                 self.last_balance = new_balance
                         else:
                             print("  [WARNING]  Could not validate balance - assuming win based on cashout success")
-                            self.stats["successful_cashouts"] += 1
-                            self.stats["current_streak"] += 1
+                            self.stats.successful_cashouts += 1
+                            self.stats.current_streak += 1
                             # Estimate profit if balance not readable
-                            profit = stake_used * estimate_multiplier(self.config_manager.cashout_delay) - stake_used
+                            profit = stake_used * self._estimated_mult - stake_used
                             result_type = "WIN"
                             if new_balance:
                                 self.last_balance = new_balance
                     else:
                         print(f"  [X] Cashout failed: {cashout_reason}")
-                        self.stats["failed_cashouts"] += 1
-                        self.stats["current_streak"] = 0
+                        self.stats.failed_cashouts += 1
+                        self.stats.current_streak = 0
                         profit = -stake_used
                     
                     # Wait for round to crash and read final multiplier for logging
@@ -1562,27 +1808,19 @@ class AviatorBotML:
                     self._emit_dashboard_update(round_data)
 
                     # Update stake based on result
-                    if result_type == "WIN":
-                        self.current_stake = increase_stake(
-                            self.current_stake,
-                            self.config_manager.stake_increase_percent,
-                            self.config_manager.max_stake,
-                            self.stats
-                        )
-                    else:
-                        self.current_stake = reset_stake(self.config_manager.initial_stake, self.stats)
+                    self._update_stake(result_type == "WIN")
 
                     self._reset_bet_state()
-                    history_read_for_round = False
+                    # A successful crash read already logged this round; skip re-reading it next round
+                    history_read_for_round = bool(success_read and crash_mult)
                     self.ml_generator.log_highest_multipliers()
-                    self.stats["rounds_observed"] += 1
+                    self.stats.rounds_observed += 1
 
-                    if self.dashboard:
-                        self.dashboard.emit_stats_update()
+                    self._request_stats_update()
                     
                 else: # Should skip
                     self._log_decision("SKIP", signal)
-                    self.stats["ml_skipped"] += 1
+                    self.stats.ml_skipped += 1
 
                     # Still need to observe the round to log history
                     print("\n  [WAIT] Waiting for round to complete (via clipboard/OCR)...")
@@ -1590,31 +1828,21 @@ class AviatorBotML:
 
                     if success_read and observed_mult:
                         print(f"  [OK] Round complete: {observed_mult:.2f}x")
-                        self.stats["rounds_observed"] += 1
+                        self.stats.rounds_observed += 1
                         # Log to history even if skipped
-                        self.history_tracker.log_round(
-                            multiplier=observed_mult,
-                            bet_placed=False,
-                            stake=0,
-                            cashout_time=0,
-                            profit_loss=0,
-                            prediction=signal['prediction'],
-                            confidence=signal['confidence'],
-                            pred_range=(0, 0)
-                        )
-                        round_data = self._create_round_data(observed_mult, False, 0, 0, 0,
-                                                             signal, cumulative_profit, self.last_balance)
-                        self._emit_dashboard_update(round_data)
+                        self._record_observed_round(observed_mult, signal, cumulative_profit, self.last_balance)
                     else:
                         print("  [WARNING]  Could not read round result via clipboard/OCR.")
-                        self.stats["rounds_observed"] += 1 # Still count as observed
+                        self.stats.rounds_observed += 1 # Still count as observed
 
                     self.ml_generator.log_highest_multipliers()
-                    history_read_for_round = False
-                    if self.dashboard:
-                        self.dashboard.emit_stats_update()
+                    history_read_for_round = bool(success_read and observed_mult)
+                    self._request_stats_update()
+
+                # History now includes this round; prepare next round's signal
+                self._prefetch_signal()
 
-                time.sleep(0.3)
+                self.detector.wait_for_state_change(0.3)
 
         except KeyboardInterrupt:
             print("\n\n[STOP]  Bot stopped by user")
@@ -1627,9 +1855,7 @@ class AviatorBotML:
 
     def run_diagnostic_mode(self):
         """Diagnostic mode to test clipboard/OCR multiplier reading."""
-        print("\n" + "="*100)
-        print("[WRENCH] DIAGNOSTIC MODE - Testing Clipboard/OCR Multiplier Reading")
-        print("="*100)
+        _print_banner("[WRENCH] DIAGNOSTIC MODE - Testing Clipboard/OCR Multiplier Reading")
         
         if not self.detector:
             print("[X] GameStateDetector not initialized!")
@@ -1756,6 +1982,8 @@ def main():
        → Best for: Troubleshooting MSS capture issues
        → Uses: MSS multiplier reader (shows success rate)
     """
+    _start_stdout_coalescing()
+
     print("="*100)
     print("AVIATOR BOT - ML MODE WITH HOT RUN")
     print("="*100)
@@ -1823,6 +2051,7 @@ def main():
     delay = input(f"Cashout delay seconds (default {bot.config_manager.cashout_delay}): ").strip()
     if delay:
         bot.config_manager.cashout_delay = float(delay)
+    bot._estimated_mult = estimate_multiplier(bot.config_manager.cashout_delay)
     
     threshold = input(f"ML threshold % (default {bot.ml_generator.confidence_threshold}): ").strip()
     if threshold:
@@ -1864,8 +2093,7 @@ def main():
     if mode_choice == '2':
         mode = 'standard'
         print("\n[TIMER] STANDARD MODE - Time-based cashout")
-        estimated_mult = estimate_multiplier(bot.config_manager.cashout_delay)
-        print(f"[TARGET] Cashout at: {bot.config_manager.cashout_delay}s (~{estimated_mult:.2f}x)")
+        print(f"[TARGET] Cashout at: {bot.config_manager.cashout_delay}s (~{bot._estimated_mult:.2f}x)")
     elif mode_choice == '3':
         mode = 'dry_run'
         print("\n[LOG] DRY RUN MODE - Simulating all decisions WITHOUT real bets")
@@ -1906,57 +2134,59 @@ def main():
     bot.config_manager.save_config()
     
     try:
-    
-    # Pre-run validation for Hot Run mode
-    if mode == 'hot_run':
-        print("\n[CHECK] Running pre-flight checks for Hot Run mode...")
+        # Pre-run validation for Hot Run mode
+        if mode == 'hot_run':
+            print("\n[CHECK] Running pre-flight checks for Hot Run mode...")
         
-        # Check if multiplier reader is working
-        if bot.multiplier_reader:
-            print("[TEST] Testing real-time multiplier reader (3 attempts)...")
-            working = False
-            for i in range(3):
-                try:
-                    test_frame = bot.multiplier_reader.capture_region()
-                    if test_frame is not None:
-                        print(f"  Attempt {i+1}/3: [OK] Capture successful")
-                        working = True
-                        break
-                    else:
-                        print(f"  Attempt {i+1}/3: [X] Capture failed")
-                except Exception as e:
-                    print(f"  Attempt {i+1}/3: [X] Error: {e}")
-                time.sleep(0.5)
+            # Check if multiplier reader is working
+            if bot.multiplier_reader:
+                print("[TEST] Testing real-time multiplier reader (3 attempts)...")
+                working = False
+                for i in range(3):
+                    try:
+                        test_frame = bot.multiplier_reader.capture_region()
+                        if test_frame is not None:
+                            print(f"  Attempt {i+1}/3: [OK] Capture successful")
+                            working = True
+                            break
+                        else:
+                            print(f"  Attempt {i+1}/3: [X] Capture failed")
+                    except Exception as e:
+                        print(f"  Attempt {i+1}/3: [X] Error: {e}")
+                    time.sleep(0.5)
             
-            if not working:
-                print("\n[WARNING] Real-time multiplier reader is not working!")
-                print("[TIP] Possible solutions:")
-                print("  1. Make sure game window is visible and not minimized")
-                print("  2. Run setup again to reconfigure regions")
-                print("  3. Consider using STANDARD MODE instead (time-based)")
-                print("  4. Run DIAGNOSTIC MODE (option 5) to test clipboard/OCR")
+                if not working:
+                    print("\n[WARNING] Real-time multiplier reader is not working!")
+                    print("[TIP] Possible solutions:")
+                    print("  1. Make sure game window is visible and not minimized")
+                    print("  2. Run setup again to reconfigure regions")
+                    print("  3. Consider using STANDARD MODE instead (time-based)")
+                    print("  4. Run DIAGNOSTIC MODE (option 5) to test clipboard/OCR")
                 
-                response = input("\nContinue anyway? (y/n): ").strip().lower()
-                if response != 'y':
-                    print("[STOP] Exiting...")
-                    return
+                    response = input("\nContinue anyway? (y/n): ").strip().lower()
+                    if response != 'y':
+                        print("[STOP] Exiting...")
+                        return
         
-        print("[OK] Pre-flight checks passed!\n")
-
-    if mode == 'observation':
-        bot.run_observation_mode()
-    elif mode == 'dry_run':
-        bot.run_dry_run_mode()
-    elif mode == 'hot_run':
-        bot.run_hot_run_mode()
-    else: # Default to standard mode if no valid choice or '2'
-        bot.run_ml_mode()
+            print("[OK] Pre-flight checks passed!\n")
+
+        if mode == 'observation':
+            bot.run_observation_mode()
+        elif mode == 'dry_run':
+            bot.run_dry_run_mode()
+        elif mode == 'hot_run':
+            bot.run_hot_run_mode()
+        else: # Default to standard mode if no valid choice or '2'
+            bot.run_ml_mode()
     
     except KeyboardInterrupt:
         print("\n\n⏹️ Bot stopped by user")
     finally:
-        # Stop cloud sync on exit
+        # Stop cloud sync and flush pending history rows to disk on exit
         bot.history_tracker.stop_cloud_sync()
+        bot.history_tracker.stop_async_writer()
+        if bot.multiplier_reader:
+            bot.multiplier_reader.stop_prefetch()
 
 
 if __name__ == "__main__":
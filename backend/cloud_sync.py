@@ -4,10 +4,16 @@ Automatically syncs aviator_rounds_history.csv to Google Sheets
 """
 
 import os
+import csv
 import time
-import pandas as pd
+import random
+import zlib
+import gzip
 import threading
+import functools
 from datetime import datetime
+from queue import Queue, Empty
+from urllib.parse import quote
 import json
 
 try:
@@ -18,9 +24,105 @@ except ImportError:
     GSPREAD_AVAILABLE = False
     print("⚠️ Google Sheets sync disabled. Install: pip install gspread google-auth")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(obj):
+    """Serialize obj as indented JSON text (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or text (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+
+if WATCHDOG_AVAILABLE:
+    class _CsvChangeHandler(FileSystemEventHandler):
+        """Queue a token whenever the watched CSV is written or replaced."""
+
+        def __init__(self, csv_path, changes):
+            super().__init__()
+            self.csv_path = csv_path
+            self.changes = changes
+
+        def on_any_event(self, event):
+            paths = (event.src_path, getattr(event, 'dest_path', None))
+            if any(path and os.path.abspath(path) == self.csv_path for path in paths):
+                self.changes.put(True)
+
+
+# Sheets API statuses worth retrying (rate limit and transient server errors)
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+# Appends at least this large are JSON-encoded by orjson up front instead
+# of by the HTTP layer's stdlib encoder, and sent gzip-compressed
+BULK_ENCODE_ROWS = 1000
+
+
+def _call_with_retry(fn, *args, max_attempts=6, **kwargs):
+    """
+    Call a Sheets API function, backing off on rate limits and server errors.
+
+    Sheets sends 429 without a Retry-After header, so waits grow as
+    2**attempt seconds plus jitter. Other errors are raised immediately.
+
+    Args:
+        fn: gspread call to make
+        *args: Positional arguments for fn
+        max_attempts: Attempts before giving up
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Whatever fn returns
+    """
+    for attempt in range(max_attempts):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            retryable = (
+                GSPREAD_AVAILABLE
+                and isinstance(e, gspread.exceptions.APIError)
+                and getattr(e.response, 'status_code', None) in RETRYABLE_STATUS
+            )
+            if not retryable or attempt == max_attempts - 1:
+                raise
+            delay = 2 ** attempt + random.uniform(0, 0.25)
+            print(f"⚠️ Sheets API busy ({e.response.status_code}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def _serialized(method):
+    """Run a CloudSync method under the instance's API lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._api_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class CloudSync:
     """Sync CSV data to Google Sheets in real-time."""
+
+    # Authorized gspread clients shared across instances, keyed by
+    # credentials file; each keeps its HTTP session (and connections) alive
+    _clients = {}
+    _clients_lock = threading.Lock()
     
     def __init__(self, csv_file="aviator_rounds_history.csv", sync_interval=10):
         """
@@ -36,6 +138,27 @@ class CloudSync:
         self.sync_thread = None
         self.last_sync_time = 0
         self.last_row_count = 0
+
+        # Serializes Sheets API calls across the sync, upload and manual
+        # paths; reentrant because a sync may fall back to a full upload
+        self._api_lock = threading.RLock()
+
+        # File-change events from watchdog (None when polling)
+        self.observer = None
+        self.changes = None
+
+        # New rows waiting for upload as (generation, rows, byte offset past
+        # them); the read cursor runs ahead of byte_cursor while uploads are
+        # in flight. Full and direct syncs bump the generation, so batches
+        # read before them are discarded instead of appended twice
+        self.flush_window = 0.5
+        self._pending = Queue()
+        self._generation = 0
+        self._cursor_lock = threading.RLock()
+        self._read_cursor = 0
+        self.upload_thread = None
+        # CSV size at the last look; an unchanged size means nothing to read
+        self._last_seen_size = None
         
         # Google Sheets setup
         self.gc = None
@@ -46,15 +169,18 @@ class CloudSync:
         self.config_file = "cloud_sync_config.json"
         self.config = self.load_config()
         
-        # Set your specific spreadsheet ID
-        self.config["spreadsheet_id"] = "1cSluu2sjFA9WZU3fhS2NV220-rBEsy6cQL4Ol4xz31s"
+        # Byte offset in the CSV up to which rows are already in the sheet,
+        # and how many data rows that is; both survive restarts
+        self.byte_cursor = self.config.get("byte_cursor", 0)
+        self.last_row_count = self.config.get("last_row_count", 0)
+        self._read_cursor = self.byte_cursor
     
     def load_config(self):
         """Load sync configuration."""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    return _json_loads(f.read())
         except:
             pass
         return {
@@ -67,11 +193,18 @@ class CloudSync:
     def save_config(self):
         """Save sync configuration."""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Write a temp file and swap it in, so a crash mid-write never
+            # leaves a truncated config (and a lost sync cursor) behind
+            tmp_file = self.config_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                f.write(_json_dumps(self.config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             print(f"Error saving config: {e}")
     
+    @_serialized
     def setup_google_sheets(self):
         """Setup Google Sheets connection."""
         if not GSPREAD_AVAILABLE:
@@ -98,8 +231,7 @@ class CloudSync:
                 'https://www.googleapis.com/auth/drive'
             ]
             
-            creds = Credentials.from_service_account_file(creds_file, scopes=scope)
-            self.gc = gspread.authorize(creds)
+            self.gc = self._get_client(creds_file, scope)
             
             # Setup spreadsheet
             if self.config.get("spreadsheet_id"):
@@ -119,6 +251,7 @@ class CloudSync:
             
             # Get or create worksheet
             worksheet_name = self.config.get("worksheet_name", "Aviator_Data")
+            created = False
             try:
                 self.worksheet = spreadsheet.worksheet(worksheet_name)
             except:
@@ -127,6 +260,15 @@ class CloudSync:
                     rows=1000, 
                     cols=20
                 )
+                created = True
+            
+            # The saved cursor only describes the sheet and CSV it was
+            # reached with; anything else starts again with a full upload
+            target = f"{spreadsheet.id}/{worksheet_name}/{os.path.abspath(self.csv_file)}"
+            if created or self.config.get("sync_target") != target:
+                self._reset_cursor()
+                self.config["sync_target"] = target
+                self.save_config()
             
             self.spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet.id}"
             print(f"✅ Google Sheets connected: {self.spreadsheet_url}")
@@ -135,8 +277,34 @@ class CloudSync:
             
         except Exception as e:
             print(f"❌ Error setting up Google Sheets: {e}")
+            # Re-authorize next time if the cached client's auth was rejected
+            if (isinstance(e, gspread.exceptions.APIError)
+                    and getattr(e.response, 'status_code', None) in (401, 403)):
+                with self._clients_lock:
+                    self._clients.pop(self.config.get("credentials_file", "credentials.json"), None)
             return False
     
+    @classmethod
+    def _get_client(cls, creds_file, scope):
+        """
+        Get the shared authorized gspread client for a credentials file.
+
+        Args:
+            creds_file: Service account JSON path
+            scope: OAuth scopes to authorize
+
+        Returns:
+            gspread.Client: Authorized client, created on first use
+        """
+        with cls._clients_lock:
+            client = cls._clients.get(creds_file)
+            if client is None:
+                creds = Credentials.from_service_account_file(creds_file, scopes=scope)
+                client = gspread.authorize(creds)
+                cls._clients[creds_file] = client
+            return client
+    
+    @_serialized
     def create_new_spreadsheet(self):
         """Create a new Google Spreadsheet."""
         try:
@@ -154,46 +322,55 @@ class CloudSync:
             print(f"❌ Error creating spreadsheet: {e}")
             return None
     
-    def sync_to_sheets(self):
-        """Sync CSV data to Google Sheets."""
+    @_serialized
+    def sync_to_sheets(self, force=False):
+        """
+        Upload the whole CSV to Google Sheets, replacing the sheet contents.
+
+        Only used for manual syncs and to bootstrap the sheet; steady-state
+        syncing sends just the new rows (see sync_new_rows_only).
+
+        Args:
+            force: Upload even if no rows were added since the last sync
+
+        Returns:
+            bool: True if the sheet was written
+        """
         if not self.worksheet:
             return False
         
+        # Rows queued or in flight are covered by this upload (or re-read
+        # from byte_cursor if it fails)
+        self._invalidate_uploads()
         try:
             # Check if CSV exists and has new data
             if not os.path.exists(self.csv_file):
                 return False
             
-            # Read CSV
-            df = pd.read_csv(self.csv_file)
-            if df.empty:
+            # Nothing appended since the last upload
+            if (not force and self.last_row_count
+                    and os.path.getsize(self.csv_file) == self.byte_cursor):
+                return False
+            
+            # Read complete lines only, so the cursor lands on a row boundary
+            values, end = self._read_rows_from(0)
+            if len(values) < 2:
                 return False
             
             # Check if there's new data
-            current_row_count = len(df)
-            if current_row_count <= self.last_row_count:
+            current_row_count = len(values) - 1  # Minus the header
+            if not force and current_row_count <= self.last_row_count:
                 return False  # No new data
             
-            # Prepare data for upload
-            # Convert DataFrame to list of lists (Google Sheets format)
-            headers = df.columns.tolist()
-            data = df.values.tolist()
-            
-            # Clear existing data and upload fresh data
-            self.worksheet.clear()
-            
-            # Upload headers
-            self.worksheet.append_row(headers)
-            
-            # Upload data in batches (Google Sheets has rate limits)
-            batch_size = 100
-            for i in range(0, len(data), batch_size):
-                batch = data[i:i + batch_size]
-                self.worksheet.append_rows(batch)
-                time.sleep(0.1)  # Small delay to avoid rate limits
+            # Size the sheet to the data (drops stale rows from a longer
+            # previous upload), then write everything in one request
+            _call_with_retry(self.worksheet.resize, rows=len(values))
+            self._write_ranges([(self.worksheet.title, 1, values)])
             
             self.last_row_count = current_row_count
             self.last_sync_time = time.time()
+            self.config["header_checksum"] = self._header_checksum()
+            self._save_cursor(end)
             
             print(f"✅ Synced {current_row_count} rows to Google Sheets")
             return True
@@ -201,40 +378,59 @@ class CloudSync:
         except Exception as e:
             print(f"❌ Error syncing to Google Sheets: {e}")
             return False
+        finally:
+            self._rewind_reads()
     
+    @_serialized
     def sync_new_rows_only(self):
-        """Sync only new rows to Google Sheets (more efficient)."""
+        """
+        Sync only new rows to Google Sheets (more efficient).
+
+        Reads the CSV from the saved byte cursor, so each call costs only the
+        bytes appended since the last sync. Falls back to a full upload on the
+        first sync, when the file shrank (cleaned or rotated) or when its
+        header changed.
+        """
         if not self.worksheet:
             return False
         
         try:
-            # Check if CSV exists
-            if not os.path.exists(self.csv_file):
-                return False
-            
-            # Read CSV
-            df = pd.read_csv(self.csv_file)
-            if df.empty:
+            # One stat decides the common idle tick
+            try:
+                size = os.stat(self.csv_file).st_size
+            except FileNotFoundError:
                 return False
+            if size == self._last_seen_size:
+                return False  # No new data
             
-            current_row_count = len(df)
-            
-            # If first sync, upload all data
-            if self.last_row_count == 0:
-                return self.sync_to_sheets()
+            # Take over from the upload thread: rows it has queued past
+            # byte_cursor are read again below
+            self._invalidate_uploads()
+            self._rewind_reads()
             
-            # Check for new rows
-            if current_row_count <= self.last_row_count:
-                return False  # No new data
+            # If first sync or the file was rewritten, upload all data
+            if self._needs_bootstrap(self.byte_cursor, size):
+                synced = self._bootstrap_upload()
+                if synced:
+                    self._last_seen_size = size
+                return synced
             
-            # Get only new rows
-            new_rows = df.iloc[self.last_row_count:].values.tolist()
+            new_rows, end = self._read_rows_from(self.byte_cursor)
+            if end == self.byte_cursor:
+                self._last_seen_size = size  # Only a partial row so far
+                return False
             
-            # Append new rows
-            self.worksheet.append_rows(new_rows)
+            # Append new rows in a single request; values are CSV text, so let
+            # Sheets parse numbers and booleans as it would on manual entry
+            if new_rows:
+                self._append_rows(new_rows)
             
-            self.last_row_count = current_row_count
+            self.last_row_count += len(new_rows)
             self.last_sync_time = time.time()
+            self._save_cursor(end)
+            with self._cursor_lock:
+                self._read_cursor = end
+                self._last_seen_size = size
             
             print(f"✅ Synced {len(new_rows)} new rows to Google Sheets")
             return True
@@ -243,21 +439,326 @@ class CloudSync:
             print(f"❌ Error syncing new rows: {e}")
             return False
     
+    def _write_ranges(self, ranges):
+        """
+        Write blocks of rows to one or more worksheets of the spreadsheet.
+
+        Several blocks go out as a single values.batchUpdate, so a sync
+        costs one request however many worksheets it touches.
+
+        Args:
+            ranges: List of (worksheet title, first row, rows) tuples
+        """
+        spreadsheet = self.worksheet.spreadsheet
+        data = [
+            {"range": f"'{title}'!A{start}", "majorDimension": "ROWS", "values": rows}
+            for title, start, rows in ranges
+        ]
+        if len(data) == 1:
+            _call_with_retry(
+                spreadsheet.values_update,
+                data[0]["range"],
+                params={"valueInputOption": "USER_ENTERED"},
+                body=data[0]
+            )
+        else:
+            _call_with_retry(
+                spreadsheet.values_batch_update,
+                body={"valueInputOption": "USER_ENTERED", "data": data}
+            )
+    
+    def _append_rows(self, rows):
+        """
+        Append rows below the sheet's data table in one request.
+
+        Large batches are encoded with orjson and posted as a ready-made,
+        gzip-compressed body (CSV values shrink several times over); smaller
+        ones go through gspread's append_rows.
+
+        Args:
+            rows: List of row value lists
+        """
+        if not ORJSON_AVAILABLE or len(rows) < BULK_ENCODE_ROWS:
+            _call_with_retry(self.worksheet.append_rows, rows, value_input_option="USER_ENTERED", table_range="A1")
+            return
+        
+        body = gzip.compress(orjson.dumps({"majorDimension": "ROWS", "values": rows}), compresslevel=6)
+        table_range = quote(f"'{self.worksheet.title}'!A1")
+        url = (f"https://sheets.googleapis.com/v4/spreadsheets/"
+               f"{self.worksheet.spreadsheet.id}/values/{table_range}:append")
+        _call_with_retry(
+            self.worksheet.client.request,
+            "post",
+            url,
+            params={"valueInputOption": "USER_ENTERED"},
+            data=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        )
+    
+    def _header_checksum(self):
+        """
+        Checksum the CSV header line, to notice schema changes.
+
+        Returns:
+            int: CRC32 of the first line
+        """
+        with open(self.csv_file, 'rb') as f:
+            return zlib.crc32(f.readline())
+    
+    def _needs_bootstrap(self, cursor, size):
+        """
+        Check whether appending from cursor would leave the sheet wrong.
+
+        Args:
+            cursor: Byte offset the next append would read from
+            size: Current CSV size in bytes
+
+        Returns:
+            bool: True if the whole CSV must be uploaded again
+        """
+        if cursor == 0 or size < cursor:
+            return True
+        return self._header_checksum() != self.config.get("header_checksum")
+    
+    def _bootstrap_upload(self):
+        """
+        Replace the sheet with the full CSV and restart the cursors there.
+
+        Returns:
+            bool: True if the upload succeeded
+        """
+        return self.sync_to_sheets(force=True)
+    
+    def _read_rows_from(self, cursor):
+        """
+        Parse the complete CSV lines appended after a byte offset.
+
+        A row still being written is left for the next read.
+
+        Args:
+            cursor: Byte offset to start reading at
+
+        Returns:
+            Tuple (list, int): (rows, byte offset just past the last complete row)
+        """
+        consumed = 0
+        
+        def complete_lines(f):
+            # Stream lines straight into the parser instead of buffering
+            # the whole tail as bytes, then text, then a StringIO
+            nonlocal consumed
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Row still being written
+                consumed += len(line)
+                yield line.decode('utf-8')
+        
+        with open(self.csv_file, 'rb') as f:
+            f.seek(cursor)
+            rows = [row for row in csv.reader(complete_lines(f)) if row]
+        return rows, cursor + consumed
+    
+    def _queue_new_rows(self):
+        """
+        Queue rows appended since the last read for the upload thread.
+
+        The first sync and a shrunken file still go through a full upload
+        here, once everything already queued has been dropped.
+        """
+        if not self.worksheet:
+            return
+        
+        with self._cursor_lock:
+            try:
+                size = os.stat(self.csv_file).st_size
+            except FileNotFoundError:
+                return
+            if size == self._last_seen_size:
+                return
+            
+            if self._needs_bootstrap(self._read_cursor, size):
+                if self._bootstrap_upload():
+                    self._last_seen_size = size
+                return
+            
+            rows, end = self._read_rows_from(self._read_cursor)
+            if rows:
+                self._pending.put((self._generation, rows, end))
+            self._read_cursor = end
+            self._last_seen_size = size
+    
+    def _invalidate_uploads(self):
+        """
+        Discard queued batches and any batch the upload thread already holds.
+
+        Call with _api_lock held, before a sync that writes the sheet itself.
+        """
+        with self._cursor_lock:
+            self._generation += 1
+            self._drop_pending()
+    
+    def _rewind_reads(self):
+        """Read again from byte_cursor (the end of what the sheet holds)."""
+        with self._cursor_lock:
+            self._read_cursor = self.byte_cursor
+            self._last_seen_size = None
+    
+    def _drop_pending(self):
+        """Discard queued uploads so their rows are read again from byte_cursor."""
+        while True:
+            try:
+                self._pending.get_nowait()
+            except Empty:
+                break
+    
+    def upload_loop(self):
+        """
+        Upload queued rows in background, one append per flush window.
+
+        Waits briefly after the first queued batch so a burst of writes goes
+        up as a single append request. On failure the queue is dropped and
+        the read cursor rewinds to the last uploaded row, keeping the sheet
+        in CSV order.
+        """
+        stop = False
+        while not stop:
+            generation, rows, end = self._pending.get()
+            if rows is None:  # Shutdown signal
+                break
+            
+            time.sleep(self.flush_window)
+            batch = list(rows)
+            while True:
+                try:
+                    more_generation, more, more_end = self._pending.get_nowait()
+                except Empty:
+                    break
+                if more is None:
+                    stop = True  # Flush this batch, then exit
+                    break
+                if more_generation != generation:
+                    # Read after a full sync; what was collected so far is stale
+                    generation, batch = more_generation, []
+                batch.extend(more)
+                end = more_end
+            
+            with self._api_lock:
+                if generation != self._generation:
+                    continue  # A full or direct sync already covered these rows
+                try:
+                    self._append_rows(batch)
+                    self.last_row_count += len(batch)
+                    self.last_sync_time = time.time()
+                    self._save_cursor(end)
+                    print(f"✅ Synced {len(batch)} new rows to Google Sheets")
+                except Exception as e:
+                    print(f"❌ Error syncing new rows: {e}")
+                    self._invalidate_uploads()
+                    self._rewind_reads()
+                    if self.changes is not None:
+                        self.changes.put(True)  # Retry without waiting for the next write
+    
+    def _reset_cursor(self):
+        """Forget what was uploaded, so the next sync uploads the whole CSV."""
+        self._invalidate_uploads()
+        self.last_row_count = 0
+        self.config.pop("header_checksum", None)
+        self._save_cursor(0)
+        self._rewind_reads()
+    
+    def _save_cursor(self, byte_cursor):
+        """
+        Persist the CSV byte offset and row count reached by the last
+        successful sync.
+
+        Args:
+            byte_cursor: Offset just past the last uploaded row
+        """
+        self.byte_cursor = byte_cursor
+        self.config["byte_cursor"] = byte_cursor
+        self.config["last_row_count"] = self.last_row_count
+        self.save_config()
+    
     def sync_loop(self):
-        """Main sync loop running in background thread."""
-        print(f"🔄 Starting cloud sync (every {self.sync_interval}s)")
+        """
+        Main sync loop running in background thread.
+
+        With watchdog, sleeps until the CSV changes and syncs at most once
+        per sync_interval, folding events that arrive meanwhile into one
+        sync. Without it, polls every sync_interval.
+        """
+        changes = self.changes
+        if changes is not None:
+            print(f"🔄 Starting cloud sync (on file change, at most every {self.sync_interval}s)")
+        else:
+            print(f"🔄 Starting cloud sync (every {self.sync_interval}s)")
         
+        last_attempt = 0
         while self.is_running:
             try:
-                if self.config.get("auto_sync", True):
-                    self.sync_new_rows_only()
+                if changes is not None:
+                    try:
+                        changes.get(timeout=self.sync_interval)
+                    except Empty:
+                        continue
+                    
+                    # Debounce, then drain events that arrived while waiting
+                    wait = last_attempt + self.sync_interval - time.time()
+                    if wait > 0:
+                        time.sleep(wait)
+                    while True:
+                        try:
+                            changes.get_nowait()
+                        except Empty:
+                            break
+                    if not self.is_running:
+                        break
                 
-                time.sleep(self.sync_interval)
+                # Skip this tick rather than queue behind a manual sync
+                if self.config.get("auto_sync", True) and self._api_lock.acquire(blocking=False):
+                    try:
+                        self._queue_new_rows()
+                    finally:
+                        self._api_lock.release()
+                last_attempt = time.time()
+                
+                if changes is None:
+                    time.sleep(self.sync_interval)
                 
             except Exception as e:
                 print(f"❌ Error in sync loop: {e}")
                 time.sleep(self.sync_interval)
     
+    def _start_watching(self):
+        """
+        Watch the CSV's directory for changes if watchdog is available.
+
+        Returns:
+            bool: True if file events are being delivered
+        """
+        if not WATCHDOG_AVAILABLE:
+            return False
+        
+        try:
+            csv_path = os.path.abspath(self.csv_file)
+            self.changes = Queue()
+            self.observer = Observer()
+            self.observer.schedule(
+                _CsvChangeHandler(csv_path, self.changes),
+                os.path.dirname(csv_path),
+                recursive=False
+            )
+            self.observer.daemon = True
+            self.observer.start()
+            # Pick up rows written before the watcher started
+            self.changes.put(True)
+            return True
+        except Exception as e:
+            print(f"⚠️ File watching unavailable, falling back to polling: {e}")
+            self.observer = None
+            self.changes = None
+            return False
+    
     def start_sync(self):
         """Start background sync thread."""
         if not self.setup_google_sheets():
@@ -269,8 +770,14 @@ class CloudSync:
             return True
         
         self.is_running = True
+        with self._api_lock:
+            self._invalidate_uploads()
+            self._rewind_reads()
+        self._start_watching()
         self.sync_thread = threading.Thread(target=self.sync_loop, daemon=True)
         self.sync_thread.start()
+        self.upload_thread = threading.Thread(target=self.upload_loop, daemon=True)
+        self.upload_thread.start()
         
         print(f"✅ Cloud sync started")
         print(f"📊 Spreadsheet: {self.spreadsheet_url}")
@@ -279,8 +786,18 @@ class CloudSync:
     def stop_sync(self):
         """Stop background sync."""
         self.is_running = False
+        if self.observer:
+            self.observer.stop()
+            self.observer.join(timeout=5)
+            self.observer = None
+        if self.changes is not None:
+            self.changes.put(True)  # Wake the sync loop so it can exit
         if self.sync_thread:
             self.sync_thread.join(timeout=5)
+        self._pending.put((None, None, None))  # Wake the upload loop so it can exit
+        if self.upload_thread:
+            self.upload_thread.join(timeout=5)
+        self.changes = None
         print("⏹️ Cloud sync stopped")
     
     def manual_sync(self):
@@ -289,7 +806,7 @@ class CloudSync:
             if not self.setup_google_sheets():
                 return False
         
-        return self.sync_to_sheets()
+        return self.sync_to_sheets(force=True)
     
     def get_status(self):
         """Get sync status."""
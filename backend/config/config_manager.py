@@ -2,13 +2,78 @@
 
 import json
 import os
-import time
-import pyautogui
-import keyboard
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(obj):
+    """Serialize obj as indented UTF-8 JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or text (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class ConfigManager:
     """Manages bot configuration including coordinates and settings."""
+
+    # Parsed config files: path -> (st_mtime_ns, st_size, config dict)
+    _parsed_cache = {}
+
+    # Top-level scalar settings and their defaults; __init__, save_config
+    # and load_config all go through this table
+    _DEFAULTS = {
+        "cashout_delay": 2.0,
+        "initial_stake": 25,
+        "max_stake": 1000,
+        "stake_increase_percent": 20,
+        "safety_margin": 0.9,  # Safety margin (10% reduction)
+        "positive_cycle_threshold": 3,  # Win streak needed to activate Position 2
+        "position2_max_consecutive_losses": 3,  # Disable Position 2 after 3 losses
+        "verbose_mode": False,  # Enable/disable verbose logging
+        "clean_output": True,  # Minimal console output
+        "betting_mode": "ml",  # "ml" = ML decides both bet and multiplier, "user" = User sets threshold
+        "min_prediction_threshold": 1.5,  # Minimum multiplier all models must predict (for "user" mode)
+        "min_models_to_pass": 2,  # Minimum number of models that must exceed threshold (for "user" mode)
+    }
+
+    # Scalar settings included in get_config_dict
+    _CONFIG_DICT_KEYS = (
+        "cashout_delay",
+        "initial_stake",
+        "max_stake",
+        "stake_increase_percent",
+        "safety_margin",
+        "positive_cycle_threshold",
+        "position2_max_consecutive_losses",
+    )
+
+    # Screen coordinates and regions stored as JSON lists: attribute,
+    # config section (None for top level) and key within it
+    _COORD_FIELDS = (
+        ("stake_coords", "position1", "stake_coords"),
+        ("bet_button_coords", "position1", "bet_button_coords"),
+        ("cashout_coords", "position1", "cashout_coords"),
+        ("position2_stake_coords", "position2", "stake_coords"),
+        ("position2_bet_button_coords", "position2", "bet_button_coords"),
+        ("position2_cashout_coords", "position2", "cashout_coords"),
+        ("multiplier_region", None, "multiplier_region"),
+        ("balance_region", None, "balance_region"),
+        ("history_region", None, "history_region"),
+    )
     
     def __init__(self, config_file="aviator_ml_config.json"):
         """
@@ -17,6 +82,14 @@ class ConfigManager:
         Args:
             config_file: Path to configuration file
         """
+        # Memoized save_config JSON and get_config_dict output, reset by __setattr__
+        self._saved_json = None
+        # Settings changed since the last successful save
+        self._dirty = True
+        self._config_dict = None
+        # Open batched_saves() blocks, and whether a save is owed when they close
+        self._save_depth = 0
+        self._save_pending = False
         self.config_file = config_file
         # Position 1 (Main)
         self.stake_coords = None
@@ -33,64 +106,91 @@ class ConfigManager:
         self.multiplier_region = None
         self.balance_region = None  # NEW: Balance region
         self.history_region = None
-        self.cashout_delay = 2.0
-        self.initial_stake = 25
-        self.max_stake = 1000
-        self.stake_increase_percent = 20
-        self.safety_margin = 0.9  # NEW: Safety margin (10% reduction)
-        self.positive_cycle_threshold = 3  # Win streak needed to activate Position 2
-        self.position2_max_consecutive_losses = 3  # Disable Position 2 after 3 losses
-        self.verbose_mode = False  # Enable/disable verbose logging
-        self.clean_output = True  # Minimal console output
-        self.betting_mode = "ml"  # "ml" = ML decides both bet and multiplier, "user" = User sets threshold
-        self.min_prediction_threshold = 1.5  # Minimum multiplier all models must predict (for "user" mode)
-        self.min_models_to_pass = 2  # Minimum number of models that must exceed threshold (for "user" mode)
+        self.__dict__.update(self._DEFAULTS)
         # Model selection for predictions
         self.selected_models = None  # List of model names to display
         self.model_names = {}  # Mapping of model names for display
 
+    def __setattr__(self, name, value):
+        # Any public setting change invalidates the memoized config dicts
+        if not name.startswith('_'):
+            self.__dict__['_dirty'] = True
+            self.__dict__['_saved_json'] = None
+            self.__dict__['_config_dict'] = None
+        object.__setattr__(self, name, value)
+
     def save_config(self):
-        """Save configuration to JSON file."""
+        """Save configuration to JSON file (deferred inside batched_saves)."""
+        if self._save_depth:
+            self._save_pending = True
+            return True
+
+        # Nothing changed since the last save and the file is still there
+        if not self._dirty and os.path.exists(self.config_file):
+            return True
+
+        if self._saved_json is None:
+            self._saved_json = _json_dumps(self._build_saved_config())
+
+        try:
+            # Write a temp file and swap it in, so a crash mid-write never
+            # leaves a truncated config behind. The payload is already
+            # encoded, so it goes out in one unbuffered write
+            tmp_file = self.config_file + ".tmp"
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                payload = memoryview(self._saved_json)
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
+            return True
+        except Exception as e:
+            print(f"Error saving config: {e}")
+            return False
+
+    @contextmanager
+    def batched_saves(self):
+        """
+        Collapse every save_config call made inside the block into one write.
+
+        Blocks may nest; the write happens when the outermost one exits, and
+        only if something asked to save.
+        """
+        self._save_depth += 1
+        try:
+            yield self
+        finally:
+            self._save_depth -= 1
+            if not self._save_depth and self._save_pending:
+                self._save_pending = False
+                self.save_config()
+
+    def _build_saved_config(self):
+        """
+        Build the dict written by save_config.
+
+        Returns:
+            dict: JSON-ready configuration
+        """
         config = {
-            "position1": {
-                "stake_coords": list(self.stake_coords) if self.stake_coords else None,
-                "bet_button_coords": list(self.bet_button_coords) if self.bet_button_coords else None,
-                "cashout_coords": list(self.cashout_coords) if self.cashout_coords else None
-            },
+            "position1": {},
             "position2": {
                 "enabled": self.position2_enabled,
-                "stake_coords": list(self.position2_stake_coords) if self.position2_stake_coords else None,
-                "bet_button_coords": list(self.position2_bet_button_coords) if self.position2_bet_button_coords else None,
-                "cashout_coords": list(self.position2_cashout_coords) if self.position2_cashout_coords else None,
                 "stake_amount": self.position2_stake_amount,
                 "target_multiplier": self.position2_target_multiplier
             },
-            "multiplier_region": list(self.multiplier_region) if self.multiplier_region else None,
-            "balance_region": list(self.balance_region) if self.balance_region else None,
-            "history_region": list(self.history_region) if self.history_region else None,
-            "cashout_delay": self.cashout_delay,
-            "initial_stake": self.initial_stake,
-            "max_stake": self.max_stake,
-            "stake_increase_percent": self.stake_increase_percent,
-            "safety_margin": self.safety_margin,
-            "positive_cycle_threshold": self.positive_cycle_threshold,
-            "position2_max_consecutive_losses": self.position2_max_consecutive_losses,
-            "verbose_mode": self.verbose_mode,
-            "clean_output": self.clean_output,
-            "betting_mode": self.betting_mode,
-            "min_prediction_threshold": self.min_prediction_threshold,
-            "min_models_to_pass": self.min_models_to_pass,
-            "selected_models": self.selected_models,
-            "model_names": self.model_names
         }
-
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error saving config: {e}")
-            return False
+        for attr, section, key in self._COORD_FIELDS:
+            value = getattr(self, attr)
+            (config[section] if section else config)[key] = list(value) if value else None
+        config.update({key: getattr(self, key) for key in self._DEFAULTS})
+        config["selected_models"] = self.selected_models
+        config["model_names"] = self.model_names
+        return config
     
     def load_config(self):
         """
@@ -99,124 +199,142 @@ class ConfigManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not os.path.exists(self.config_file):
-            return False
-
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-
-            # Load Position 1 coordinates (support both old and new format)
-            if "position1" in config:
-                pos1 = config["position1"]
-                self.stake_coords = tuple(pos1["stake_coords"]) if pos1.get("stake_coords") else None
-                self.bet_button_coords = tuple(pos1["bet_button_coords"]) if pos1.get("bet_button_coords") else None
-                self.cashout_coords = tuple(pos1["cashout_coords"]) if pos1.get("cashout_coords") else None
-            else:
-                # Backward compatibility: old format without position1 key
-                self.stake_coords = tuple(config["stake_coords"]) if config.get("stake_coords") else None
-                self.bet_button_coords = tuple(config["bet_button_coords"]) if config.get("bet_button_coords") else None
-                self.cashout_coords = tuple(config["cashout_coords"]) if config.get("cashout_coords") else None
-
-            # Load Position 2 coordinates and settings
+            config = self._read_config_file()
+
+            # Load coordinates and regions
+            for attr, section, key in self._COORD_FIELDS:
+                if section is None:
+                    source = config
+                elif section in config:
+                    source = config[section]
+                elif section == "position1":
+                    source = config  # Backward compatibility: old flat format
+                else:
+                    continue  # No Position 2 block; keep current values
+                value = source.get(key)
+                setattr(self, attr, tuple(value) if value else None)
+
+            # Load Position 2 settings
             if "position2" in config:
                 pos2 = config["position2"]
                 self.position2_enabled = pos2.get("enabled", False)
-                self.position2_stake_coords = tuple(pos2["stake_coords"]) if pos2.get("stake_coords") else None
-                self.position2_bet_button_coords = tuple(pos2["bet_button_coords"]) if pos2.get("bet_button_coords") else None
-                self.position2_cashout_coords = tuple(pos2["cashout_coords"]) if pos2.get("cashout_coords") else None
                 self.position2_stake_amount = pos2.get("stake_amount", 5)
                 self.position2_target_multiplier = pos2.get("target_multiplier", 10.0)
 
             # Load general settings
-            self.multiplier_region = tuple(config["multiplier_region"]) if config.get("multiplier_region") else None
-            self.balance_region = tuple(config["balance_region"]) if config.get("balance_region") else None
-            self.history_region = tuple(config["history_region"]) if config.get("history_region") else None
-            self.cashout_delay = config.get("cashout_delay", 2.0)
-            self.initial_stake = config.get("initial_stake", 25)
-            self.max_stake = config.get("max_stake", 1000)
-            self.stake_increase_percent = config.get("stake_increase_percent", 20)
-            self.safety_margin = config.get("safety_margin", 0.9)
-            self.positive_cycle_threshold = config.get("positive_cycle_threshold", 3)
-            self.position2_max_consecutive_losses = config.get("position2_max_consecutive_losses", 3)
-            self.verbose_mode = config.get("verbose_mode", False)
-            self.clean_output = config.get("clean_output", True)
-            self.betting_mode = config.get("betting_mode", "ml")
-            self.min_prediction_threshold = config.get("min_prediction_threshold", 1.5)
-            self.min_models_to_pass = config.get("min_models_to_pass", 2)
+            self.__dict__.update({key: config.get(key, default) for key, default in self._DEFAULTS.items()})
 
             # Load model selection
-            self.selected_models = config.get("selected_models")
-            self.model_names = config.get("model_names", {})
+            selected_models = config.get("selected_models")
+            self.selected_models = list(selected_models) if selected_models is not None else None
+            self.model_names = dict(config.get("model_names", {}))
 
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"Error loading config: {e}")
             return False
     
+    def _read_config_file(self):
+        """
+        Parse the config file, reusing the last parse while it is unchanged.
+
+        Returns:
+            dict: Parsed configuration (shared; do not mutate)
+
+        Raises:
+            FileNotFoundError: If the config file does not exist
+        """
+        path = os.path.abspath(self.config_file)
+        # Open first and stat the descriptor: one lookup of the path, and
+        # the stat and the read are guaranteed to see the same file
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            # Size too, since a rewrite within the mtime granularity keeps st_mtime_ns
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._parsed_cache.get(path)
+            if cached is not None and cached[:2] == key:
+                return cached[2]
+
+            with os.fdopen(fd, 'rb', closefd=False) as f:
+                config = _json_loads(f.read())
+        finally:
+            os.close(fd)
+        self._parsed_cache[path] = (*key, config)
+        return config
+    
+    @staticmethod
+    def _capture_position(prompt, pressed):
+        """
+        Show a prompt and return the mouse position at the next SPACE.
+
+        Args:
+            prompt: Instruction to print
+            pressed: Event set by the SPACE release hook
+
+        Returns:
+            Tuple (x, y): Mouse position when SPACE was released
+        """
+        import pyautogui
+
+        print(prompt)
+        pressed.clear()
+        pressed.wait()
+        return pyautogui.position()
+
     def setup_coordinates(self):
         """Interactive coordinate setup using keyboard input."""
+        # GUI/input hooks are only needed here; importing them lazily keeps
+        # headless users of ConfigManager from paying for them
+        import keyboard
+
         print("\n" + "="*60)
         print("COORDINATE SETUP")
         print("="*60)
         print("\nPosition your mouse and press SPACE\n")
 
-        print("1. Hover over STAKE INPUT field...")
-        keyboard.wait('space')
-        self.stake_coords = pyautogui.position()
-        print(f"   ✓ Stake input: {self.stake_coords}")
-        time.sleep(0.5)
-
-        print("\n2. Hover over PLACE BET button...")
-        keyboard.wait('space')
-        self.bet_button_coords = pyautogui.position()
-        print(f"   ✓ Place bet button: {self.bet_button_coords}")
-        time.sleep(0.5)
-
-        print("\n3. Hover over CASHOUT button location...")
-        keyboard.wait('space')
-        self.cashout_coords = pyautogui.position()
-        print(f"   ✓ Cashout button: {self.cashout_coords}")
-        time.sleep(0.5)
-
-        print("\n4. Define multiplier region (TOP-LEFT corner)...")
-        keyboard.wait('space')
-        x1, y1 = pyautogui.position()
-        print(f"   ✓ Top-left: ({x1}, {y1})")
-        time.sleep(0.5)
-
-        print("\n   Define multiplier region (BOTTOM-RIGHT corner)...")
-        keyboard.wait('space')
-        x2, y2 = pyautogui.position()
-        print(f"   ✓ Bottom-right: ({x2}, {y2})")
-        self.multiplier_region = (x1, y1, x2-x1, y2-y1)
-        print(f"\n✓ Multiplier region: {self.multiplier_region}")
-
-        print("\n5. Define BALANCE region (TOP-LEFT corner)...")
-        keyboard.wait('space')
-        b1, b2 = pyautogui.position()
-        print(f"   ✓ Balance top-left: ({b1}, {b2})")
-        time.sleep(0.5)
-
-        print("\n   Define BALANCE region (BOTTOM-RIGHT corner)...")
-        keyboard.wait('space')
-        b3, b4 = pyautogui.position()
-        print(f"   ✓ Balance bottom-right: ({b3}, {b4})")
-        self.balance_region = (b1, b2, b3, b4)
-        print(f"\n✓ Balance region: {self.balance_region}")
-
-        print("\n6. Define ROUND HISTORY bar (TOP-LEFT corner)...")
-        keyboard.wait('space')
-        h1, h2 = pyautogui.position()
-        print(f"   ✓ History top-left: ({h1}, {h2})")
-        time.sleep(0.5)
-
-        print("\n   Define ROUND HISTORY bar (BOTTOM-RIGHT corner)...")
-        keyboard.wait('space')
-        h3, h4 = pyautogui.position()
-        print(f"   ✓ History bottom-right: ({h3}, {h4})")
-        self.history_region = (h1, h2, h3-h1, h4-h2)
-        print(f"\n✓ History region: {self.history_region}")
+        # Advance on key release: one physical press is one step, and key
+        # auto-repeat can't skip ahead, so no settle delay is needed
+        pressed = threading.Event()
+        hook = keyboard.on_release_key('space', lambda e: pressed.set())
+        try:
+            self.stake_coords = self._capture_position("1. Hover over STAKE INPUT field...", pressed)
+            print(f"   ✓ Stake input: {self.stake_coords}")
+
+            self.bet_button_coords = self._capture_position("\n2. Hover over PLACE BET button...", pressed)
+            print(f"   ✓ Place bet button: {self.bet_button_coords}")
+
+            self.cashout_coords = self._capture_position("\n3. Hover over CASHOUT button location...", pressed)
+            print(f"   ✓ Cashout button: {self.cashout_coords}")
+
+            x1, y1 = self._capture_position("\n4. Define multiplier region (TOP-LEFT corner)...", pressed)
+            print(f"   ✓ Top-left: ({x1}, {y1})")
+
+            x2, y2 = self._capture_position("\n   Define multiplier region (BOTTOM-RIGHT corner)...", pressed)
+            print(f"   ✓ Bottom-right: ({x2}, {y2})")
+            self.multiplier_region = (x1, y1, x2-x1, y2-y1)
+            print(f"\n✓ Multiplier region: {self.multiplier_region}")
+
+            b1, b2 = self._capture_position("\n5. Define BALANCE region (TOP-LEFT corner)...", pressed)
+            print(f"   ✓ Balance top-left: ({b1}, {b2})")
+
+            b3, b4 = self._capture_position("\n   Define BALANCE region (BOTTOM-RIGHT corner)...", pressed)
+            print(f"   ✓ Balance bottom-right: ({b3}, {b4})")
+            self.balance_region = (b1, b2, b3, b4)
+            print(f"\n✓ Balance region: {self.balance_region}")
+
+            h1, h2 = self._capture_position("\n6. Define ROUND HISTORY bar (TOP-LEFT corner)...", pressed)
+            print(f"   ✓ History top-left: ({h1}, {h2})")
+
+            h3, h4 = self._capture_position("\n   Define ROUND HISTORY bar (BOTTOM-RIGHT corner)...", pressed)
+            print(f"   ✓ History bottom-right: ({h3}, {h4})")
+            self.history_region = (h1, h2, h3-h1, h4-h2)
+            print(f"\n✓ History region: {self.history_region}")
+        finally:
+            keyboard.unhook(hook)
 
         self.save_config()
 
@@ -229,9 +347,13 @@ class ConfigManager:
         Get configuration as dictionary.
 
         Returns:
-            dict: Configuration dictionary
+            MappingProxyType: Read-only configuration view; copy with dict()
+            to modify
         """
-        return {
+        if self._config_dict is not None:
+            return self._config_dict
+
+        self._config_dict = MappingProxyType({
             "position1": {
                 "stake_coords": self.stake_coords,
                 "bet_button_coords": self.bet_button_coords,
@@ -248,11 +370,6 @@ class ConfigManager:
             "multiplier_region": self.multiplier_region,
             "balance_region": self.balance_region,
             "history_region": self.history_region,
-            "cashout_delay": self.cashout_delay,
-            "initial_stake": self.initial_stake,
-            "max_stake": self.max_stake,
-            "stake_increase_percent": self.stake_increase_percent,
-            "safety_margin": self.safety_margin,
-            "positive_cycle_threshold": self.positive_cycle_threshold,
-            "position2_max_consecutive_losses": self.position2_max_consecutive_losses
-        }
+            **{key: getattr(self, key) for key in self._CONFIG_DICT_KEYS}
+        })
+        return self._config_dict
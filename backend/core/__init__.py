@@ -1,8 +1,27 @@
 """Core game logic modules for Aviator Bot."""
 
-from .game_detector import GameStateDetector
-from .history_tracker import RoundHistoryTracker
-from .ml_signal_generator import MLSignalGenerator
-from .position2_rule_engine import Position2RuleEngine
+import importlib
+
+# Public name -> submodule; each submodule (and its ML dependencies) is
+# imported on first attribute access, so `from core.ml_models import ...`
+# does not pull in the rest of the package
+_LAZY = {
+    'GameStateDetector': '.game_detector',
+    'RoundHistoryTracker': '.history_tracker',
+    'MLSignalGenerator': '.ml_signal_generator',
+    'Position2RuleEngine': '.position2_rule_engine',
+}
 
 __all__ = ['GameStateDetector', 'RoundHistoryTracker', 'MLSignalGenerator', 'Position2RuleEngine']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,68 @@
 """Game state detection using OCR and clipboard reading."""
 
 import time
-import pyautogui
+import threading
+from collections import OrderedDict
+import mss
 import cv2
 import numpy as np
 from utils.clipboard_utils import clear_clipboard, read_clipboard, select_and_copy_text, parse_multiplier_from_text
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _mismatch_counts_py(frame, bank):
+    """
+    Count differing pixels between a frame and each template.
+
+    Args:
+        frame: uint8 array (H, W) of 0/1 pixels
+        bank: uint8 array (N, H, W) of 0/1 template pixels
+
+    Returns:
+        np.ndarray: int64 mismatch count per template
+    """
+    return np.count_nonzero(bank != frame, axis=(1, 2)).astype(np.int64)
+
+
+if NUMBA_AVAILABLE:
+    @njit('i8[:](u1[:,:], u1[:,:,:])', cache=True, parallel=True)
+    def _mismatch_counts(frame, bank):
+        n, h, w = bank.shape
+        counts = np.zeros(n, dtype=np.int64)
+        for t in prange(n):
+            c = 0
+            for y in range(h):
+                for x in range(w):
+                    if bank[t, y, x] != frame[y, x]:
+                        c += 1
+            counts[t] = c
+        return counts
+
+    # Explicit signature compiles at import; one call warms the parallel runtime
+    _mismatch_counts(np.zeros((1, 1), dtype=np.uint8), np.zeros((1, 1, 1), dtype=np.uint8))
+else:
+    _mismatch_counts = _mismatch_counts_py
+
 
 class GameStateDetector:
     """Enhanced detector with OCR and clipboard reading capabilities."""
+
+    # Template matching on the thresholded region (fraction of differing pixels)
+    TEMPLATE_MATCH_MAX_DIFF = 0.02     # At or below: same screen as a stored template
+    TEMPLATE_MISMATCH_MIN_DIFF = 0.20  # At or above for every template: a multiplier is showing
+    TEMPLATES_PER_STATE = 4
+    OCR_CACHE_SIZE = 64
     
     def __init__(self, region):
         """
@@ -18,6 +72,23 @@ class GameStateDetector:
             region: Tuple (x, y, width, height) for multiplier region
         """
         self.region = region
+
+        # Set whenever read_text_in_region() sees a different state than last time
+        self._state_changed = threading.Event()
+        self._last_state = None
+
+        # Thresholded frames Tesseract classified as AWAITING/ENDED, reused as templates
+        self._templates = {'AWAITING': [], 'ENDED': []}
+        self._template_bank = None  # (shape, states, stacked templates), rebuilt on change
+
+        # Thresholded frame hash -> classified state (bounded LRU)
+        self._ocr_cache = OrderedDict()
+
+        # One MSS context per thread (handles are thread-bound) and a reused BGRA buffer
+        x, y, w, h = region
+        self._monitor = {'left': x, 'top': y, 'width': w, 'height': h}
+        self._capture_local = threading.local()
+        self._frame_buf = np.empty((h, w, 4), dtype=np.uint8)
         
         # Try to import pytesseract
         try:
@@ -37,9 +108,8 @@ class GameStateDetector:
             float or None: Multiplier value or None if failed
         """
         try:
-            # Clear clipboard
+            # Clear clipboard; select_and_copy_text waits for the copy to land
             clear_clipboard()
-            time.sleep(0.1)
             
             # Select text coordinates (adjust these based on your setup)
             x1, y1 = 19, 1101
@@ -73,35 +143,178 @@ class GameStateDetector:
         Returns:
             str or None: Detected state ('AWAITING', 'ENDED', 'UNKNOWN') or None
         """
+        state = self._ocr_state()
+        if state != self._last_state:
+            self._last_state = state
+            self._state_changed.set()
+        return state
+
+    def _match_template(self, frame):
+        """
+        Classify a thresholded frame against the stored state templates.
+
+        Args:
+            frame: uint8 array of the thresholded region (1 = bright pixel)
+
+        Returns:
+            str or None: Matched state, 'UNKNOWN' if clearly unlike every
+                template, or None if OCR is needed to decide
+        """
+        states, bank = self._get_template_bank(frame.shape)
+        if not states:
+            return None
+
+        counts = _mismatch_counts(frame, bank)
+        best = int(np.argmin(counts))
+        best_diff = counts[best] / frame.size
+
+        if best_diff <= self.TEMPLATE_MATCH_MAX_DIFF:
+            return states[best]
+
+        # Only trust "unlike everything" once both end-of-round screens are known
+        if best_diff >= self.TEMPLATE_MISMATCH_MIN_DIFF and all(self._templates.values()):
+            return 'UNKNOWN'
+
+        return None
+
+    def _get_template_bank(self, shape):
+        """
+        Return the templates of the given shape stacked for the match kernel.
+
+        Returns:
+            tuple: (list of states, uint8 array (N, H, W) or None)
+        """
+        if self._template_bank is None or self._template_bank[0] != shape:
+            states = []
+            frames = []
+            for state, templates in self._templates.items():
+                for template in templates:
+                    if template.shape == shape:
+                        states.append(state)
+                        frames.append(template)
+            bank = np.ascontiguousarray(np.stack(frames)) if frames else None
+            self._template_bank = (shape, states, bank)
+
+        return self._template_bank[1], self._template_bank[2]
+
+    def _remember_template(self, state, frame):
+        """Store an OCR-confirmed frame as a template for its state."""
+        templates = self._templates[state]
+        templates.append(frame)
+        if len(templates) > self.TEMPLATES_PER_STATE:
+            templates.pop(0)
+        self._template_bank = None
+
+    def _grab(self):
+        """
+        Capture the region into the reused BGRA buffer.
+
+        Returns:
+            np.ndarray: (H, W, 4) uint8 view, overwritten by the next call
+        """
+        sct = getattr(self._capture_local, 'sct', None)
+        if sct is None:
+            sct = self._capture_local.sct = mss.mss()
+        shot = sct.grab(self._monitor)
+        np.copyto(self._frame_buf,
+                  np.frombuffer(shot.raw, dtype=np.uint8).reshape(self._frame_buf.shape),
+                  casting='no')
+        return self._frame_buf
+
+    @staticmethod
+    def _frame_key(binary):
+        """Hash a thresholded frame for the OCR cache."""
+        data = binary.tobytes()
+        if XXHASH_AVAILABLE:
+            return (binary.shape, xxhash.xxh64_intdigest(data))
+        return (binary.shape, hash(data))
+
+    def _tesseract_state(self, thresh, binary):
+        """
+        Classify a thresholded frame with Tesseract.
+
+        AWAITING/ENDED results are kept as templates for _match_template.
+
+        Returns:
+            str: 'AWAITING', 'ENDED' or 'UNKNOWN'
+        """
+        text = self.pytesseract.image_to_string(thresh, config='--oem 3 --psm 6')
+        
+        if text:
+            text = text.strip().upper()
+            # Normalize common OCR errors
+            text = text.replace('0', 'O').replace('1', 'I')
+            
+            # Check for keywords
+            if any(kw in text for kw in ['AWAITING', 'AWAIT', 'NEXT', 'FLIGHT']):
+                self._remember_template('AWAITING', binary)
+                return 'AWAITING'
+            if any(kw in text for kw in ['FLEW', 'CRASH']):
+                self._remember_template('ENDED', binary)
+                return 'ENDED'
+        
+        return 'UNKNOWN'
+
+    def _ocr_state(self):
+        """
+        Capture the multiplier region and classify it, using stored templates
+        first and Tesseract only when they are inconclusive.
+        """
         if not self.tesseract_available:
             return None
         
         try:
-            image = pyautogui.screenshot(region=self.region)
-            img_array = np.array(image)
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+            gray = cv2.cvtColor(self._grab(), cv2.COLOR_BGRA2GRAY)
             
             # Apply threshold
             _, thresh = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)
-            
-            # OCR
-            text = self.pytesseract.image_to_string(thresh, config='--oem 3 --psm 6')
-            
-            if text:
-                text = text.strip().upper()
-                # Normalize common OCR errors
-                text = text.replace('0', 'O').replace('1', 'I')
-                
-                # Check for keywords
-                if any(kw in text for kw in ['AWAITING', 'AWAIT', 'NEXT', 'FLIGHT']):
-                    return 'AWAITING'
-                if any(kw in text for kw in ['FLEW', 'CRASH']):
-                    return 'ENDED'
-            
-            return 'UNKNOWN'
+
+            binary = (thresh > 0).view(np.uint8)
+
+            # Identical thresholded frames get the same answer without re-classifying
+            key = self._frame_key(binary)
+            cached = self._ocr_cache.get(key)
+            if cached is not None:
+                self._ocr_cache.move_to_end(key)
+                return cached
+
+            state = self._match_template(binary)
+            if state is None:
+                state = self._tesseract_state(thresh, binary)
+
+            self._ocr_cache[key] = state
+            if len(self._ocr_cache) > self.OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+            return state
         except Exception as e:
             print(f"Error reading text in region: {e}")
             return None
+
+    def wait_for_state_change(self, timeout, check_interval=0.05):
+        """
+        Poll the region until the detected state changes or the timeout expires.
+
+        The event is only set by read_text_in_region() on the calling thread,
+        so the wait keeps reading; a flag left over from an earlier read is
+        cleared first and does not end the wait.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            check_interval: How often to read the region (seconds)
+
+        Returns:
+            bool: True if the detector state changed
+        """
+        self._state_changed.clear()
+        deadline = time.perf_counter() + timeout
+
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            self.read_text_in_region()
+            if self._state_changed.wait(min(check_interval, remaining)):
+                return True
     
     def is_awaiting_next_flight(self):
         """
@@ -135,19 +348,54 @@ class GameStateDetector:
         Returns:
             bool: True if stable AWAITING state reached, False if timeout
         """
-        start = time.time()
+        start = time.perf_counter()
+        interval = 0.02  # Poll backoff: 20ms growing to 200ms while idle
         
-        while time.time() - start < timeout:
+        while time.perf_counter() - start < timeout:
             if self.is_awaiting_next_flight():
-                time.sleep(0.3)
-                # Triple check for stability
-                if self.is_awaiting_next_flight():
-                    time.sleep(0.2)
-                    if self.is_awaiting_next_flight():
+                # Triple check for stability; a state change ends the wait early
+                if not self.wait_for_state_change(0.3) and self.is_awaiting_next_flight():
+                    if not self.wait_for_state_change(0.2) and self.is_awaiting_next_flight():
                         return True
-            time.sleep(0.3)
+                interval = 0.02
+            if self.wait_for_state_change(interval, check_interval=interval):
+                interval = 0.02
+            else:
+                interval = min(0.2, interval * 1.5)
         
         return False
+
+    def is_game_flying(self):
+        """
+        Check if a multiplier is showing (neither AWAITING nor ENDED text).
+
+        Returns:
+            bool: True if the game is in flight
+        """
+        return self.read_text_in_region() == 'UNKNOWN'
+
+    def wait_for_game_start(self, timeout=15):
+        """
+        Wait for the round to leave the AWAITING state.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            bool: True if the game started, False if timeout
+        """
+        start = time.perf_counter()
+        interval = 0.02
+
+        while time.perf_counter() - start < timeout:
+            if self.is_game_flying():
+                return True
+            if self.wait_for_state_change(interval, check_interval=interval):
+                interval = 0.02
+            else:
+                interval = min(0.2, interval * 1.5)
+
+        return False
     
     def has_game_crashed(self):
         """
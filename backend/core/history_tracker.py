@@ -3,11 +3,12 @@
 import os
 import csv
 import time
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from collections import deque
 import threading
-from queue import Queue
+from queue import Queue, Empty
 
 try:
     from ..cloud_sync import CloudSync
@@ -44,6 +45,18 @@ class RoundHistoryTracker:
         self._cache = None
         self._cache_lock = threading.Lock()
         self._cache_last_modified = 0
+        self._pending_cache_rows = []  # Logged rows not yet merged into _cache
+
+        # Column arrays of logged rounds (multiplier, stake, profit, prediction),
+        # grown by doubling; rows [0, _n) are valid. Seeded from the CSV on
+        # first use, so rounds other writers add before then (manual history
+        # import, RoundLogger) are included
+        self._arrays_seeded = False
+        self._n = 0
+        self._mults = np.empty(1024, dtype=np.float64)
+        self._stakes = np.empty(1024, dtype=np.float64)
+        self._profits = np.empty(1024, dtype=np.float64)
+        self._predicted = np.empty(1024, dtype=np.float64)
 
         # Async write optimization
         self._write_queue = Queue()
@@ -64,6 +77,64 @@ class RoundHistoryTracker:
                     'pos2_phase', 'pos2_rules_triggered'
                 ])
 
+    def _ensure_arrays_seeded(self):
+        """Seed the column arrays on first use; call with _cache_lock held."""
+        if not self._arrays_seeded:
+            self._arrays_seeded = True
+            self._seed_arrays_from_csv()
+
+    def _seed_arrays_from_csv(self, n=1000):
+        """
+        Fill the column arrays from the last N rounds already in the CSV.
+
+        Runs before the first log_round, so every row logged through this
+        tracker is appended after the seeded ones and none is counted twice.
+        """
+        df = self._read_csv_tail_efficient(n)
+        if df.empty or 'multiplier' not in df.columns:
+            return
+
+        def column(name):
+            if name not in df.columns:
+                return np.zeros(len(df))
+            return pd.to_numeric(df[name], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+        for mult, stake, profit, predicted in zip(
+                column('multiplier'), column('stake_amount'),
+                column('profit_loss'), column('model_prediction')):
+            self._append_arrays(mult, stake, profit, predicted)
+
+    def _append_arrays(self, multiplier, stake, profit_loss, prediction):
+        """Append one round to the column arrays, doubling them when full."""
+        if self._n == len(self._mults):
+            size = 2 * len(self._mults)
+            for name in ('_mults', '_stakes', '_profits', '_predicted'):
+                grown = np.empty(size, dtype=np.float64)
+                grown[:self._n] = getattr(self, name)[:self._n]
+                setattr(self, name, grown)
+
+        i = self._n
+        self._mults[i] = multiplier
+        self._stakes[i] = stake or 0
+        self._profits[i] = profit_loss or 0
+        self._predicted[i] = prediction or 0
+        self._n = i + 1
+
+    def mults_view(self, n=None):
+        """
+        Get recent multipliers as a NumPy view, without building a DataFrame.
+
+        Args:
+            n: Number of most recent rounds (default all)
+
+        Returns:
+            np.ndarray: Multipliers, oldest first (rounds logged later are not included)
+        """
+        with self._cache_lock:
+            self._ensure_arrays_seeded()
+            view = self._mults[:self._n]
+        return view if n is None else view[-n:]
+
     def _start_async_writer(self):
         """Start background thread for async CSV writing."""
         if self._write_thread is None or not self._write_thread.is_alive():
@@ -72,25 +143,58 @@ class RoundHistoryTracker:
             self._write_thread.start()
 
     def _async_write_worker(self):
-        """Background worker that writes to CSV asynchronously."""
-        while self._write_thread_running:
-            try:
-                # Get item from queue with timeout
-                row_data = self._write_queue.get(timeout=1.0)
-
-                if row_data is None:  # Shutdown signal
-                    break
-
-                # Write to CSV
-                with open(self.csv_file, 'a', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(row_data)
-
-                self._write_queue.task_done()
+        """
+        Background worker that writes to CSV asynchronously.
 
-            except Exception as e:
-                if str(e) != '':  # Ignore timeout exceptions
+        The CSV stays open in append mode with a 32 KB buffer. Rows queued
+        together are written as one batch and flushed so readers see them;
+        the file is only fsync'd when the writer stops.
+        """
+        f = None
+        writer = None
+        stop = False
+        try:
+            while self._write_thread_running and not stop:
+                try:
+                    # Get item from queue with timeout
+                    row_data = self._write_queue.get(timeout=1.0)
+                except Empty:
+                    continue
+
+                # Drain whatever else is already queued into the same batch
+                batch = []
+                while True:
+                    if row_data is None:  # Shutdown signal
+                        stop = True
+                    else:
+                        batch.append(row_data)
+                    try:
+                        row_data = self._write_queue.get_nowait()
+                    except Empty:
+                        break
+
+                try:
+                    if batch:
+                        if f is None:
+                            f = open(self.csv_file, 'a', newline='', buffering=1 << 15)
+                            writer = csv.writer(f)
+                        writer.writerows(batch)
+                        f.flush()
+                except Exception as e:
                     print(f"Error in async writer: {e}")
+                    if f is not None:
+                        f.close()
+                    f = None
+                finally:
+                    for _ in range(len(batch) + stop):
+                        self._write_queue.task_done()
+        finally:
+            if f is not None:
+                try:
+                    f.flush()
+                    os.fsync(f.fileno())
+                finally:
+                    f.close()
 
     def stop_async_writer(self):
         """Stop the async writer thread."""
@@ -130,10 +234,11 @@ class RoundHistoryTracker:
 
             # DO NOT log to CSV here - the bot will call log_round() explicitly
             # Just add to local buffer for immediate cache update
+            now = datetime.now()
             self.local_history_buffer.append({
                 'multiplier': multiplier,
-                'timestamp': datetime.now().isoformat(),
-                'round_id': datetime.now().strftime("%Y%m%d%H%M%S%f")[:17]  # Include milliseconds
+                'timestamp': now.isoformat(),
+                'round_id': now.strftime("%Y%m%d%H%M%S%f")[:17]  # Include milliseconds
             })
 
             # Update tracking
@@ -164,8 +269,9 @@ class RoundHistoryTracker:
             pos2_signal: Position 2 signal dictionary (optional)
         """
         try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            round_id = datetime.now().strftime("%Y%m%d%H%M%S%f")[:17]  # Include milliseconds (17 chars: YYYYMMDDHHMMSSmmm)
+            now = datetime.now()
+            timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+            round_id = now.strftime("%Y%m%d%H%M%S%f")[:17]  # Include milliseconds (17 chars: YYYYMMDDHHMMSSmmm)
 
             # Extract Position 2 data if available
             pos2_confidence = 0
@@ -190,17 +296,23 @@ class RoundHistoryTracker:
                 pos2_phase, pos2_rules
             ]
 
+            # Seed from the CSV before this row can reach it
+            with self._cache_lock:
+                self._ensure_arrays_seeded()
+
             # Add to async write queue (NON-BLOCKING!)
             self._write_queue.put(row_data)
             
             # Ensure local CSV is written first, then cloud sync happens automatically
             # The cloud sync runs in background and reads from the CSV file
 
-            # Update cache immediately without waiting for disk write
+            # Queue the row for the cache without waiting for disk write; rows are
+            # merged into the DataFrame in one concat on the next read
             with self._cache_lock:
+                if multiplier is not None:
+                    self._append_arrays(multiplier, stake, profit_loss, prediction)
                 if self._cache is not None:
-                    # Add new row to cache instead of invalidating
-                    new_row = pd.DataFrame([{
+                    self._pending_cache_rows.append({
                         'timestamp': timestamp,
                         'round_id': round_id,
                         'multiplier': multiplier,
@@ -217,8 +329,7 @@ class RoundHistoryTracker:
                         'pos2_burst_probability': pos2_burst_prob,
                         'pos2_phase': pos2_phase,
                         'pos2_rules_triggered': pos2_rules
-                    }])
-                    self._cache = pd.concat([self._cache, new_row], ignore_index=True)
+                    })
 
         except Exception as e:
             print(f"Error logging round: {e}")
@@ -238,26 +349,29 @@ class RoundHistoryTracker:
             if not os.path.exists(self.csv_file):
                 return pd.DataFrame()
 
-            # For small requests, use efficient tail reading
+            # For small requests, read blocks backwards from the end of the file
             if n <= 1000:
-                lines = []
-                with open(self.csv_file, 'r', encoding='utf-8') as f:
-                    # Read header
+                with open(self.csv_file, 'rb') as f:
                     header = f.readline()
-                    lines.append(header)
-
-                    # Read all remaining lines (for deque efficiency)
-                    all_lines = f.readlines()
-
-                    # Get last n lines
-                    if len(all_lines) <= n:
-                        lines.extend(all_lines)
-                    else:
-                        lines.extend(all_lines[-n:])
+                    data_start = f.tell()
+                    pos = f.seek(0, os.SEEK_END)
+
+                    # Stop once n+1 newlines are in hand so a partial first line can be dropped
+                    chunks = []
+                    newlines = 0
+                    while pos > data_start and newlines <= n:
+                        size = min(1 << 16, pos - data_start)
+                        pos -= size
+                        f.seek(pos)
+                        chunk = f.read(size)
+                        chunks.append(chunk)
+                        newlines += chunk.count(b'\n')
+
+                tail = b''.join(reversed(chunks)).splitlines(keepends=True)[-n:]
 
                 # Parse with pandas
-                from io import StringIO
-                df = pd.read_csv(StringIO(''.join(lines)))
+                from io import BytesIO
+                df = pd.read_csv(BytesIO(header + b''.join(tail)), encoding='utf-8')
 
                 if df.empty:
                     return pd.DataFrame()
@@ -323,6 +437,13 @@ class RoundHistoryTracker:
                     else:
                         return pd.DataFrame()
 
+                if self._cache is not None and self._pending_cache_rows:
+                    self._cache = pd.concat(
+                        [self._cache, pd.DataFrame(self._pending_cache_rows)],
+                        ignore_index=True
+                    )
+                    self._pending_cache_rows = []
+
                 if self._cache is None or self._cache.empty:
                     return pd.DataFrame()
 
@@ -344,12 +465,7 @@ class RoundHistoryTracker:
             list: List of multiplier values
         """
         try:
-            df = self.get_recent_rounds(n)
-
-            if df.empty or 'multiplier' not in df.columns:
-                return []
-
-            return df['multiplier'].tolist()
+            return self.mults_view(n).tolist()
         except Exception as e:
             print(f"Error getting recent multipliers: {e}")
             return []
@@ -30,6 +30,188 @@ try:
 except ImportError:
     KERAS_AVAILABLE = False
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+try:
+    import tf2onnx
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    ONNX_EXPORT_AVAILABLE = True
+except ImportError:
+    ONNX_EXPORT_AVAILABLE = False
+
+
+# Summary features appended after the raw sequence by _window_features
+N_WINDOW_STATS = 30
+
+# Entropy histogram edges; the last bin includes its right edge like np.histogram
+_ENTROPY_BINS = np.array([0, 1.5, 2.0, 3.0, 5.0, 10.0, 100.0])
+
+
+def _percentile_sorted(s, q):
+    """Linear-interpolated percentile of an already sorted array (np.percentile default)."""
+    pos = q / 100.0 * (len(s) - 1)
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, len(s) - 1)
+    return s[lo] + (s[hi] - s[lo]) * (pos - lo)
+
+
+def _rounds_since(seq, threshold, default):
+    """Rounds since the last value >= threshold (default if never, or if it was the last round)."""
+    n = len(seq)
+    for j in range(n - 1, -1, -1):
+        if seq[j] >= threshold:
+            if j == n - 1:
+                return default
+            return n - 1 - j
+    return default
+
+
+def _window_features(seq, sequence_length):
+    """
+    Build the feature vector for one window of multipliers.
+
+    Args:
+        seq: float64 array of the last `sequence_length` multipliers
+        sequence_length: Window length (used as the "never seen" count)
+
+    Returns:
+        np.ndarray: float64 features, the raw window followed by N_WINDOW_STATS stats
+    """
+    n = len(seq)
+    out = np.empty(n + N_WINDOW_STATS)
+    out[:n] = seq
+
+    s = np.sort(seq)
+    mean = seq.mean()
+    std = seq.std()
+    seq_max = s[n - 1]
+    seq_min = s[0]
+    p25 = _percentile_sorted(s, 25.0)
+    p50 = _percentile_sorted(s, 50.0)
+    p75 = _percentile_sorted(s, 75.0)
+
+    recent_avg = seq[-3:].mean()
+    older_avg = seq[:3].mean()
+
+    low_count = 0
+    high_count = 0
+    high_count_3x = 0
+    low_count_15x = 0
+    current_low_streak = 0
+    max_low_streak = 0
+    temp_streak = 0
+    hist = np.zeros(len(_ENTROPY_BINS) - 1)
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for v in seq:
+        if v < 2.0:
+            low_count += 1
+            temp_streak += 1
+            if temp_streak > max_low_streak:
+                max_low_streak = temp_streak
+        else:
+            temp_streak = 0
+        if v >= 10.0:
+            high_count += 1
+        if v >= 3.0:
+            high_count_3x += 1
+        if v < 1.5:
+            low_count_15x += 1
+        for b in range(len(hist)):
+            last = b == len(hist) - 1
+            if v >= _ENTROPY_BINS[b] and (v < _ENTROPY_BINS[b + 1] or (last and v <= _ENTROPY_BINS[b + 1])):
+                hist[b] += 1
+                break
+        d = v - mean
+        m2 += d * d
+        m3 += d * d * d
+        m4 += d * d * d * d
+    current_low_streak = temp_streak
+    m2 /= n
+    m3 /= n
+    m4 /= n
+
+    increasing_streak = 0
+    for j in range(1, n):
+        if seq[j] > seq[j - 1]:
+            increasing_streak += 1
+        else:
+            break
+
+    alternations = 0
+    for j in range(1, n):
+        if (seq[j] >= 2.0) != (seq[j - 1] >= 2.0):
+            alternations += 1
+
+    entropy = 0.0
+    for count in hist:
+        if count > 0:
+            p = count / n
+            entropy -= p * np.log2(p)
+
+    # Biased skewness / Fisher kurtosis, matching scipy.stats defaults (NaN when constant)
+    if m2 > 0:
+        skewness = m3 / m2 ** 1.5
+        kurt = m4 / (m2 * m2) - 3.0
+    else:
+        skewness = np.nan
+        kurt = np.nan
+
+    ma_5 = seq[-5:].mean()
+    ma_10 = seq[-10:].mean()
+
+    out[n] = mean
+    out[n + 1] = std
+    out[n + 2] = seq_max
+    out[n + 3] = seq_min
+    out[n + 4] = p50  # median
+    out[n + 5] = recent_avg
+    out[n + 6] = older_avg
+    out[n + 7] = recent_avg - older_avg
+    out[n + 8] = low_count
+    out[n + 9] = high_count
+    out[n + 10] = seq_max - seq_min
+    out[n + 11] = increasing_streak
+    out[n + 12] = _rounds_since(seq, 10.0, sequence_length)
+    out[n + 13] = p25
+    out[n + 14] = p50
+    out[n + 15] = p75
+    out[n + 16] = entropy
+    out[n + 17] = skewness
+    out[n + 18] = kurt
+    out[n + 19] = ma_5
+    out[n + 20] = ma_10
+    out[n + 21] = ma_5 - ma_10
+    out[n + 22] = p75 - p25
+    out[n + 23] = std / mean if mean > 0 else 0.0
+    out[n + 24] = _rounds_since(seq, 5.0, sequence_length)
+    out[n + 25] = _rounds_since(seq, 3.0, sequence_length)
+    out[n + 26] = current_low_streak
+    out[n + 27] = max_low_streak
+    out[n + 28] = alternations
+    out[n + 29] = high_count_3x / (low_count_15x + 1)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _percentile_sorted = njit(cache=True)(_percentile_sorted)
+    _rounds_since = njit(cache=True)(_rounds_since)
+    _window_features = njit(cache=True)(_window_features)
+
+    # Compile now so the first live signal doesn't pay for it
+    _window_features(np.ones(20), 20)
+
 
 class AviatorMLModels:
     """
@@ -52,6 +234,7 @@ class AviatorMLModels:
         self.gradient_boosting = None
         self.lightgbm = None
         self.lstm = None
+        self.lstm_session = None  # int8 ONNX Runtime session for the LSTM (optional)
 
         # Classification model instances (for green/red prediction)
         self.classifiers = {}  # {target: model} e.g., {1.5: model, 2.0: model, 3.0: model}
@@ -84,7 +267,7 @@ class AviatorMLModels:
         if df.empty or target_column not in df.columns:
             return None, None, None
 
-        multipliers = df[target_column].values
+        multipliers = np.asarray(df[target_column].values, dtype=np.float64)
 
         # Extract sample weights if available
         has_weights = 'sample_weight' in df.columns
@@ -101,158 +284,9 @@ class AviatorMLModels:
         sample_weights = [] if has_weights else None
 
         for i in range(len(multipliers) - self.sequence_length):
-            # Get sequence of past multipliers
+            # Past N multipliers followed by window statistics (see _window_features)
             sequence = multipliers[i:i + self.sequence_length]
-
-            # Feature 1-20: Past N multipliers
-            feature_vector = list(sequence)
-
-            # Feature 21: Mean of sequence
-            feature_vector.append(np.mean(sequence))
-
-            # Feature 22: Std deviation
-            feature_vector.append(np.std(sequence))
-
-            # Feature 23: Max in sequence
-            feature_vector.append(np.max(sequence))
-
-            # Feature 24: Min in sequence
-            feature_vector.append(np.min(sequence))
-
-            # Feature 25: Median
-            feature_vector.append(np.median(sequence))
-
-            # Feature 26-28: Recent trend (last 3 avg vs first 3 avg)
-            recent_avg = np.mean(sequence[-3:])
-            older_avg = np.mean(sequence[:3])
-            feature_vector.append(recent_avg)
-            feature_vector.append(older_avg)
-            feature_vector.append(recent_avg - older_avg)
-
-            # Feature 29: Count of low multipliers (<2.0)
-            low_count = np.sum(sequence < 2.0)
-            feature_vector.append(low_count)
-
-            # Feature 30: Count of high multipliers (>=10.0)
-            high_count = np.sum(sequence >= 10.0)
-            feature_vector.append(high_count)
-
-            # Feature 31: Volatility (range)
-            feature_vector.append(np.max(sequence) - np.min(sequence))
-
-            # Feature 32: Streak of increasing values
-            increasing_streak = 0
-            for j in range(1, len(sequence)):
-                if sequence[j] > sequence[j-1]:
-                    increasing_streak += 1
-                else:
-                    break
-            feature_vector.append(increasing_streak)
-
-            # Feature 33: Time since last high (>10x)
-            time_since_high = 0
-            for j in range(len(sequence)-1, -1, -1):
-                if sequence[j] >= 10.0:
-                    time_since_high = len(sequence) - 1 - j
-                    break
-            if time_since_high == 0:
-                time_since_high = self.sequence_length
-            feature_vector.append(time_since_high)
-
-            # Feature 34-36: Percentiles (25th, 50th, 75th)
-            feature_vector.append(np.percentile(sequence, 25))
-            feature_vector.append(np.percentile(sequence, 50))
-            feature_vector.append(np.percentile(sequence, 75))
-
-            # Feature 37: Entropy (measure of randomness)
-            # Binning multipliers to calculate entropy
-            bins = [0, 1.5, 2.0, 3.0, 5.0, 10.0, 100.0]
-            hist, _ = np.histogram(sequence, bins=bins)
-            hist = hist / len(sequence)
-            hist = hist[hist > 0]
-            entropy = -np.sum(hist * np.log2(hist))
-            feature_vector.append(entropy)
-
-            # NEW FEATURES FOR IMPROVED ACCURACY
-
-            # Feature 38-39: Skewness and Kurtosis (distribution shape)
-            from scipy.stats import skew, kurtosis
-            feature_vector.append(skew(sequence))
-            feature_vector.append(kurtosis(sequence))
-
-            # Feature 40-41: Moving averages (different horizons)
-            ma_5 = np.mean(sequence[-5:]) if len(sequence) >= 5 else np.mean(sequence)
-            ma_10 = np.mean(sequence[-10:]) if len(sequence) >= 10 else np.mean(sequence)
-            feature_vector.append(ma_5)
-            feature_vector.append(ma_10)
-
-            # Feature 42: MA crossover (5 vs 10)
-            feature_vector.append(ma_5 - ma_10)
-
-            # Feature 43: IQR (interquartile range)
-            q25, q75 = np.percentile(sequence, [25, 75])
-            iqr = q75 - q25
-            feature_vector.append(iqr)
-
-            # Feature 44: Coefficient of variation (normalized volatility)
-            cv = np.std(sequence) / np.mean(sequence) if np.mean(sequence) > 0 else 0
-            feature_vector.append(cv)
-
-            # Feature 45: Rounds since last 5x multiplier
-            rounds_since_5x = 0
-            for j in range(len(sequence)-1, -1, -1):
-                if sequence[j] >= 5.0:
-                    rounds_since_5x = len(sequence) - 1 - j
-                    break
-            if rounds_since_5x == 0:
-                rounds_since_5x = self.sequence_length
-            feature_vector.append(rounds_since_5x)
-
-            # Feature 46: Rounds since last 3x multiplier
-            rounds_since_3x = 0
-            for j in range(len(sequence)-1, -1, -1):
-                if sequence[j] >= 3.0:
-                    rounds_since_3x = len(sequence) - 1 - j
-                    break
-            if rounds_since_3x == 0:
-                rounds_since_3x = self.sequence_length
-            feature_vector.append(rounds_since_3x)
-
-            # Feature 47: Current low streak length
-            current_low_streak = 0
-            for j in range(len(sequence)-1, -1, -1):
-                if sequence[j] < 2.0:
-                    current_low_streak += 1
-                else:
-                    break
-            feature_vector.append(current_low_streak)
-
-            # Feature 48: Max low streak in window
-            max_low_streak = 0
-            temp_streak = 0
-            for val in sequence:
-                if val < 2.0:
-                    temp_streak += 1
-                    max_low_streak = max(max_low_streak, temp_streak)
-                else:
-                    temp_streak = 0
-            feature_vector.append(max_low_streak)
-
-            # Feature 49: Alternating pattern score (high-low-high-low)
-            alternations = 0
-            for j in range(1, len(sequence)):
-                if (sequence[j] >= 2.0 and sequence[j-1] < 2.0) or \
-                   (sequence[j] < 2.0 and sequence[j-1] >= 2.0):
-                    alternations += 1
-            feature_vector.append(alternations)
-
-            # Feature 50: Ratio of highs to lows
-            high_count_3x = np.sum(sequence >= 3.0)
-            low_count_15x = np.sum(sequence < 1.5)
-            ratio = high_count_3x / (low_count_15x + 1)  # +1 to avoid division by zero
-            feature_vector.append(ratio)
-
-            features.append(feature_vector)
+            features.append(_window_features(sequence, self.sequence_length))
             targets.append(multipliers[i + self.sequence_length])
 
             # Store weight for this sample (use weight of target round)
@@ -466,6 +500,7 @@ class AviatorMLModels:
             X_train_lstm = X_train_scaled.reshape((X_train_scaled.shape[0], 1, X_train_scaled.shape[1]))
             X_test_lstm = X_test_scaled.reshape((X_test_scaled.shape[0], 1, X_test_scaled.shape[1]))
 
+            self.lstm_session = None  # Stale until the new LSTM is exported
             self.lstm = Sequential([
                 LSTM(64, activation='relu', input_shape=(1, X_train_scaled.shape[1]), return_sequences=True),
                 Dropout(0.2),
@@ -623,18 +658,13 @@ class AviatorMLModels:
         if len(recent_multipliers) < self.sequence_length:
             return self._generate_placeholder_predictions()
 
-        # Prepare features
-        sequence = recent_multipliers[-self.sequence_length:]
-        features, _, _ = self.engineer_features(
-            pd.DataFrame({'multiplier': sequence + [0]})
-        )
-
-        if features is None:
-            return self._generate_placeholder_predictions()
+        # Prepare features for the latest window directly (no DataFrame round trip)
+        sequence = np.asarray(recent_multipliers[-self.sequence_length:], dtype=np.float64)
+        features = _window_features(sequence, self.sequence_length)
 
-        # Get last feature vector
-        X = features[-1].reshape(1, -1)
-        X_scaled = self.scaler.transform(X)
+        # float32 is what the tree models use internally
+        X = features.reshape(1, -1)
+        X_scaled = np.ascontiguousarray(self.scaler.transform(X), dtype=np.float32)
 
         predictions = []
 
@@ -644,6 +674,7 @@ class AviatorMLModels:
             rf_conf = self._calculate_confidence(rf_pred, 'RandomForest')
             predictions.append({
                 'model_id': 'RandomForest',
+                'key': 'rf',
                 'prediction': max(1.0, float(rf_pred)),
                 'confidence': float(rf_conf)
             })
@@ -654,27 +685,36 @@ class AviatorMLModels:
             gb_conf = self._calculate_confidence(gb_pred, 'GradientBoosting')
             predictions.append({
                 'model_id': 'GradientBoosting',
+                'key': 'gb',
                 'prediction': max(1.0, float(gb_pred)),
                 'confidence': float(gb_conf)
             })
 
         # LightGBM prediction
         if self.lightgbm is not None:
-            lgb_pred = self.lightgbm.predict(X_scaled)[0]
+            lgb_pred = self.lightgbm.predict(X_scaled, num_threads=1,
+                                             predict_disable_shape_check=True)[0]
             lgb_conf = self._calculate_confidence(lgb_pred, 'LightGBM')
             predictions.append({
                 'model_id': 'LightGBM',
+                'key': 'lgb',
                 'prediction': max(1.0, float(lgb_pred)),
                 'confidence': float(lgb_conf)
             })
 
         # LSTM prediction
-        if self.lstm is not None:
+        if self.lstm_session is not None or self.lstm is not None:
             X_lstm = X_scaled.reshape((1, 1, X_scaled.shape[1]))
-            lstm_pred = self.lstm.predict(X_lstm, verbose=0)[0][0]
+            if self.lstm_session is not None:
+                input_name = self.lstm_session.get_inputs()[0].name
+                lstm_pred = self.lstm_session.run(None, {input_name: X_lstm})[0][0][0]
+            else:
+                # Direct call skips predict()'s per-call dataset setup
+                lstm_pred = self.lstm(X_lstm, training=False).numpy()[0][0]
             lstm_conf = self._calculate_confidence(lstm_pred, 'LSTM')
             predictions.append({
                 'model_id': 'LSTM',
+                'key': 'lstm',
                 'prediction': max(1.0, float(lstm_pred)),
                 'confidence': float(lstm_conf)
             })
@@ -720,24 +760,9 @@ class AviatorMLModels:
                 'reason': 'Insufficient history'
             }
 
-        # Prepare features
-        sequence = recent_multipliers[-self.sequence_length:]
-        features, _, _ = self.engineer_features(
-            pd.DataFrame({'multiplier': sequence + [0]})
-        )
-
-        if features is None:
-            return {
-                'target': target_multiplier,
-                'green_probability': 50.0,
-                'confidence': 0.0,
-                'recommendation': 'SKIP',
-                'accuracy': 0.0,
-                'reason': 'Feature engineering failed'
-            }
-
-        # Get last feature vector
-        X = features[-1].reshape(1, -1)
+        # Prepare features for the latest window
+        sequence = np.asarray(recent_multipliers[-self.sequence_length:], dtype=np.float64)
+        X = _window_features(sequence, self.sequence_length).reshape(1, -1)
         X_scaled = self.scaler.transform(X)
 
         # Predict probability
@@ -813,10 +838,10 @@ class AviatorMLModels:
         """Generate placeholder predictions when models not trained."""
         # Return cautious predictions
         return [
-            {'model_id': 'RandomForest', 'prediction': 2.0, 'confidence': 50.0},
-            {'model_id': 'GradientBoosting', 'prediction': 2.2, 'confidence': 50.0},
-            {'model_id': 'LightGBM', 'prediction': 2.1, 'confidence': 50.0},
-            {'model_id': 'LSTM', 'prediction': 2.0, 'confidence': 50.0}
+            {'model_id': 'RandomForest', 'key': 'rf', 'prediction': 2.0, 'confidence': 50.0},
+            {'model_id': 'GradientBoosting', 'key': 'gb', 'prediction': 2.2, 'confidence': 50.0},
+            {'model_id': 'LightGBM', 'key': 'lgb', 'prediction': 2.1, 'confidence': 50.0},
+            {'model_id': 'LSTM', 'key': 'lstm', 'prediction': 2.0, 'confidence': 50.0}
         ]
 
     def save_models(self):
@@ -849,6 +874,8 @@ class AviatorMLModels:
         # Save LSTM separately
         if self.lstm is not None:
             self.lstm.save(os.path.join(self.models_dir, 'lstm_model.h5'))
+            if not self._export_quantized_lstm():
+                self._discard_quantized_lstm()
 
         # Save metadata
         metadata = {
@@ -865,6 +892,47 @@ class AviatorMLModels:
 
         print(f"[OK] Models saved to {self.models_dir}/")
 
+    def _export_quantized_lstm(self):
+        """
+        Export the LSTM to ONNX with int8 dynamic quantization.
+
+        Needs tf2onnx and onnxruntime; without them only the .h5 model is saved.
+
+        Returns:
+            bool: True if lstm_int8.onnx was written
+        """
+        if not ONNX_EXPORT_AVAILABLE:
+            return False
+
+        fp32_path = os.path.join(self.models_dir, 'lstm_model.onnx')
+        int8_path = os.path.join(self.models_dir, 'lstm_int8.onnx')
+        try:
+            tf2onnx.convert.from_keras(self.lstm, output_path=fp32_path)
+            quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+            self.lstm_session = self._create_onnx_session(int8_path)
+            return True
+        except Exception as e:
+            print(f"WARNING: LSTM int8 export failed: {e}")
+            return False
+
+    def _discard_quantized_lstm(self):
+        """Drop an int8 export left from an older LSTM so the new .h5 is served."""
+        self.lstm_session = None
+        int8_path = os.path.join(self.models_dir, 'lstm_int8.onnx')
+        try:
+            os.remove(int8_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"WARNING: Could not remove stale {int8_path}: {e}")
+
+    @staticmethod
+    def _create_onnx_session(path):
+        """Create a single-threaded CPU ONNX Runtime session."""
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = 1
+        return ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+
     def load_models(self):
         """Load trained models from disk."""
         metadata_path = os.path.join(self.models_dir, 'metadata.pkl')
@@ -919,6 +987,15 @@ class AviatorMLModels:
         if os.path.exists(lstm_path) and KERAS_AVAILABLE:
             self.lstm = load_model(lstm_path)
 
+        # Prefer the int8 ONNX export for LSTM inference when present, unless
+        # the .h5 was saved after it (an export from an older LSTM)
+        lstm_int8_path = os.path.join(self.models_dir, 'lstm_int8.onnx')
+        if os.path.exists(lstm_int8_path) and ONNXRUNTIME_AVAILABLE:
+            if os.path.exists(lstm_path) and os.path.getmtime(lstm_int8_path) < os.path.getmtime(lstm_path):
+                print("WARNING: lstm_int8.onnx is older than lstm_model.h5 - using the .h5 model")
+            else:
+                self.lstm_session = self._create_onnx_session(lstm_int8_path)
+
         print(f"[OK] Models loaded from {self.models_dir}/")
         print(f"  Trained on {self.train_samples} samples")
         if self.last_train_date:
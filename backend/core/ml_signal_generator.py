@@ -50,23 +50,22 @@ class MLSignalGenerator:
                 - strategy: str (which position/strategy was used)
                 - target_multiplier: float (for hybrid mode)
         """
-        recent_rounds = self.history_tracker.get_recent_rounds(self.feature_window + 10)
+        recent_mults = self.history_tracker.mults_view(self.feature_window + 10)
 
-        if len(recent_rounds) < self.feature_window:
+        if len(recent_mults) < self.feature_window:
             return {
                 'should_bet': False,
                 'confidence': 0,
                 'prediction': 0,
                 'range': (0, 0),
-                'reason': f'Need {self.feature_window} rounds, have {len(recent_rounds)}',
+                'reason': f'Need {self.feature_window} rounds, have {len(recent_mults)}',
                 'log': 'Insufficient data for signal generation.',
                 'models': [],
                 'strategy': 'none',
                 'target_multiplier': 0
             }
 
-        # Get recent multipliers
-        recent_multipliers = recent_rounds['multiplier'].values.tolist()
+        recent_multipliers = recent_mults.tolist()
 
         if strategy == 'hybrid':
             return self._generate_hybrid_signal(recent_multipliers)
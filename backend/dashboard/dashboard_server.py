@@ -6,9 +6,27 @@ import threading
 import webbrowser
 import heapq
 from collections import deque
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template, jsonify, request
 from flask_socketio import SocketIO
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class _OrjsonCodec:
+    """json-module stand-in so Socket.IO payloads are encoded with orjson."""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
 
 class AviatorDashboard:
     """Real-time web dashboard for bot monitoring."""
@@ -24,7 +42,8 @@ class AviatorDashboard:
         self.bot = bot
         self.port = port
         self.app = Flask(__name__, template_folder='templates')
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        socketio_options = {'json': _OrjsonCodec} if ORJSON_AVAILABLE else {}
+        self.socketio = SocketIO(self.app, cors_allowed_origins="*", **socketio_options)
         self.is_running = False
         self.round_history = deque(maxlen=100)
         # Performance optimization: Use min-heap for efficient top-K tracking
@@ -32,11 +51,20 @@ class AviatorDashboard:
         self._heap_size_limit = 20
         self.low_reds = deque(maxlen=20)  # Track recent low multipliers
         self.high_runs = deque(maxlen=50)  # Track high multiplier runs for graphing
+        self._subscribers = set()  # Socket.IO sids currently connected
         self._setup_routes()
         self._create_dashboard_template()
         
     def _setup_routes(self):
         """Setup Flask routes."""
+        @self.socketio.on('connect')
+        def on_connect():
+            self._subscribers.add(request.sid)
+
+        @self.socketio.on('disconnect')
+        def on_disconnect():
+            self._subscribers.discard(request.sid)
+
         @self.app.route('/')
         def index():
             return render_template('dashboard.html')
@@ -53,7 +81,7 @@ class AviatorDashboard:
         def get_stats():
             profit = self.bot.stats['total_return'] - self.bot.stats['total_bet']
             return jsonify({
-                'stats': self.bot.stats,
+                'stats': self.bot.stats.copy(),
                 'current_stake': self.bot.current_stake,
                 'history': list(self.round_history),
                 'cumulative_profit': profit,
@@ -88,26 +116,35 @@ class AviatorDashboard:
                 print(f"Error getting logs: {e}")
                 return jsonify({'logs': []})
     
-    def emit_round_update(self, round_data):
+    def _record_round(self, round_data):
         """
-        Send round update to dashboard.
-        
+        Add a round to the history, top multipliers and low reds.
+
         Args:
             round_data: Dictionary containing round information
         """
         self.round_history.append(round_data)
-        
+
         # Track highest multipliers
         multiplier = round_data.get('multiplier', 0)
         if multiplier > 0:
             self._update_highest_multipliers(multiplier, round_data.get('timestamp'))
-            
+
             # Track low reds (multipliers < 2.0)
             if multiplier < 2.0:
                 self.low_reds.append({
                     'multiplier': multiplier,
                     'timestamp': round_data.get('timestamp')
                 })
+
+    def emit_round_update(self, round_data):
+        """
+        Send round update to dashboard.
+        
+        Args:
+            round_data: Dictionary containing round information
+        """
+        self._record_round(round_data)
         
         try:
             self.socketio.emit('round_update', round_data)
@@ -121,6 +158,37 @@ class AviatorDashboard:
         except:
             pass
 
+    def emit_round_updates(self, rounds):
+        """
+        Send a batch of round updates to dashboard in a single emit.
+
+        The payload also carries the latest stats, top multipliers and low
+        reds, so no separate stats/section events are needed.
+
+        Args:
+            rounds: List of round data dictionaries, oldest first
+        """
+        for round_data in rounds:
+            self._record_round(round_data)
+
+        # History is still recorded above for /api/stats; skip building the
+        # payload when no page is listening
+        if not self.has_subscribers():
+            return
+
+        try:
+            profit = self.bot.stats['total_return'] - self.bot.stats['total_bet']
+            self.socketio.emit('rounds_update', {
+                'rounds': rounds,
+                'stats': self.bot.stats.copy(),
+                'current_stake': self.bot.current_stake,
+                'cumulative_profit': profit,
+                'highest_multipliers': self._get_top_multipliers(),
+                'low_reds': list(self.low_reds)
+            })
+        except:
+            pass
+
     def _update_highest_multipliers(self, multiplier, timestamp):
         """
         Update the highest multipliers using min-heap (O(log n) instead of O(n log n)).
@@ -153,12 +221,23 @@ class AviatorDashboard:
             for mult, ts in sorted_mults
         ]
     
+    def has_subscribers(self):
+        """
+        Check whether any dashboard page is connected over Socket.IO.
+
+        Returns:
+            bool: True if at least one client is connected
+        """
+        return bool(self._subscribers)
+
     def emit_stats_update(self):
         """Send stats update to dashboard."""
+        if not self.has_subscribers():
+            return
         try:
             profit = self.bot.stats['total_return'] - self.bot.stats['total_bet']
             self.socketio.emit('stats_update', {
-                'stats': self.bot.stats,
+                'stats': self.bot.stats.copy(),
                 'current_stake': self.bot.current_stake,
                 'cumulative_profit': profit
             })
@@ -506,6 +585,12 @@ class AviatorDashboard:
         socket.on('low_reds_update', (data) => {
             updateLowReds(data.low_reds);
         });
+        socket.on('rounds_update', (batch) => {
+            batch.rounds.forEach((data) => addRoundToTable(data));
+            updateStats(batch.stats, batch.current_stake);
+            updateHighestMultipliers(batch.highest_multipliers);
+            updateLowReds(batch.low_reds);
+        });
         function updateStats(stats, currentStake) {
             document.getElementById('rounds-played').textContent = stats.rounds_played;
             document.getElementById('current-stake').textContent = currentStake;
@@ -977,7 +1062,7 @@ class AviatorDashboard:
             });
 
         // Listen for new rounds from socket
-        socket.on('round_update', (data) => {
+        function onRoundUpdate(data) {
             addLogToTable({
                 timestamp: data.timestamp,
                 bet_placed: data.bet_placed || false,
@@ -988,7 +1073,9 @@ class AviatorDashboard:
                 prediction: data.prediction,
                 confidence: data.confidence || 0
             }, true);
-        });
+        }
+        socket.on('round_update', onRoundUpdate);
+        socket.on('rounds_update', (batch) => batch.rounds.forEach(onRoundUpdate));
     </script>
 </body>
 </html>'''
@@ -491,8 +491,10 @@ def integrate_manual_history_with_bot(bot):
         
         # Count existing rounds
         try:
-            with open(loader.csv_file, 'r') as f:
-                existing_count = sum(1 for _ in f) - 1  # Subtract header
+            with open(loader.csv_file, 'rb') as f:
+                existing_count = sum(
+                    chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b'')
+                ) - 1  # Subtract header
             print(f"[STATS] Existing rounds in file: {existing_count}")
         except:
             existing_count = 0
@@ -4,6 +4,8 @@ Mobile Notifier - Send notifications to mobile devices
 
 import requests
 import json
+import threading
+import time
 from datetime import datetime
 
 class MobileNotifier:
@@ -117,4 +119,50 @@ Prediction: {result['prediction_time']} ({result['confidence']}%)
         
         self.send_telegram(message)
         self.send_discord(message)
-        self.send_pushover(message, "Prediction Result")
\ No newline at end of file
+        self.send_pushover(message, "Prediction Result")
+
+class RateLimitedNotifier:
+    """Token-bucket wrapper that drops notifications sent faster than allowed."""
+
+    def __init__(self, notifier, burst=20, per_minute=5):
+        """
+        Args:
+            notifier: MobileNotifier instance to forward to
+            burst: Maximum notifications sent back-to-back
+            per_minute: Sustained notifications allowed per minute
+        """
+        self.notifier = notifier
+        self.capacity = burst
+        self.rate = per_minute / 60.0  # tokens per second
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.dropped_notifications = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        """Take one token if available, refilling by elapsed time first."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            self.dropped_notifications += 1
+            return False
+
+    def notify_high_sequence_prediction(self, prediction_data):
+        """Send high sequence alert if within the rate limit."""
+        if not self._acquire():
+            return False
+        return self.notifier.notify_high_sequence_prediction(prediction_data)
+
+    def send_validation_result(self, result):
+        """Send validation result if within the rate limit."""
+        if not self._acquire():
+            return False
+        return self.notifier.send_validation_result(result)
+
+    def __getattr__(self, name):
+        # setup_* and send_* calls go straight to the wrapped notifier
+        return getattr(self.notifier, name)
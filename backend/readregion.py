@@ -6,8 +6,16 @@ import re
 import time
 import os
 import csv
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 from utils.betting_helpers import (
     set_stake_verified,
     place_bet_with_verification,
@@ -17,6 +25,7 @@ from utils.betting_helpers import (
     reset_stake
 )
 from utils.data_logger import get_round_logger
+from utils.ocr_utils import GlyphMatcher
 
 # Optional: Set path to tesseract executable if needed
 # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
@@ -191,10 +200,32 @@ class MultiplierReader:
         self.round_start_multiplier = None
         self.round_peak_multiplier = None
 
+        # Set whenever a flight starts or ends (see read_current_multiplier)
+        self.state_changed = threading.Event()
+
+        # OCR cache: frame hash -> extracted text (bounded LRU)
+        self._ocr_cache = OrderedDict()
+        self._ocr_cache_size = 512
+
+        # Digit templates learned from Tesseract reads; used before Tesseract
+        self._glyphs = GlyphMatcher()
+
+        # Reused BGRA capture buffer; capture_region() returns a view into it.
+        # Sized from the first grab, since the configured region may be
+        # stored with a negative height or width
+        self._frame_buf = None
+
         # MSS Context Management - FIX for "unable to auto-find suitable render" error
         self.sct = None
         self._init_capture_context()
 
+        # Background capture (see start_prefetch): the newest frame and when
+        # it was grabbed, published as one tuple so readers need no lock
+        self._prefetch_thread = None
+        self._prefetch_running = False
+        self._prefetch_max_age = 0.1
+        self._latest = None
+
     def _init_capture_context(self):
         """Initialize persistent MSS capture context"""
         try:
@@ -218,7 +249,17 @@ class MultiplierReader:
         return thresh
 
     def capture_region(self):
-        """Capture the multiplier screen region with persistent context"""
+        """
+        Capture the multiplier screen region with persistent context.
+
+        The returned frame is a view into a buffer reused by the next call,
+        so callers that keep a frame across captures must copy it. While
+        prefetching, the newest background frame is returned instead.
+        """
+        latest = self._latest
+        if latest is not None and time.time() - latest[0] <= self._prefetch_max_age:
+            return latest[1]
+
         try:
             # Ensure context is initialized
             if self.sct is None:
@@ -228,14 +269,69 @@ class MultiplierReader:
                 raise Exception("Failed to initialize MSS context")
 
             # Use persistent context instead of "with" statement
-            img = np.array(self.sct.grab(self.region))
-            return img[..., :3]  # Drop alpha channel
+            shot = self.sct.grab(self.region)
+            raw = np.frombuffer(shot.raw, dtype=np.uint8)
+            buf = self._frame_buf
+            if buf is None or buf.shape[:2] != (shot.height, shot.width):
+                self._frame_buf = np.empty((shot.height, shot.width, 4), dtype=np.uint8)
+            np.copyto(self._frame_buf, raw.reshape(self._frame_buf.shape), casting='no')
+            return self._frame_buf[..., :3]  # Drop alpha channel
         except Exception as e:
             print(f"Error capturing screen region: {e}")
             # Attempt to reinitialize context
             self._init_capture_context()
             return None
 
+    def start_prefetch(self, interval=0.02):
+        """
+        Keep grabbing the region on a background thread.
+
+        capture_region() then returns the newest prefetched frame instead of
+        grabbing inline, so the capture cost is paid while the bot is
+        waiting rather than when it polls. Falls back to inline grabs if the
+        prefetched frame goes stale.
+
+        Args:
+            interval: Seconds between background grabs
+        """
+        if self._prefetch_thread is not None:
+            return
+        self._prefetch_max_age = 3 * interval
+        self._prefetch_running = True
+        self._prefetch_thread = threading.Thread(target=self._prefetch_loop, args=(interval,), daemon=True)
+        self._prefetch_thread.start()
+
+    def stop_prefetch(self):
+        """Stop the background capture thread and go back to inline grabs"""
+        self._prefetch_running = False
+        if self._prefetch_thread is not None:
+            self._prefetch_thread.join(timeout=1)
+            self._prefetch_thread = None
+        self._latest = None
+
+    def _prefetch_loop(self, interval):
+        """Grab frames into fresh arrays and publish the newest one"""
+        try:
+            sct = mss.mss()  # MSS handles can't be shared across threads
+        except Exception as e:
+            print(f"⚠️ Frame prefetch disabled: {e}")
+            self._prefetch_running = False
+            return
+
+        try:
+            while self._prefetch_running:
+                try:
+                    shot = sct.grab(self.region)
+                    # Each grab owns its buffer, so the view stays valid
+                    # after the next frame is published
+                    frame = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)[..., :3]
+                    self._latest = (time.time(), frame)
+                except Exception:
+                    pass  # Readers fall back to inline grabs once _latest is stale
+                time.sleep(interval)
+        finally:
+            sct.close()
+
     def __del__(self):
         """Cleanup capture context on object destruction"""
         if self.sct is not None:
@@ -245,9 +341,49 @@ class MultiplierReader:
             except Exception as e:
                 print(f"⚠️ Error closing MSS context: {e}")
     
+    def _frame_hash(self, frame):
+        """
+        Fast hash of the whole frame, used as the OCR cache key.
+
+        Every pixel counts: a subsample can miss the few pixels that tell
+        one digit from another and return a stale cached reading.
+        """
+        pixels = np.ascontiguousarray(frame)
+        if XXHASH_AVAILABLE:
+            digest = xxhash.xxh64_intdigest(pixels)
+        else:
+            digest = hash(pixels.tobytes())
+        return (frame.shape, digest)
+
     def fast_extract_multiplier_or_status(self, frame):
-        """Extract multiplier value or status message from frame"""
+        """
+        Extract multiplier value or status message from frame.
+
+        The game renders faster than we poll, so the same frame is often
+        captured twice in a row. Results are cached by frame hash so
+        identical frames skip Tesseract entirely.
+        """
+        key = self._frame_hash(frame)
+        cached = self._ocr_cache.get(key)
+        if cached is not None:
+            self._ocr_cache.move_to_end(key)
+            return cached
+
+        value = self._ocr_extract(frame)
+
+        self._ocr_cache[key] = value
+        if len(self._ocr_cache) > self._ocr_cache_size:
+            self._ocr_cache.popitem(last=False)
+        return value
+
+    def _ocr_extract(self, frame):
+        """Run Tesseract on a frame and return multiplier text or status"""
         gray = self.preprocess_for_ocr(frame)
+
+        # Fixed-font readout: template matching once the glyphs have been seen
+        text = self._glyphs.match(gray)
+        if text:
+            return text
         
         # Optimized config for speed
         config = r'--psm 7 --oem 3 -c tessedit_char_whitelist=0123456789.xABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
@@ -259,6 +395,7 @@ class MultiplierReader:
         
         # Check if we have a number pattern
         if re.search(r'\d{1,3}(\.\d+)?', raw):
+            self._glyphs.learn(gray, raw)
             return raw
         
         return ""
@@ -327,6 +464,8 @@ class MultiplierReader:
                 self.round_logger.log_round(self.round_peak_multiplier, source='screen')
             
             # Reset state
+            if self.flight_in_progress:
+                self.state_changed.set()
             self.flight_in_progress = False
             self.last_valid_multiplier = None
             self.round_start_multiplier = None
@@ -353,6 +492,7 @@ class MultiplierReader:
                 # Track round stats
                 if not self.flight_in_progress:
                     self.round_start_multiplier = validated
+                    self.state_changed.set()
                 
                 # Update peak multiplier
                 if self.round_peak_multiplier is None or validated > self.round_peak_multiplier:
@@ -393,6 +533,28 @@ class MultiplierReader:
         # Timeout
         return False, self.last_valid_multiplier
     
+    def wait_for_state_change(self, timeout, check_interval=0.03):
+        """
+        Poll the screen until a flight starts/ends or the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to wait
+            check_interval: How often to check (seconds)
+
+        Returns:
+            bool: True if a state transition was observed
+        """
+        self.state_changed.clear()
+        deadline = time.time() + timeout
+
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            self.read_current_multiplier()
+            if self.state_changed.wait(min(check_interval, remaining)):
+                return True
+
     def has_crashed(self):
         """
         Check if flight has crashed (AWAITING state detected).
@@ -14,6 +14,9 @@ class SeasonalAnalyzer:
         self.player_count_history = deque(maxlen=1000)
         self.hourly_stats = defaultdict(list)
         self.daily_stats = defaultdict(list)
+
+        # Recommendation for the current hour: ((date, hour), result)
+        self._recommendation_cache = (None, None)
         
     def capture_player_count(self):
         """Capture current player count (simulated - would need actual detection)."""
@@ -162,11 +165,17 @@ class SeasonalAnalyzer:
         
         return correlations
     
-    def get_current_context(self):
-        """Get current time and player context for decision making."""
+    def get_current_context(self, hour=None, weekday=None):
+        """
+        Get current time and player context for decision making.
+
+        Args:
+            hour: Hour of day (defaults to now)
+            weekday: Day of week, 0=Monday (defaults to now)
+        """
         now = datetime.now()
-        current_hour = now.hour
-        current_weekday = now.weekday()
+        current_hour = now.hour if hour is None else hour
+        current_weekday = now.weekday() if weekday is None else weekday
         
         # Capture current player count
         player_count = self.capture_player_count()
@@ -205,8 +214,34 @@ class SeasonalAnalyzer:
         }
     
     def get_seasonal_recommendation(self):
-        """Get betting recommendation based on seasonal patterns."""
-        context = self.get_current_context()
+        """
+        Get betting recommendation based on seasonal patterns.
+
+        The inputs are calendar features plus hour/day stats over hundreds of
+        rounds, so the result is computed once per clock hour and reused.
+        """
+        now = datetime.now()
+        bucket = (now.date(), now.hour)
+        cached_bucket, cached = self._recommendation_cache
+        if cached_bucket == bucket:
+            return cached
+
+        recommendation = self._compute_recommendation(now.hour, now.weekday())
+        self._recommendation_cache = (bucket, recommendation)
+        return recommendation
+
+    def _compute_recommendation(self, hour, weekday):
+        """
+        Build the seasonal recommendation for a given hour and weekday.
+
+        Args:
+            hour: Hour of day
+            weekday: Day of week, 0=Monday
+
+        Returns:
+            dict: Context, recommendations, confidence boost and stats
+        """
+        context = self.get_current_context(hour, weekday)
         hourly_stats = self.analyze_hourly_patterns()
         daily_stats = self.analyze_daily_patterns()
         
@@ -3,6 +3,7 @@ CSV Data Cleaning Utility
 Fixes corrupted CSV files with inconsistent column counts
 """
 
+import numpy as np
 import pandas as pd
 import os
 from datetime import datetime
@@ -37,35 +38,44 @@ def clean_csv_file(input_file, output_file=None):
     shutil.copy2(input_file, backup_file)
     print(f"[OK] Backup created")
 
-    # Read file line by line and check column counts
-    expected_columns = None
-    valid_lines = []
-    invalid_lines = []
+    # Count columns for every line at once: commas per line from a running
+    # comma count sampled at line boundaries
+    with open(input_file, 'rb') as f:
+        data = f.read()
+
+    lines = data.split(b'\n')
+    if data.endswith(b'\n'):
+        lines.pop()
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == ord('\n'))
+    starts = np.concatenate(([0], newlines + 1))[:len(lines)]
+    stops = np.concatenate((newlines, [len(buf)]))[:len(lines)]
+    comma_cum = np.concatenate(([0], np.cumsum(buf == ord(','))))
+    col_counts = comma_cum[stops] - comma_cum[starts] + 1
 
-            # Count columns
-            col_count = len(line.split(','))
+    stripped = [line.strip() for line in lines]
+    non_empty = np.fromiter(map(len, stripped), dtype=np.int64, count=len(stripped)) > 0
 
-            # First non-empty line is the header
-            if expected_columns is None:
-                expected_columns = col_count
-                valid_lines.append(line)
-                continue
+    # First non-empty line is the header
+    expected_columns = None
+    valid_rows = np.empty(0, dtype=np.int64)
+    invalid_lines = []
 
-            # Check if line has correct column count
-            if col_count == expected_columns:
-                valid_lines.append(line)
-            else:
-                invalid_lines.append((line_num, col_count, line[:100]))
+    candidates = np.flatnonzero(non_empty)
+    if len(candidates):
+        header_idx = candidates[0]
+        expected_columns = int(col_counts[header_idx])
+        valid = non_empty & (col_counts == expected_columns)
+        valid_rows = np.flatnonzero(valid)
+        invalid_lines = [
+            (int(i) + 1, int(col_counts[i]), stripped[i][:100].decode('utf-8', errors='replace'))
+            for i in np.flatnonzero(non_empty & ~valid)
+        ]
 
     print(f"\n[INFO] Analysis:")
     print(f"   Expected columns: {expected_columns}")
-    print(f"   Valid lines: {len(valid_lines)}")
+    print(f"   Valid lines: {len(valid_rows)}")
     print(f"   Invalid lines: {len(invalid_lines)}")
 
     if expected_columns != 16:
@@ -83,9 +93,13 @@ def clean_csv_file(input_file, output_file=None):
     # Write cleaned data
     output_file = output_file or input_file
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for line in valid_lines:
-            f.write(line + '\n')
+    # Stream valid rows to a temp file, then swap it in atomically
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        for i in valid_rows:
+            f.write(stripped[i])
+            f.write(b'\n')
+    os.replace(tmp_file, output_file)
 
     print(f"\n[OK] Cleaned data written to: {output_file}")
     print(f"[OK] Removed {len(invalid_lines)} invalid rows")
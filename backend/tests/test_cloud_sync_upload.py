@@ -0,0 +1,178 @@
+"""
+Test CloudSync's queued uploads against full and direct syncs, using a fake worksheet
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cloud_sync import CloudSync
+
+HEADER = "timestamp,round_id,multiplier\n"
+
+
+class FakeWorksheet:
+    """Holds sheet rows in memory; also stands in for its spreadsheet."""
+
+    title = "Aviator_Data"
+    id = "fake"
+
+    def __init__(self):
+        self.rows = []
+        self.spreadsheet = self
+
+    def resize(self, rows):
+        self.rows = self.rows[:rows]
+
+    def values_update(self, range_name, params=None, body=None):
+        self.rows = [list(row) for row in body["values"]]
+
+    def append_rows(self, rows, **kwargs):
+        self.rows.extend(list(row) for row in rows)
+
+
+def make_sync(tmp_dir):
+    """CloudSync writing its config and CSV inside tmp_dir."""
+    csv_file = os.path.join(tmp_dir, "rounds.csv")
+    with open(csv_file, "w") as f:
+        f.write(HEADER)
+    sync = CloudSync(csv_file=csv_file)
+    sync.config_file = os.path.join(tmp_dir, "cloud_sync_config.json")
+    sync.config = {}
+    sync.byte_cursor = sync.last_row_count = sync._read_cursor = 0
+    sync.worksheet = FakeWorksheet()
+    sync.flush_window = 0.3
+    return sync
+
+
+def append_csv(sync, start, count):
+    with open(sync.csv_file, "a") as f:
+        for i in range(start, start + count):
+            f.write(f"2026-01-01 00:00:{i:02d},{i},{1 + i / 100:.2f}\n")
+
+
+def csv_rows(sync):
+    with open(sync.csv_file) as f:
+        return [line.rstrip("\n").split(",") for line in f]
+
+
+def start_uploads(sync):
+    thread = threading.Thread(target=sync.upload_loop, daemon=True)
+    thread.start()
+    return thread
+
+
+def stop_uploads(sync, thread):
+    sync._pending.put((None, None, None))
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "Upload loop did not exit"
+
+
+def assert_in_step(sync):
+    """Sheet matches the CSV row for row, and the cursors agree with it."""
+    expected = csv_rows(sync)
+    assert sync.worksheet.rows == expected, f"Sheet has {len(sync.worksheet.rows)} rows, CSV {len(expected)}"
+    assert sync.last_row_count == len(expected) - 1
+    assert sync.byte_cursor == os.path.getsize(sync.csv_file)
+
+
+def test_queued_rows_reach_sheet():
+    """Rows queued after the bootstrap are appended once, in order."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sync = make_sync(tmp_dir)
+        append_csv(sync, 0, 3)
+        sync._queue_new_rows()  # Bootstrap upload
+        assert_in_step(sync)
+
+        thread = start_uploads(sync)
+        append_csv(sync, 3, 2)
+        sync._queue_new_rows()
+        append_csv(sync, 5, 2)
+        sync._queue_new_rows()
+        stop_uploads(sync, thread)
+        assert_in_step(sync)
+    print("[OK] Queued rows appended once")
+
+
+def test_full_sync_discards_batch_in_flight():
+    """A manual sync while the upload thread holds a batch must not duplicate it."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sync = make_sync(tmp_dir)
+        append_csv(sync, 0, 3)
+        sync._queue_new_rows()
+
+        thread = start_uploads(sync)
+        append_csv(sync, 3, 2)
+        sync._queue_new_rows()
+        time.sleep(0.1)  # Upload thread has popped the batch and is waiting
+        assert sync.manual_sync()
+        stop_uploads(sync, thread)
+        assert_in_step(sync)
+    print("[OK] Full sync supersedes the batch in flight")
+
+
+def test_bootstrap_discards_batch_in_flight():
+    """A rewritten CSV is bootstrapped without the old queued rows on top."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sync = make_sync(tmp_dir)
+        append_csv(sync, 0, 5)
+        sync._queue_new_rows()
+
+        thread = start_uploads(sync)
+        append_csv(sync, 5, 2)
+        sync._queue_new_rows()
+        time.sleep(0.1)
+        with open(sync.csv_file, "w") as f:
+            f.write(HEADER)
+        append_csv(sync, 40, 2)  # Shorter than before: cleaned file
+        with sync._api_lock:
+            sync._queue_new_rows()
+        stop_uploads(sync, thread)
+        assert_in_step(sync)
+    print("[OK] Bootstrap supersedes the batch in flight")
+
+
+def test_direct_sync_takes_over_queue():
+    """sync_new_rows_only uploads queued rows itself; the queue does not repeat them."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sync = make_sync(tmp_dir)
+        append_csv(sync, 0, 3)
+        sync._queue_new_rows()
+
+        append_csv(sync, 3, 2)
+        sync._queue_new_rows()  # Queued, not yet uploaded
+        append_csv(sync, 5, 1)
+        assert sync.sync_new_rows_only()
+        assert_in_step(sync)
+
+        thread = start_uploads(sync)
+        stop_uploads(sync, thread)
+        assert_in_step(sync)
+    print("[OK] Direct sync drops the queue it covered")
+
+
+def test_manual_sync_when_up_to_date():
+    """A manual sync rewrites the sheet even with no new rows."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sync = make_sync(tmp_dir)
+        append_csv(sync, 0, 3)
+        sync._queue_new_rows()
+
+        sync.worksheet.rows = sync.worksheet.rows[:2]  # Edited by hand
+        assert sync.manual_sync()
+        assert_in_step(sync)
+    print("[OK] Manual sync forces a full upload")
+
+
+if __name__ == "__main__":
+    test_queued_rows_reach_sheet()
+    test_full_sync_discards_batch_in_flight()
+    test_bootstrap_discards_batch_in_flight()
+    test_direct_sync_takes_over_queue()
+    test_manual_sync_when_up_to_date()
+    print("\nALL CLOUD SYNC UPLOAD TESTS PASSED")
@@ -1,6 +1,12 @@
 """Utility functions and helpers for Aviator Bot."""
 
-from .clipboard_utils import clear_clipboard, read_clipboard, select_and_copy_text
+from .clipboard_utils import (
+    clear_clipboard,
+    read_clipboard,
+    select_and_copy_text,
+    clipboard_sequence_number,
+    wait_for_clipboard_change
+)
 from .betting_helpers import (
     verify_bet_placed,
     verify_bet_is_active,
@@ -14,6 +20,8 @@ __all__ = [
     'clear_clipboard',
     'read_clipboard',
     'select_and_copy_text',
+    'clipboard_sequence_number',
+    'wait_for_clipboard_change',
     'verify_bet_placed',
     'verify_bet_is_active',
     'estimate_multiplier',
@@ -2,10 +2,10 @@
 
 import math
 import time
+from functools import lru_cache
 import numpy as np
 import cv2
 import pyautogui
-import time
 import colorsys
 from statistics import median
 
@@ -84,9 +84,13 @@ def verify_bet_is_active(cashout_coords, detector):
         return False
 
 
+@lru_cache(maxsize=32)
 def estimate_multiplier(elapsed_time):
     """
     Estimate multiplier based on elapsed time.
+
+    Pure function of the delay, and callers pass the same few configured
+    delays, so results are memoized.
     
     Args:
         elapsed_time: Time elapsed in seconds
@@ -0,0 +1,61 @@
+"""Fixed-layout bot statistics counters."""
+
+from dataclasses import asdict, dataclass, fields
+
+
+@dataclass(slots=True)
+class BotStats:
+    """
+    Bot statistics held as plain slot attributes.
+
+    Hot paths update counters directly (``stats.failed_cashouts += 1``).
+    Item access is kept for the dict-style callers (betting helpers,
+    dashboard, console output) and maps onto the same attributes.
+    """
+
+    rounds_played: int = 0
+    rounds_observed: int = 0
+    ml_bets_placed: int = 0
+    successful_cashouts: int = 0
+    failed_cashouts: int = 0
+    ml_skipped: int = 0
+    cancelled_bets: int = 0
+    total_bet: float = 0.0
+    total_return: float = 0.0
+    current_streak: int = 0
+    max_stake_reached: float = 0
+
+    def __getitem__(self, key):
+        if key not in _STAT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in _STAT_KEYS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in _STAT_KEYS
+
+    def __iter__(self):
+        return iter(_STAT_KEYS)
+
+    def get(self, key, default=None):
+        """Return a counter by name, or default if there is no such counter."""
+        return getattr(self, key) if key in _STAT_KEYS else default
+
+    def keys(self):
+        return _STAT_KEYS
+
+    def copy(self):
+        """
+        Materialize the counters as a plain dict.
+
+        Returns:
+            dict: Stat name -> value
+        """
+        return asdict(self)
+
+
+_STAT_KEYS = tuple(f.name for f in fields(BotStats))
@@ -1,27 +1,68 @@
 import pyautogui
-import keyboard
-import time
+import threading
+
+try:
+    import keyboard
+    KEYBOARD_AVAILABLE = True
+except ImportError:
+    KEYBOARD_AVAILABLE = False
+
+CAPTURE_HOTKEY = 'f8'
+
+
+def _wait_for_capture(corner, pressed):
+    """
+    Block until the user asks to capture the current mouse position.
+
+    Uses a global hotkey when the keyboard module is available so the
+    browser can keep focus; otherwise falls back to Enter in the terminal.
+
+    Args:
+        corner: Corner name shown in the prompt
+        pressed: Event set by the hotkey hook (None without keyboard)
+
+    Returns:
+        Tuple (x, y): Mouse position at the moment of capture
+    """
+    if pressed is not None:
+        print(f"   -> Hover mouse, then press {CAPTURE_HOTKEY.upper()} to capture {corner}...")
+        pressed.clear()
+        pressed.wait()
+    else:
+        input("   -> Hover mouse, then press Enter here in the terminal...")
+    return pyautogui.position()
+
 
 def capture_history_region(label="History Bar"):
     """
     Capture top-left and bottom-right coordinates for the history bar region.
     Returns (x, y, width, height).
     """
-    print("\n=== Capture region for:", label, "===")
-    print("\n1) Move your mouse to the **TOP-LEFT** corner of the region")
-    input("   -> Hover mouse, then press Enter here in the terminal...")
-    x1, y1 = pyautogui.position()
-    print(f"   Captured top-left: ({x1}, {y1})")
-
-    time.sleep(0.5)
-    print("\n2) Move your mouse to the **BOTTOM-RIGHT** corner of the region")
-    input("   -> Hover mouse, then press Enter here in the terminal...")
-    x2, y2 = pyautogui.position()
-    print(f"   Captured bottom-right: ({x2}, {y2})")
+    # One hotkey hook for both corners, firing on release: a single press
+    # captures a single corner, so no settle delay is needed in between
+    pressed = None
+    hook = None
+    if KEYBOARD_AVAILABLE:
+        pressed = threading.Event()
+        hook = keyboard.on_release_key(CAPTURE_HOTKEY, lambda e: pressed.set())
+
+    try:
+        print("\n=== Capture region for:", label, "===")
+        print("\n1) Move your mouse to the **TOP-LEFT** corner of the region")
+        x1, y1 = _wait_for_capture("top-left", pressed)
+        print(f"   Captured top-left: ({x1}, {y1})")
+
+        print("\n2) Move your mouse to the **BOTTOM-RIGHT** corner of the region")
+        x2, y2 = _wait_for_capture("bottom-right", pressed)
+        print(f"   Captured bottom-right: ({x2}, {y2})")
+    finally:
+        if hook is not None:
+            keyboard.unhook(hook)
 
     region = (x1, y1, x2 - x1, y2 - y1)
     print(f"\n✅ Region saved: {region}\n")
     return region
 
 
-capture_history_region()
\ No newline at end of file
+if __name__ == '__main__':
+    capture_history_region()
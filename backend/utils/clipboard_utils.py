@@ -87,6 +87,45 @@ def read_clipboard():
         return None
 
 
+def clipboard_sequence_number():
+    """
+    Get a token that changes whenever the clipboard contents change.
+
+    On Windows this is the system clipboard sequence number, which is read
+    without opening the clipboard. Elsewhere it falls back to a hash of the
+    current clipboard text.
+
+    Returns:
+        int or None: Change token, or None if the clipboard can't be read
+    """
+    try:
+        if CLIPBOARD_AVAILABLE and IS_WINDOWS:
+            return win32clipboard.GetClipboardSequenceNumber()
+        return hash(pyperclip.paste())
+    except Exception:
+        return None
+
+
+def wait_for_clipboard_change(previous, timeout=0.2, poll_interval=0.01):
+    """
+    Wait until the clipboard changes from a previously read token.
+
+    Args:
+        previous: Token from clipboard_sequence_number()
+        timeout: Maximum time to wait in seconds
+        poll_interval: Time between checks in seconds
+
+    Returns:
+        bool: True if the clipboard changed before the timeout
+    """
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if clipboard_sequence_number() != previous:
+            return True
+        time.sleep(poll_interval)
+    return False
+
+
 def select_and_copy_text(x1, y1, x2, y2, delay=0.1):
     """
     Select text region and copy to clipboard.
@@ -110,9 +149,10 @@ def select_and_copy_text(x1, y1, x2, y2, delay=0.1):
         pyautogui.mouseUp()
         time.sleep(delay)
         
-        # Copy to clipboard
+        # Copy to clipboard, continuing as soon as the copy lands (at most 0.2s)
+        before = clipboard_sequence_number()
         pyautogui.hotkey('ctrl', 'c')
-        time.sleep(0.2)
+        wait_for_clipboard_change(before, timeout=0.2)
 
         pyautogui.mouseDown()
         pyautogui.mouseUp()
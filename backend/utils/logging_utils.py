@@ -3,9 +3,14 @@ Logging utilities for Aviator Bot.
 Centralized logging functions to keep main logic clean.
 """
 
+import sys
 import time
 from datetime import datetime
 
+# Countdown bars for every fill level, built once
+_BAR_WIDTH = 20
+_BARS = tuple('█' * i + '░' * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
 
 class BotLogger:
     """Centralized logging for bot operations."""
@@ -171,9 +176,9 @@ class BotLogger:
     @staticmethod
     def log_progress_bar(elapsed, delay, remaining, remaining_ms):
         """Log progress bar."""
-        progress = int((elapsed / delay) * 20)
-        bar = '█' * progress + '░' * (20 - progress)
-        print(f"  ⏱️  [{bar}] {remaining:.3f}s ({remaining_ms:.0f}ms)", end='\r')
+        progress = min(max(int((elapsed / delay) * _BAR_WIDTH), 0), _BAR_WIDTH)
+        sys.stdout.write(f"  ⏱️  [{_BARS[progress]}] {remaining:.3f}s ({remaining_ms:.0f}ms)\r")
+        sys.stdout.flush()
 
     @staticmethod
     def log_final_stats(stats):
@@ -1,5 +1,7 @@
 """OCR utility functions for image preprocessing."""
 
+import re
+
 import cv2
 import numpy as np
 from PIL import Image
@@ -64,3 +66,125 @@ def enhance_image_for_text(image_array):
     except Exception as e:
         print(f"Error enhancing image: {e}")
         return image_array
+
+
+class GlyphMatcher:
+    """
+    Read multiplier text (digits, '.', 'x') by matching glyph templates.
+
+    Templates are learned from frames Tesseract has already read: when the
+    number of glyphs in a thresholded frame equals the number of characters
+    Tesseract returned, each glyph becomes (or refines) the template for its
+    character. Matching only starts once every digit and 'x' has a template
+    (a glyph with no template of its own can still score well against a
+    similar one, e.g. 8 against 3); from then on, a frame whose glyphs all
+    match confidently is read without Tesseract.
+    """
+
+    GLYPH_SIZE = (12, 18)  # (width, height) glyphs are resized to
+    REQUIRED_CHARS = frozenset('0123456789x')
+    TEXT_PATTERN = re.compile(r'\d{1,4}\.\d{1,2}x?')
+
+    def __init__(self, min_score=0.9, min_area=2, dot_height_ratio=0.4):
+        """
+        Args:
+            min_score: Minimum normalized correlation for a glyph match
+            min_area: Components smaller than this many pixels are noise
+            dot_height_ratio: Glyphs shorter than this fraction of the tallest are '.'
+        """
+        self.min_score = min_score
+        self.min_area = min_area
+        self.dot_height_ratio = dot_height_ratio
+        self.templates = {}  # char -> unit-norm float32 glyph vector
+
+    def _segment(self, binary):
+        """Split a thresholded image (text = 255) into glyphs ordered left to right."""
+        n, labels, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        glyphs = []
+        for i in range(1, n):
+            x, y, w, h, area = stats[i]
+            if area >= self.min_area:
+                glyphs.append((x, h, binary[y:y + h, x:x + w]))
+        glyphs.sort(key=lambda g: g[0])
+        return glyphs
+
+    def _vector(self, crop):
+        """Resize a glyph and return it as a zero-mean unit-norm vector."""
+        v = cv2.resize(crop, self.GLYPH_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32).ravel()
+        v -= v.mean()
+        norm = np.linalg.norm(v)
+        return v / norm if norm > 0 else v
+
+    def _is_dot(self, h, line_height):
+        return h < self.dot_height_ratio * line_height
+
+    def learn(self, binary, text):
+        """
+        Update templates from a frame whose text Tesseract read.
+
+        Args:
+            binary: Thresholded uint8 image, text pixels 255
+            text: Tesseract output for the frame
+
+        Returns:
+            bool: True if the frame was used
+        """
+        text = text.lower()
+        if not self.TEXT_PATTERN.fullmatch(text):
+            return False
+
+        glyphs = self._segment(binary)
+        if len(glyphs) != len(text):
+            return False
+
+        line_height = max(h for _, h, _ in glyphs)
+        for char, (_, h, crop) in zip(text, glyphs):
+            if (char == '.') != self._is_dot(h, line_height):
+                return False  # Segmentation doesn't line up with the text
+
+        for char, (_, h, crop) in zip(text, glyphs):
+            if char == '.':
+                continue
+            v = self._vector(crop)
+            old = self.templates.get(char)
+            if old is not None:
+                v = 0.8 * old + 0.2 * v
+                v /= np.linalg.norm(v) or 1.0
+            self.templates[char] = v
+        return True
+
+    def match(self, binary):
+        """
+        Read a frame using the learned templates.
+
+        Args:
+            binary: Thresholded uint8 image, text pixels 255
+
+        Returns:
+            str or None: Text like '2.45x', or None if any glyph is uncertain
+            or not every character has been learned yet
+        """
+        if not self.REQUIRED_CHARS.issubset(self.templates):
+            return None
+
+        glyphs = self._segment(binary)
+        if not glyphs:
+            return None
+
+        chars = list(self.templates)
+        bank = np.stack([self.templates[c] for c in chars])
+        line_height = max(h for _, h, _ in glyphs)
+
+        out = []
+        for _, h, crop in glyphs:
+            if self._is_dot(h, line_height):
+                out.append('.')
+                continue
+            scores = bank @ self._vector(crop)
+            best = int(np.argmax(scores))
+            if scores[best] < self.min_score:
+                return None
+            out.append(chars[best])
+
+        text = ''.join(out)
+        return text if self.TEXT_PATTERN.fullmatch(text) else None
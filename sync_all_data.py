@@ -20,7 +20,7 @@ def main():
         return
     
     # Force full sync of all data
-    if sync.sync_to_sheets():
+    if sync.sync_to_sheets(force=True):
         print("✅ All data synced successfully!")
         print(f"📊 View at: {sync.spreadsheet_url}")
     else: